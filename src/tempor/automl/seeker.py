@@ -1,11 +1,19 @@
 """Module containing the interface for, and the implemented hyperparameter seekers."""
 
 import abc
+import concurrent.futures
+import contextlib
 import copy
+import dataclasses
 import functools
+import multiprocessing
+import os
+import tempfile
 import warnings
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union, cast
+from time import time
+from typing import TYPE_CHECKING, Any, Callable, ContextManager, Dict, List, Optional, Tuple, Union, cast
 
+import joblib
 import numpy as np
 import optuna
 import pydantic
@@ -19,6 +27,8 @@ from tempor.data import data_typing
 from tempor.data.dataset import PredictiveDataset, TimeToEventAnalysisDataset
 from tempor.log import logger
 from tempor.methods.core import BasePredictor, Params
+from tempor.methods.pipeline import PipelineBase, prefix_cache
+from tempor.utils import serialization
 
 from ._types import AutoMLCompatibleEstimator, OptimDirection
 from .pipeline_selector import (
@@ -28,7 +38,7 @@ from .pipeline_selector import (
     DEFAULT_TEMPORAL_SCALERS,
     PipelineSelector,
 )
-from .tuner import BaseTuner, OptunaTuner
+from .tuner import BaseTuner, OptunaTuner, get_active_trial, is_warm_start_history
 
 TunerType = Literal[
     "bayesian",
@@ -54,6 +64,18 @@ SupportedMetric = Union[
 ]
 """The type denoting all metrics supported by ``Seeker`` classes"""
 
+MultiFidelityType = Literal[
+    "successive_halving",
+    "hyperband",
+]
+"""Multi-fidelity search mode, in which trials are first evaluated at low fidelity (on a subset of the samples, with
+fewer training epochs), and only the promising ones are promoted to higher fidelities.
+
+Available options:
+  - `"successive_halving"`: Promote trials with `optuna.pruners.SuccessiveHalvingPruner`.
+  - `"hyperband"`: Promote trials with `optuna.pruners.HyperbandPruner`.
+"""
+
 TUNER_OPTUNA_SAMPLER_MAP: Dict[TunerType, Any] = {
     "bayesian": optuna.samplers.TPESampler,
     "random": optuna.samplers.RandomSampler,
@@ -90,11 +112,33 @@ METRIC_DIRECTION_MAP: Dict[SupportedMetric, OptimDirection] = {
 }
 """A map from metric (`SupportedMetric`) to its optimization direction (`OptimDirection`)"""
 
-# TODO: Parallelism support (per-estimator).
+DEFAULT_PREPROCESSING_CACHE_BYTES = 2**30
+"""Default memory budget of the `PipelineSeeker` cache of fitted preprocessing steps (1 GiB)."""
 
 
-def evaluation_callback_dispatch(
-    estimator: Type[BasePredictor],
+def _trial_fold_callback(metric: SupportedMetric) -> Optional[evaluation.FoldCallback]:
+    # Report the running mean of the metric over the cross-validation folds to the active trial (if any) after each
+    # fold, as the trial's intermediate values, and stop the evaluation if the study pruner prunes the trial.
+    trial = get_active_trial()
+    if trial is None:
+        return None
+    fold_scores: List[float] = []
+
+    def report_fold(fold_idx: int, scores: Dict[str, float]) -> None:
+        if metric not in scores:
+            # Failed fold: no score to report. (A placeholder score, like the 0 of the evaluation results, would look
+            # like the best possible value for metrics that are minimized, and so would keep the trial from pruning.)
+            return
+        fold_scores.append(scores[metric])
+        trial.report(float(np.mean(fold_scores)), step=fold_idx)
+        if trial.should_prune():
+            raise optuna.TrialPruned(f"Trial pruned after cross-validation fold {fold_idx}")
+
+    return report_fold
+
+
+def _evaluate_model(
+    model: BasePredictor,
     dataset: PredictiveDataset,
     task_type: PredictiveTaskType,
     metric: SupportedMetric,
@@ -103,41 +147,8 @@ def evaluation_callback_dispatch(
     horizon: Optional[data_typing.TimeIndex],
     raise_exceptions: bool,
     silence_warnings: bool,
-    *args: Any,
-    **kwargs: Any,
+    fold_callback: Optional[evaluation.FoldCallback],
 ) -> float:
-    """Perform evaluation of ``estimator`` (of task type ``task_type``) on ``dataset``, using the appropriate
-    evaluation function from the `tempor.benchmarks.evaluation` module.
-
-    Args:
-        estimator (Type[BasePredictor]):
-            The predictor estimator class to use.
-        dataset (PredictiveDataset):
-            The dataset to use.
-        task_type (PredictiveTaskType):
-            The task type of the predictor.
-        metric (SupportedMetric):
-            The metric to be used for evaluation.
-        n_cv_folds (int):
-            Number of cross-validation folds to use.
-        random_state (int):
-            Random state used for data splitting.
-        horizon (Optional[data_typing.TimeIndex]):
-            The prediction horizon. Applicable to the "time_to_event" task case.
-        raise_exceptions (bool):
-            If set to `True`, if an exception is raised during evaluation, this will be raised and execution will be
-            terminated. Otherwise the exception will be ignored and a dummy value returned.
-        silence_warnings (bool, optional):
-            Whether to silence warnings raised. Defaults to `False`.
-        args (Any):
-            Positional arguments to pass to the estimator constructor.
-        kwargs (Any):
-            Keyword arguments to pass to the estimator constructor.
-
-    Returns:
-        float: The mean evaluation metric across the cross-validation folds.
-    """
-    model = estimator(*args, **kwargs)
     # TODO: Handle missing cases.
     if task_type == "prediction.one_off.classification":
         metrics = evaluation.evaluate_prediction_oneoff_classifier(
@@ -147,6 +158,7 @@ def evaluation_callback_dispatch(
             random_state=random_state,
             raise_exceptions=raise_exceptions,
             silence_warnings=silence_warnings,
+            fold_callback=fold_callback,
         )
     elif task_type == "prediction.one_off.regression":
         metrics = evaluation.evaluate_prediction_oneoff_regressor(
@@ -156,6 +168,7 @@ def evaluation_callback_dispatch(
             random_state=random_state,
             raise_exceptions=raise_exceptions,
             silence_warnings=silence_warnings,
+            fold_callback=fold_callback,
         )
     elif task_type == "prediction.temporal.classification":  # pragma: no cover
         raise NotImplementedError
@@ -176,6 +189,7 @@ def evaluation_callback_dispatch(
             random_state=random_state,
             raise_exceptions=raise_exceptions,
             silence_warnings=silence_warnings,
+            fold_callback=fold_callback,
         )
     elif task_type == "treatments.one_off.classification":  # pragma: no cover
         raise NotImplementedError
@@ -190,6 +204,196 @@ def evaluation_callback_dispatch(
     return metrics.loc[metric, "mean"]  # pyright: ignore
 
 
+def _fidelity_subset(dataset: PredictiveDataset, fraction: float, n_cv_folds: int, random_state: int) -> Any:
+    # A random subset of ``fraction`` of the samples (but enough to cross-validate on), the same for every trial.
+    n_samples = len(dataset)
+    n_subset = min(n_samples, max(int(np.ceil(fraction * n_samples)), 2 * n_cv_folds))
+    if n_subset == n_samples:
+        return dataset
+    permutation = np.random.default_rng(random_state).permutation(n_samples)
+    return dataset[np.sort(permutation[:n_subset])]
+
+
+def _fidelity_estimator_kwargs(estimator: Type[BasePredictor], kwargs: Dict[str, Any], fraction: float) -> Dict:
+    # Scale the number of training epochs (``n_iter``) of the predictor, if it has such a parameter, by ``fraction``.
+    kwargs = copy.deepcopy(kwargs)
+    if isinstance(estimator, type) and issubclass(estimator, PipelineBase):
+        predictor_cls = estimator.plugin_types[-1]
+        plugin_params = kwargs.setdefault("plugin_params", dict())
+        params = plugin_params.setdefault(predictor_cls.name, dict())
+    else:
+        predictor_cls, params = estimator, kwargs
+    defaults = {field.name: field.default for field in dataclasses.fields(predictor_cls.ParamsDefinition)}
+    n_iter = params.get("n_iter", defaults.get("n_iter", None))
+    if isinstance(n_iter, int):
+        params["n_iter"] = max(1, int(round(fraction * n_iter)))
+    return kwargs
+
+
+def evaluation_callback_dispatch(
+    estimator: Type[BasePredictor],
+    dataset: PredictiveDataset,
+    task_type: PredictiveTaskType,
+    metric: SupportedMetric,
+    n_cv_folds: int,
+    random_state: int,
+    horizon: Optional[data_typing.TimeIndex],
+    raise_exceptions: bool,
+    silence_warnings: bool,
+    *args: Any,
+    fidelity_fractions: Optional[List[float]] = None,
+    **kwargs: Any,
+) -> float:
+    """Perform evaluation of ``estimator`` (of task type ``task_type``) on ``dataset``, using the appropriate
+    evaluation function from the `tempor.benchmarks.evaluation` module.
+
+    Args:
+        estimator (Type[BasePredictor]):
+            The predictor estimator class to use.
+        dataset (PredictiveDataset):
+            The dataset to use.
+        task_type (PredictiveTaskType):
+            The task type of the predictor.
+        metric (SupportedMetric):
+            The metric to be used for evaluation.
+        n_cv_folds (int):
+            Number of cross-validation folds to use.
+        random_state (int):
+            Random state used for data splitting.
+        horizon (Optional[data_typing.TimeIndex]):
+            The prediction horizon. Applicable to the "time_to_event" task case.
+        raise_exceptions (bool):
+            If set to `True`, if an exception is raised during evaluation, this will be raised and execution will be
+            terminated. Otherwise the exception will be ignored and a dummy value returned.
+        silence_warnings (bool, optional):
+            Whether to silence warnings raised. Defaults to `False`.
+        args (Any):
+            Positional arguments to pass to the estimator constructor.
+        fidelity_fractions (Optional[List[float]], optional):
+            Increasing fractions of the full budget (ending with ``1.0``), for multi-fidelity evaluation of an
+            `OptunaTuner` trial. At each fidelity, the estimator is evaluated on that fraction of the samples, with
+            that fraction of its training epochs (``n_iter``, if it has such a parameter). The score is reported to
+            the trial at step ``fraction / fidelity_fractions[0]``, and the evaluation stops with `optuna.TrialPruned`
+            if the study pruner decides to prune the trial. If `None`, or if not evaluating a trial, the estimator is
+            only evaluated at full fidelity. Defaults to `None`.
+        kwargs (Any):
+            Keyword arguments to pass to the estimator constructor.
+
+    Note:
+        If called while evaluating an `OptunaTuner` trial (and not in the multi-fidelity case), the running mean of
+        ``metric`` is reported to the trial after each cross-validation fold, and the evaluation raises
+        `optuna.TrialPruned` if the study pruner decides to prune the trial.
+
+    Returns:
+        float: The mean evaluation metric across the cross-validation folds (at full fidelity).
+    """
+    evaluate = functools.partial(
+        _evaluate_model,
+        task_type=task_type,
+        metric=metric,
+        n_cv_folds=n_cv_folds,
+        random_state=random_state,
+        horizon=horizon,
+        raise_exceptions=raise_exceptions,
+        silence_warnings=silence_warnings,
+    )
+
+    trial = get_active_trial()
+    if fidelity_fractions is None or trial is None:
+        return evaluate(estimator(*args, **kwargs), dataset, fold_callback=_trial_fold_callback(metric))
+
+    for fraction in fidelity_fractions[:-1]:
+        score = evaluate(
+            estimator(*args, **_fidelity_estimator_kwargs(estimator, kwargs, fraction)),
+            _fidelity_subset(dataset, fraction, n_cv_folds, random_state),
+            fold_callback=None,
+        )
+        step = int(round(fraction / fidelity_fractions[0]))
+        trial.report(score, step=step)
+        if trial.should_prune():
+            raise optuna.TrialPruned(f"Trial pruned at fidelity {fraction}")
+    score = evaluate(estimator(*args, **kwargs), dataset, fold_callback=None)
+    trial.report(score, step=int(round(1.0 / fidelity_fractions[0])))
+    return score
+
+
+_SEARCH_START_TIME_ATTR = "tempor_search_start_time"
+
+
+@dataclasses.dataclass(frozen=True)
+class _SearchWorkUnit:
+    # A unit of work of the concurrent search: either the baseline trial of one estimator, or a worker which runs
+    # trials of the study of one estimator (on the shared storage) until the study's trial / time budget is used up.
+    estimator_idx: int
+    estimator: AutoMLCompatibleEstimator
+    tuner: OptunaTuner
+    evaluation_callback: Callable
+    override_hp_space: Optional[List[Params]]
+    snapshot: "evaluation._DataSnapshot"
+    baseline: bool
+    reseed_sampler: bool
+    num_iter: int
+    timeout: int
+    search_scope: Callable[[], ContextManager]
+
+
+def _run_search_work_unit(unit: _SearchWorkUnit) -> Optional[float]:
+    with unit.search_scope():
+        return _run_search_work_unit_in_scope(unit)
+
+
+def _run_search_work_unit_in_scope(unit: _SearchWorkUnit) -> Optional[float]:
+    dataset = evaluation._load_data_snapshot(unit.snapshot)  # pylint: disable=protected-access
+
+    if unit.baseline:
+        return unit.evaluation_callback(unit.estimator, copy.deepcopy(dataset))
+
+    tuner = unit.tuner
+    tuner.create_study()  # Loads the study from the shared storage.
+    study = tuner.study
+    if unit.reseed_sampler:
+        # Concurrent workers of the same study must not sample the same sequence of hyperparameters.
+        tuner.sampler.reseed_rng()
+
+    # The time budget of the study starts when its first worker starts.
+    start_time = study.user_attrs.get(_SEARCH_START_TIME_ATTR)
+    if start_time is None:
+        start_time = time()
+        study.set_user_attr(_SEARCH_START_TIME_ATTR, start_time)
+    remaining_time = unit.timeout - (time() - start_time)
+
+    def n_trials_started(study: optuna.Study) -> int:
+        # Includes the trials currently running in other workers, but not the enqueued (warm start) trials which are
+        # yet to run, nor the warm start history trials.
+        return sum(
+            1
+            for t in study.get_trials(deepcopy=False)
+            if t.state != optuna.trial.TrialState.WAITING and not is_warm_start_history(t)
+        )
+
+    if remaining_time <= 0 or n_trials_started(study) >= unit.num_iter:
+        return None
+
+    def stop_at_trial_budget(study: optuna.Study, trial: optuna.trial.FrozenTrial) -> None:
+        if n_trials_started(study) >= unit.num_iter:
+            study.stop()
+
+    tuner.tune(
+        estimator=unit.estimator,
+        dataset=dataset,
+        evaluation_callback=unit.evaluation_callback,
+        override_hp_space=unit.override_hp_space,
+        compute_baseline_score=False,
+        optimize_kwargs=dict(timeout=remaining_time, callbacks=[stop_at_trial_budget]),
+    )
+    return None
+
+
+def _run_serialized_search_work_unit(serialized_unit: bytes) -> Optional[float]:
+    # Work units are serialized with `cloudpickle`, as estimators may be dynamically created classes (pipelines).
+    return _run_search_work_unit(serialization.load(serialized_unit))
+
+
 class BaseSeeker(abc.ABC):
     @pydantic_utils.validate_arguments(config=pydantic.ConfigDict(arbitrary_types_allowed=True))
     def __init__(  # pylint: disable=unused-argument
@@ -215,6 +419,14 @@ class BaseSeeker(abc.ABC):
         custom_tuner: Optional[BaseTuner] = None,
         raise_exceptions: bool = True,
         silence_warnings: bool = False,
+        n_jobs: Optional[int] = None,
+        multi_fidelity: Optional[MultiFidelityType] = None,
+        fidelity_levels: int = 3,
+        fidelity_reduction_factor: int = 3,
+        warm_start_storage: Optional[Union[str, optuna.storages.BaseStorage]] = None,
+        warm_start_study_name: Optional[str] = None,
+        warm_start_n_trials: int = 10,
+        warm_start_sampler_state: bool = False,
         **kwargs: Any,
     ) -> None:
         """The base class for an AutoML Seeker, to be derived from by concrete implementations. Provides an AutoML
@@ -268,6 +480,39 @@ class BaseSeeker(abc.ABC):
             silence_warnings (bool, optional):
                 Whether to silence warnings raised. Some dependencies (e.g. `xgbse`) may circumvent this and raise
                 warnings regardless. Defaults to `False`.
+            n_jobs (Optional[int], optional):
+                If set, run the search concurrently: the trials of all the estimators are run at once, on a pool of
+                ``n_jobs`` worker processes (``-1`` means use all CPUs, as in `joblib`). The studies are then kept in
+                a shared local (SQLite) `optuna` storage, and the trial / time budget of ``num_iter`` / ``timeout``
+                applies to each estimator as in the sequential case. Requires an `OptunaTuner`. If `None`, the
+                estimators are searched one at a time, in process. Defaults to `None`.
+            multi_fidelity (Optional[MultiFidelityType], optional):
+                If set, use a multi-fidelity search: each trial is first evaluated at the lowest fidelity, on a
+                (fixed) random subset of the samples and with a reduced number of training epochs (``n_iter``, for
+                estimators which have it), and is only promoted to the next fidelity if it ranks among the best
+                ``1 / fidelity_reduction_factor`` of the trials at its current fidelity, as decided by the pruner of
+                the given `MultiFidelityType`. Only the trials which complete at full fidelity (all the samples and
+                training epochs) are used for selecting the best estimators. The default tuners' pruner is replaced
+                by the multi-fidelity pruner; a ``custom_tuner``'s own pruner is used as is. Defaults to `None`.
+            fidelity_levels (int, optional):
+                Number of fidelity levels in the multi-fidelity search. The lowest fidelity is
+                ``fidelity_reduction_factor ** -(fidelity_levels - 1)`` of the full budget. Defaults to ``3``.
+            fidelity_reduction_factor (int, optional):
+                The factor by which the budget grows, and the number of trials promoted shrinks, from one fidelity
+                level to the next. Defaults to ``3``.
+            warm_start_storage (Optional[Union[str, optuna.storages.BaseStorage]], optional):
+                If set, warm-start the search from a previous search whose studies were kept in this `optuna` storage
+                (e.g. by a ``custom_tuner`` with a ``study_storage``), such as a search on an earlier extract of the
+                same data. The ``warm_start_n_trials`` best trials of each estimator's previous study are enqueued as
+                the first trials of its study, see `OptunaTuner.warm_start`. Estimators without a previous study are
+                searched from scratch. Requires an `OptunaTuner`. Defaults to `None`.
+            warm_start_study_name (Optional[str], optional):
+                The ``study_name`` of the previous search, if different from ``study_name``. Defaults to `None`.
+            warm_start_n_trials (int, optional):
+                The number of best trials of each previous study to enqueue. Defaults to ``10``.
+            warm_start_sampler_state (bool, optional):
+                Whether to also transfer all the completed trials of each previous study to the sampler, as history
+                which is not part of the search results, see `OptunaTuner.warm_start`. Defaults to `False`.
 
         Raises:
             ValueError: If incompatible / invalid input arguments have been passed.
@@ -291,12 +536,27 @@ class BaseSeeker(abc.ABC):
         self.grid = grid
         self.raise_exceptions = raise_exceptions
         self.silence_warnings = silence_warnings
+        self.n_jobs = n_jobs
+        self.multi_fidelity = multi_fidelity
+        self.fidelity_levels = fidelity_levels
+        self.fidelity_reduction_factor = fidelity_reduction_factor
+        self.warm_start_storage = warm_start_storage
+        self.warm_start_study_name = warm_start_study_name
+        self.warm_start_n_trials = warm_start_n_trials
+        self.warm_start_sampler_state = warm_start_sampler_state
 
         if len(estimator_defs) != len(estimator_names):
             raise ValueError("`estimator_defs` and `estimator_names` must be the same length.")
         self.estimator_names = estimator_names
         self.estimator_defs = estimator_defs
 
+        # Validate multi-fidelity case:
+        if self.multi_fidelity is not None:
+            if self.fidelity_levels < 2:
+                raise ValueError("`fidelity_levels` must be at least 2 in the multi-fidelity search")
+            if self.fidelity_reduction_factor < 2:
+                raise ValueError("`fidelity_reduction_factor` must be at least 2 in the multi-fidelity search")
+
         # Validate "grid" case:
         if self.tuner_type == "grid":
             if self.grid is None:
@@ -319,6 +579,10 @@ class BaseSeeker(abc.ABC):
         if isinstance(custom_tuner, OptunaTuner):
             if isinstance(custom_tuner.sampler, optuna.samplers.GridSampler):
                 raise ValueError("Passing a custom tuner with `optuna.samplers.GridSampler` is not supported")
+        if n_jobs is not None and custom_tuner is not None and not isinstance(custom_tuner, OptunaTuner):
+            raise ValueError(f"Concurrent search (`n_jobs` set) is only supported with {OptunaTuner.__name__}")
+        if warm_start_storage is not None and custom_tuner is not None and not isinstance(custom_tuner, OptunaTuner):
+            raise ValueError(f"Warm-starting the search is only supported with {OptunaTuner.__name__}")
         self.custom_tuner = custom_tuner
 
         self.direction: OptimDirection = METRIC_DIRECTION_MAP[self.metric]
@@ -378,7 +642,7 @@ class BaseSeeker(abc.ABC):
                 # Pruner:
                 with warnings.catch_warnings():
                     warnings.filterwarnings("ignore", category=optuna.exceptions.ExperimentalWarning)
-                    pruner = optuna.pruners.PatientPruner(None, self.tuner_patience)
+                    pruner = self._default_pruner()
                 # Sampler:
                 with warnings.catch_warnings():
                     warnings.filterwarnings("ignore", category=optuna.exceptions.ExperimentalWarning)
@@ -414,43 +678,173 @@ class BaseSeeker(abc.ABC):
                 custom_tuner.create_study()
                 self.tuners.append(custom_tuner)
 
-    def search(self) -> Tuple[List[BasePredictor], List[float]]:
-        """Perform AutoML search.
+            if self.warm_start_storage is not None:
+                self._warm_start_tuner(cast(OptunaTuner, self.tuners[-1]), estimator_name)
 
-        Returns:
-            Tuple[List[BasePredictor], List[float]]:
-                ``(best_estimators, best_scores)``, the best estimators and the corresponding base scores returned.
-        """
+    def _warm_start_tuner(self, tuner: OptunaTuner, estimator_name: str) -> None:
+        source_study_name = f"{self.warm_start_study_name or self.study_name}_{estimator_name}"
+        try:
+            source_study = optuna.load_study(study_name=source_study_name, storage=self.warm_start_storage)
+        except KeyError:
+            logger.info(f"No previous study '{source_study_name}' to warm-start from, searching from scratch.")
+            return
+        tuner.warm_start(
+            source_study, n_trials=self.warm_start_n_trials, transfer_sampler_state=self.warm_start_sampler_state
+        )
+
+    def _fidelity_fractions(self) -> Optional[List[float]]:
+        if self.multi_fidelity is None:
+            return None
+        eta, top_level = self.fidelity_reduction_factor, self.fidelity_levels - 1
+        return [float(eta) ** (level - top_level) for level in range(self.fidelity_levels)]
+
+    def _default_pruner(self) -> optuna.pruners.BasePruner:
+        # In the multi-fidelity case, the trials report their score at each fidelity at the step given by the budget
+        # relative to the lowest fidelity, i.e. at steps 1, eta, eta**2, ..., which are the rungs of these pruners.
+        eta = self.fidelity_reduction_factor
+        if self.multi_fidelity == "successive_halving":
+            return optuna.pruners.SuccessiveHalvingPruner(min_resource=1, reduction_factor=eta)
+        elif self.multi_fidelity == "hyperband":
+            return optuna.pruners.HyperbandPruner(
+                min_resource=1, max_resource=eta ** (self.fidelity_levels - 1), reduction_factor=eta
+            )
+        return optuna.pruners.PatientPruner(None, self.tuner_patience)
+
+    def _search_scope(self) -> Callable[[], ContextManager]:
+        # A (picklable) factory of the context in which trials are evaluated: once for the sequential search, or once
+        # per work unit (in its worker process) for the concurrent search.
+        return contextlib.nullcontext
+
+    def _evaluation_callback(self) -> Callable:
+        return functools.partial(
+            evaluation_callback_dispatch,
+            task_type=self.task_type,
+            metric=self.metric,
+            n_cv_folds=self.num_cv_folds,
+            random_state=self.random_state,
+            horizon=self.horizon,
+            raise_exceptions=self.raise_exceptions,
+            silence_warnings=self.silence_warnings,
+            fidelity_fractions=self._fidelity_fractions(),
+        )
+
+    def _search_sequential(self) -> List[Tuple[List[float], List[Dict]]]:
         search_results: List[Tuple[List[float], List[Dict]]] = []
         for idx, (estimator_name, estimator_cls, tuner) in enumerate(
             zip(self.estimator_names, self.estimators, self.tuners)
         ):
             logger.info(f"Running  search for estimator '{estimator_name}' {idx+1}/{len(self.estimators)}.")
 
-            if estimator_name in self.override_hp_space:
-                override = self.override_hp_space[estimator_name]
-            else:
-                override = None
-
             estimator_results = tuner.tune(
                 estimator=estimator_cls,
                 dataset=self.dataset,
-                evaluation_callback=functools.partial(
-                    evaluation_callback_dispatch,
-                    task_type=self.task_type,
-                    metric=self.metric,
-                    n_cv_folds=self.num_cv_folds,
-                    random_state=self.random_state,
-                    horizon=self.horizon,
-                    raise_exceptions=self.raise_exceptions,
-                    silence_warnings=self.silence_warnings,
-                ),
-                override_hp_space=override,
+                evaluation_callback=self._evaluation_callback(),
+                override_hp_space=self.override_hp_space.get(estimator_name, None),
                 compute_baseline_score=self.compute_baseline_score,
                 # NOTE: The below is OptunaTuner-only kwarg:
                 optimize_kwargs=dict(n_trials=self.num_iter, timeout=self.timeout),
             )
             search_results.append(estimator_results)
+        return search_results
+
+    def _search_concurrent(self) -> List[Tuple[List[float], List[Dict]]]:
+        # Run the trials of all the estimators at once on a pool of worker processes. Each estimator's study lives in
+        # a shared SQLite storage, and is worked on by up to `n_workers` workers, which share the study's budget.
+        n_workers = joblib.effective_n_jobs(self.n_jobs)
+        n_workers_per_study = min(n_workers, self.num_iter)
+        tuners = cast(List[OptunaTuner], self.tuners)
+        baseline_scores: Dict[int, float] = dict()
+
+        with tempfile.TemporaryDirectory() as search_dir:
+            snapshot = evaluation._save_data_snapshot(self.dataset, search_dir)  # pylint: disable=protected-access
+            storage = f"sqlite:///{os.path.join(search_dir, 'search.db')}?timeout=60"
+
+            shared_tuners = []
+            for tuner in tuners:
+                shared_tuner = copy.copy(tuner)
+                shared_tuner.study_storage = storage
+                shared_tuner.study_load_if_exists = True
+                shared_tuner.create_study()
+                shared_tuners.append(shared_tuner)
+            for shared_tuner, estimator_name, estimator_cls in zip(
+                shared_tuners, self.estimator_names, self.estimators
+            ):
+                # Enqueue the warm start trials (if any) once, on the shared study.
+                shared_tuner.apply_warm_start(estimator_cls, self.override_hp_space.get(estimator_name, None))
+
+            units = []
+            for estimator_idx, estimator_cls in enumerate(self.estimators):
+                if self.compute_baseline_score and not isinstance(estimator_cls, PipelineSelector):
+                    units.append((estimator_idx, True, 0))
+            # Interleave the estimators, such that all of them are searched at once.
+            for worker_idx in range(n_workers_per_study):
+                for estimator_idx in range(len(self.estimators)):
+                    units.append((estimator_idx, False, worker_idx))
+
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=n_workers, mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                future_to_unit = {
+                    executor.submit(
+                        _run_serialized_search_work_unit,
+                        serialization.save(
+                            _SearchWorkUnit(
+                                estimator_idx=estimator_idx,
+                                estimator=self.estimators[estimator_idx],
+                                tuner=shared_tuners[estimator_idx],
+                                evaluation_callback=self._evaluation_callback(),
+                                override_hp_space=self.override_hp_space.get(self.estimator_names[estimator_idx], None),
+                                snapshot=snapshot,
+                                baseline=baseline,
+                                reseed_sampler=worker_idx > 0,
+                                num_iter=self.num_iter,
+                                timeout=self.timeout,
+                                search_scope=self._search_scope(),
+                            )
+                        ),
+                    ): (estimator_idx, baseline)
+                    for estimator_idx, baseline, worker_idx in units
+                }
+                try:
+                    for future in concurrent.futures.as_completed(future_to_unit):
+                        score = future.result()
+                        estimator_idx, baseline = future_to_unit[future]
+                        if baseline:
+                            baseline_scores[estimator_idx] = cast(float, score)
+                            logger.info(f"Baseline score for {self.estimator_names[estimator_idx]}: {score}")
+                except BaseException:
+                    for future in future_to_unit:
+                        future.cancel()
+                    raise
+
+            # Copy the finished trials within the budget to the (in-memory) studies of `self.tuners`, so that these
+            # reflect the search as in the sequential case.
+            search_results: List[Tuple[List[float], List[Dict]]] = []
+            for estimator_idx, (tuner, shared_tuner) in enumerate(zip(tuners, shared_tuners)):
+                shared_tuner.create_study()
+                trials = [t for t in shared_tuner.study.get_trials() if not is_warm_start_history(t)]
+                tuner.study.add_trials([t for t in trials[: self.num_iter] if t.state.is_finished()])
+                scores, params = tuner.trial_results()
+                if estimator_idx in baseline_scores:
+                    scores.insert(0, baseline_scores[estimator_idx])
+                    params.insert(0, dict())
+                search_results.append((scores, params))
+
+        return search_results
+
+    def search(self) -> Tuple[List[BasePredictor], List[float]]:
+        """Perform AutoML search.
+
+        Returns:
+            Tuple[List[BasePredictor], List[float]]:
+                ``(best_estimators, best_scores)``, the best estimators and the corresponding base scores returned.
+        """
+        if self.n_jobs is None:
+            with self._search_scope()():
+                search_results = self._search_sequential()
+        else:
+            logger.info(f"Running search for {len(self.estimators)} estimators concurrently.")
+            search_results = self._search_concurrent()
 
         all_estimators = []
         all_scores = []
@@ -507,6 +901,14 @@ class MethodSeeker(BaseSeeker):
         custom_tuner: Optional[BaseTuner] = None,
         raise_exceptions: bool = True,
         silence_warnings: bool = False,
+        n_jobs: Optional[int] = None,
+        multi_fidelity: Optional[MultiFidelityType] = None,
+        fidelity_levels: int = 3,
+        fidelity_reduction_factor: int = 3,
+        warm_start_storage: Optional[Union[str, optuna.storages.BaseStorage]] = None,
+        warm_start_study_name: Optional[str] = None,
+        warm_start_n_trials: int = 10,
+        warm_start_sampler_state: bool = False,
         **kwargs: Any,
     ) -> None:
         """An AutoML seeker which will search the hyperparameter space of each of the predictor estimators defined in
@@ -552,6 +954,22 @@ class MethodSeeker(BaseSeeker):
                 See `~tempor.automl.seeker.BaseSeeker`.
             silence_warnings (bool, optional):
                 See `~tempor.automl.seeker.BaseSeeker`.
+            n_jobs (Optional[int], optional):
+                See `~tempor.automl.seeker.BaseSeeker`.
+            multi_fidelity (Optional[MultiFidelityType], optional):
+                See `~tempor.automl.seeker.BaseSeeker`.
+            fidelity_levels (int, optional):
+                See `~tempor.automl.seeker.BaseSeeker`.
+            fidelity_reduction_factor (int, optional):
+                See `~tempor.automl.seeker.BaseSeeker`.
+            warm_start_storage (Optional[Union[str, optuna.storages.BaseStorage]], optional):
+                See `~tempor.automl.seeker.BaseSeeker`.
+            warm_start_study_name (Optional[str], optional):
+                See `~tempor.automl.seeker.BaseSeeker`.
+            warm_start_n_trials (int, optional):
+                See `~tempor.automl.seeker.BaseSeeker`.
+            warm_start_sampler_state (bool, optional):
+                See `~tempor.automl.seeker.BaseSeeker`.
             kwargs (Any):
                 See `~tempor.automl.seeker.BaseSeeker`.
         """
@@ -578,6 +996,14 @@ class MethodSeeker(BaseSeeker):
             custom_tuner=custom_tuner,
             raise_exceptions=raise_exceptions,
             silence_warnings=silence_warnings,
+            n_jobs=n_jobs,
+            multi_fidelity=multi_fidelity,
+            fidelity_levels=fidelity_levels,
+            fidelity_reduction_factor=fidelity_reduction_factor,
+            warm_start_storage=warm_start_storage,
+            warm_start_study_name=warm_start_study_name,
+            warm_start_n_trials=warm_start_n_trials,
+            warm_start_sampler_state=warm_start_sampler_state,
             **kwargs,
         )
 
@@ -608,6 +1034,7 @@ class PipelineSeeker(BaseSeeker):
         static_scalers: List[str] = DEFAULT_STATIC_SCALERS,
         temporal_imputers: List[str] = DEFAULT_TEMPORAL_IMPUTERS,
         temporal_scalers: List[str] = DEFAULT_TEMPORAL_SCALERS,
+        preprocessing_cache_bytes: Optional[int] = DEFAULT_PREPROCESSING_CACHE_BYTES,
         return_top_k: int = 3,
         num_cv_folds: int = 5,
         num_iter: int = 100,
@@ -622,6 +1049,14 @@ class PipelineSeeker(BaseSeeker):
         custom_tuner: Optional[BaseTuner] = None,
         raise_exceptions: bool = True,
         silence_warnings: bool = False,
+        n_jobs: Optional[int] = None,
+        multi_fidelity: Optional[MultiFidelityType] = None,
+        fidelity_levels: int = 3,
+        fidelity_reduction_factor: int = 3,
+        warm_start_storage: Optional[Union[str, optuna.storages.BaseStorage]] = None,
+        warm_start_study_name: Optional[str] = None,
+        warm_start_n_trials: int = 10,
+        warm_start_sampler_state: bool = False,
         **kwargs: Any,
     ) -> None:
         """An AutoML seeker which will sample pipelines comprised of:
@@ -659,6 +1094,12 @@ class PipelineSeeker(BaseSeeker):
                 A list of candidate temporal imputers. Defaults to `DEFAULT_TEMPORAL_IMPUTERS`.
             temporal_scalers (List[str], optional):
                 A list of candidate temporal scalers. Defaults to `DEFAULT_TEMPORAL_SCALERS`.
+            preprocessing_cache_bytes (Optional[int], optional):
+                Memory budget (bytes) of the cache of fitted preprocessing steps shared by the trials of the search
+                (see `~tempor.methods.pipeline.prefix_cache.PrefixCache`). Pipelines starting with the same
+                imputer/scaler steps (with the same hyperparameters) then fit and apply these once per
+                cross-validation fold, rather than once per trial. In the concurrent search, each work unit has its
+                own cache. If `None`, no caching is done. Defaults to `DEFAULT_PREPROCESSING_CACHE_BYTES`.
             return_top_k (int, optional):
                 See `~tempor.automl.seeker.BaseSeeker`.
             num_cv_folds (int, optional):
@@ -689,6 +1130,22 @@ class PipelineSeeker(BaseSeeker):
                 See `~tempor.automl.seeker.BaseSeeker`.
             silence_warnings (bool, optional):
                 See `~tempor.automl.seeker.BaseSeeker`.
+            n_jobs (Optional[int], optional):
+                See `~tempor.automl.seeker.BaseSeeker`.
+            multi_fidelity (Optional[MultiFidelityType], optional):
+                See `~tempor.automl.seeker.BaseSeeker`.
+            fidelity_levels (int, optional):
+                See `~tempor.automl.seeker.BaseSeeker`.
+            fidelity_reduction_factor (int, optional):
+                See `~tempor.automl.seeker.BaseSeeker`.
+            warm_start_storage (Optional[Union[str, optuna.storages.BaseStorage]], optional):
+                See `~tempor.automl.seeker.BaseSeeker`.
+            warm_start_study_name (Optional[str], optional):
+                See `~tempor.automl.seeker.BaseSeeker`.
+            warm_start_n_trials (int, optional):
+                See `~tempor.automl.seeker.BaseSeeker`.
+            warm_start_sampler_state (bool, optional):
+                See `~tempor.automl.seeker.BaseSeeker`.
             kwargs (Any):
                 See `~tempor.automl.seeker.BaseSeeker`.
         """
@@ -730,6 +1187,8 @@ class PipelineSeeker(BaseSeeker):
         if tuner_type == "grid":
             raise ValueError(f"The 'grid' search method not supported with {self.__class__.__name__}")
 
+        self.preprocessing_cache_bytes = preprocessing_cache_bytes
+
         super().__init__(
             study_name,
             task_type,
@@ -751,9 +1210,22 @@ class PipelineSeeker(BaseSeeker):
             custom_tuner=custom_tuner,
             raise_exceptions=raise_exceptions,
             silence_warnings=silence_warnings,
+            n_jobs=n_jobs,
+            multi_fidelity=multi_fidelity,
+            fidelity_levels=fidelity_levels,
+            fidelity_reduction_factor=fidelity_reduction_factor,
+            warm_start_storage=warm_start_storage,
+            warm_start_study_name=warm_start_study_name,
+            warm_start_n_trials=warm_start_n_trials,
+            warm_start_sampler_state=warm_start_sampler_state,
             **kwargs,
         )
 
+    def _search_scope(self) -> Callable[[], ContextManager]:
+        if self.preprocessing_cache_bytes is None:
+            return super()._search_scope()
+        return functools.partial(prefix_cache.prefix_cache_scope, self.preprocessing_cache_bytes)
+
     def _pipe_human_name(self, predictor_name: str) -> str:
         return f"<Pipeline with {predictor_name}>"
 
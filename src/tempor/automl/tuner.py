@@ -1,8 +1,9 @@
 """Module containing the interface for, and the implemented hyperparameter tuners."""
 
 import abc
+import contextlib
 import copy
-from typing import Any, Dict, List, Optional, Tuple, Type, Union, cast
+from typing import Any, Dict, Generator, List, Optional, Tuple, Type, Union, cast
 
 import optuna
 import pydantic
@@ -13,6 +14,7 @@ from tempor.data.dataset import PredictiveDataset
 from tempor.log import logger
 from tempor.methods.core import Params
 from tempor.methods.core._base_predictor import BasePredictor
+from tempor.methods.core._params import CategoricalParams, FloatParams, IntegerParams
 
 from ._types import AutoMLCompatibleEstimator, OptimDirection
 from .pipeline_selector import PipelineSelector
@@ -22,6 +24,69 @@ from .pipeline_selector import PipelineSelector
 # TODO: Possibly add a repeated parameter pruner.
 # TODO: Support ensembles.
 
+_ACTIVE_TRIAL: Optional[optuna.Trial] = None
+
+WARM_START_HISTORY_ATTR = "tempor_warm_start_history"
+"""The user attribute which marks the trials of a study that were transferred from a previous study as sampler history
+(see `OptunaTuner.warm_start`). These trials were not evaluated in the current study, so are not part of its results.
+"""
+
+
+@contextlib.contextmanager
+def _active_trial_scope(trial: optuna.Trial) -> Generator:
+    global _ACTIVE_TRIAL  # pylint: disable=global-statement
+    previous = _ACTIVE_TRIAL
+    _ACTIVE_TRIAL = trial
+    try:
+        yield
+    finally:
+        _ACTIVE_TRIAL = previous
+
+
+def get_active_trial() -> Optional[optuna.Trial]:
+    """Get the `optuna.Trial` whose evaluation is currently running inside `OptunaTuner.tune`, if any. Evaluation
+    callbacks may use it to report intermediate values (e.g. per cross-validation fold) to the trial, such that the
+    study pruner can stop unpromising trials early, by raising `optuna.TrialPruned`.
+
+    Returns:
+        Optional[optuna.Trial]: The active trial, or `None` if not evaluating a trial.
+    """
+    return _ACTIVE_TRIAL
+
+
+def is_warm_start_history(trial: optuna.trial.FrozenTrial) -> bool:
+    """Whether ``trial`` was transferred from a previous study as sampler history (see `OptunaTuner.warm_start`).
+
+    Args:
+        trial (optuna.trial.FrozenTrial): The trial.
+
+    Returns:
+        bool: Whether the trial is a warm start history trial.
+    """
+    return bool(trial.user_attrs.get(WARM_START_HISTORY_ATTR, False))
+
+
+def _param_distribution(param: Params) -> optuna.distributions.BaseDistribution:
+    if isinstance(param, CategoricalParams):
+        return optuna.distributions.CategoricalDistribution(param.choices)
+    elif isinstance(param, FloatParams):
+        return optuna.distributions.FloatDistribution(param.low, param.high)
+    elif isinstance(param, IntegerParams):
+        return optuna.distributions.IntDistribution(param.low, param.high, step=param.step)
+    else:  # pragma: no cover
+        raise TypeError(f"Unsupported hyperparameter type: {type(param)}")
+
+
+def _param_contains(param: Params, value: Any) -> bool:
+    if isinstance(param, CategoricalParams):
+        return value in param.choices
+    elif isinstance(param, IntegerParams):
+        return isinstance(value, int) and param.low <= value <= param.high and (value - param.low) % param.step == 0
+    elif isinstance(param, FloatParams):
+        return isinstance(value, (int, float)) and param.low <= value <= param.high
+    else:  # pragma: no cover
+        return False
+
 
 @runtime_checkable
 class EvaluationCallback(Protocol):
@@ -136,6 +201,9 @@ class OptunaTuner(BaseTuner):
         self.study_pruner = study_pruner
         self.study_load_if_exists = study_load_if_exists
 
+        self._warm_start_trials: List[optuna.trial.FrozenTrial] = []
+        self._warm_start_history: List[optuna.trial.FrozenTrial] = []
+
         self.create_study()
 
     def create_study(self) -> optuna.Study:
@@ -155,6 +223,100 @@ class OptunaTuner(BaseTuner):
         )
         return self.study
 
+    def warm_start(
+        self,
+        source_study: optuna.Study,
+        n_trials: int = 10,
+        transfer_sampler_state: bool = False,
+    ) -> None:
+        """Warm-start the tuning from a previous study, e.g. a search on an earlier extract of the same data. The
+        ``n_trials`` best completed trials of ``source_study`` are enqueued as the first trials of the next `tune` run,
+        such that the search starts from the previously good hyperparameters rather than from scratch.
+
+        The hyperparameters of the source trials are filtered to the hyperparameter space of the estimator being tuned
+        (hyperparameters not in the space, or with values outside of it, are dropped, and then sampled as usual), so the
+        hyperparameter space may have changed since the source study.
+
+        Args:
+            source_study (optuna.Study):
+                The previous study, e.g. loaded with ``optuna.load_study`` from its storage. Must have the same
+                optimization direction as this tuner.
+            n_trials (int, optional):
+                The number of best trials of ``source_study`` to enqueue. Defaults to ``10``.
+            transfer_sampler_state (bool, optional):
+                If `True`, all the completed trials of ``source_study`` are also added to the study as history for the
+                sampler (e.g. the TPE sampler models the search space based on the trials in the study). These trials
+                are marked with the ``WARM_START_HISTORY_ATTR`` user attribute, and are excluded from the results of
+                the tuning, as they were not evaluated in this study. Defaults to `False`.
+        """
+        if source_study.direction != self.study.direction:
+            raise ValueError(
+                f"Cannot warm-start study '{self.study_name}' ({self.study.direction.name}) from study "
+                f"'{source_study.study_name}' ({source_study.direction.name}) with a different direction"
+            )
+        completed = [
+            t
+            for t in source_study.get_trials(states=[optuna.trial.TrialState.COMPLETE])
+            if not is_warm_start_history(t)
+        ]
+        maximize = self.study.direction == optuna.study.StudyDirection.MAXIMIZE
+        self._warm_start_trials = sorted(completed, key=lambda t: t.values[0], reverse=maximize)[:n_trials]
+        self._warm_start_history = completed if transfer_sampler_state else []
+        logger.info(
+            f"Warm-starting study '{self.study_name}' from {len(self._warm_start_trials)} trials of study "
+            f"'{source_study.study_name}'"
+        )
+
+    def apply_warm_start(
+        self,
+        estimator: AutoMLCompatibleEstimator,
+        override_hp_space: Optional[List[Params]] = None,
+    ) -> None:
+        """Add the pending warm start trials (see `warm_start`) to ``self.study``, filtered to the hyperparameter space
+        of ``estimator``. This is done at the start of `tune`, so only needs to be called directly to prepare the study
+        before it is tuned by other means. Does nothing if there are no pending warm start trials.
+
+        Args:
+            estimator (AutoMLCompatibleEstimator):
+                Estimator class, or `PipelineSelector`, whose hyperparameters will be tuned.
+            override_hp_space (Optional[List[Params]]):
+                The hyperparameter space override, as passed to `tune`. Defaults to `None`.
+        """
+        if not self._warm_start_trials and not self._warm_start_history:
+            return
+
+        if isinstance(estimator, PipelineSelector):
+            hp_space = estimator.hyperparameter_space(override=override_hp_space)
+        else:
+            hp_space = override_hp_space if override_hp_space is not None else estimator.hyperparameter_space()
+        space = {param.name: param for param in hp_space}
+
+        def filter_params(trial: optuna.trial.FrozenTrial) -> Dict[str, Any]:
+            return {k: v for k, v in trial.params.items() if k in space and _param_contains(space[k], v)}
+
+        for trial in self._warm_start_history:
+            params = filter_params(trial)
+            if params:
+                self.study.add_trial(
+                    optuna.trial.create_trial(
+                        params=params,
+                        distributions={k: _param_distribution(space[k]) for k in params},
+                        value=trial.values[0],
+                        user_attrs={WARM_START_HISTORY_ATTR: True},
+                    )
+                )
+        enqueued: List[Dict[str, Any]] = []
+        for trial in self._warm_start_trials:
+            params = filter_params(trial)
+            # NOTE: Not `skip_if_exists`, as the warm start trials should be re-evaluated even if they are also in the
+            # history, but the filtering may have made some of them the same.
+            if params and params not in enqueued:
+                self.study.enqueue_trial(params)
+                enqueued.append(params)
+        logger.info(f"Enqueued {len(enqueued)} warm start trials in study '{self.study_name}'")
+
+        self._warm_start_trials, self._warm_start_history = [], []
+
     def tune(
         self,
         estimator: AutoMLCompatibleEstimator,
@@ -209,6 +371,8 @@ class OptunaTuner(BaseTuner):
         if len(estimator.hyperparameter_space()) == 0:
             return scores, params
 
+        self.apply_warm_start(estimator, override_hp_space)
+
         def objective(trial: optuna.Trial) -> float:
             # Ensure the override variable doesn't get mutated unintentionally by copying.
             override_copy = copy.deepcopy(override_hp_space)
@@ -225,13 +389,40 @@ class OptunaTuner(BaseTuner):
                 name = estimator_for_eval.__name__
 
             logger.info(f"Hyperparameters sampled from {name}:\n{hps}")
-            score = evaluation_callback(estimator_for_eval, copy.deepcopy(dataset), **hps)
+            with _active_trial_scope(trial):
+                score = evaluation_callback(estimator_for_eval, copy.deepcopy(dataset), **hps)
 
             return score
 
         self.study.optimize(objective, **optimize_kwargs)
 
-        for trial_idx, trial_info in enumerate(self.study.get_trials(states=[optuna.trial.TrialState.COMPLETE])):
+        trial_scores, trial_params = self.trial_results()
+        scores.extend(trial_scores)
+        params.extend(trial_params)
+
+        return scores, params
+
+    def trial_results(self, max_trials: Optional[int] = None) -> Tuple[List[float], List[Dict]]:
+        """Get the scores and hyperparameters of the completed trials in ``self.study``. Warm start history trials (see
+        `warm_start`) are excluded.
+
+        Args:
+            max_trials (Optional[int], optional):
+                If set, only consider the first ``max_trials`` trials of the study (by trial number, not counting the
+                warm start history trials). Defaults to `None`.
+
+        Returns:
+            Tuple[List[float], List[Dict]]:
+                ``(scores, params)`` tuple, containing a list of scores for the completed trials and a list of\
+                dictionaries containing the parameters for each corresponding trial.
+        """
+        scores = []
+        params: List[Dict[str, Any]] = []
+        trials = [t for t in self.study.get_trials() if not is_warm_start_history(t)]
+        if max_trials is not None:
+            trials = trials[:max_trials]
+        trials = [t for t in trials if t.state == optuna.trial.TrialState.COMPLETE]
+        for trial_idx, trial_info in enumerate(trials):
             score_trial = trial_info.values[0]
             params_trial = trial_info.params
             logger.trace(f"Got trial {trial_idx}.")
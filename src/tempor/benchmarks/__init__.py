@@ -1,6 +1,7 @@
 from .benchmark import benchmark_models, visualize_benchmark  # noqa: F401
 from .evaluation import (  # noqa: F401
     ClassifierSupportedMetric,
+    FoldCallback,
     OutputMetric,
     RegressionSupportedMetric,
     classifier_supported_metrics,
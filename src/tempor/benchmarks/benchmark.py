@@ -1,5 +1,13 @@
-from typing import Any, Callable, Dict, List, Optional, Tuple
+import concurrent.futures
+import contextlib
+import multiprocessing
+import signal
+import tempfile
+from concurrent.futures.process import BrokenProcessPool
+from time import time
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple
 
+import joblib
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
@@ -7,13 +15,20 @@ import pydantic
 import seaborn as sns
 from packaging.version import Version
 
+import tempor.exc
 from tempor.core import pydantic_utils
 from tempor.core.types import PredictiveTaskType
 from tempor.data import data_typing, dataset
 from tempor.log import logger as log
+from tempor.utils import serialization
 
 from . import evaluation
 
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None  # type: ignore  # Not available on Windows.
+
 
 def print_score(mean: pd.Series, std: pd.Series) -> pd.Series:
     with pd.option_context("mode.chained_assignment", None):  # pyright: ignore
@@ -26,6 +41,215 @@ def print_score(mean: pd.Series, std: pd.Series) -> pd.Series:
     return mean + " +/- " + std
 
 
+@contextlib.contextmanager
+def _work_unit_limits(timeout: Optional[float], memory_limit: Optional[int]) -> Generator:
+    # Applied inside the worker process for the duration of one work unit. The timeout raises a `TimeoutError` in the
+    # worker (via `SIGALRM`), the memory limit caps the worker's address space (so allocations beyond it raise
+    # `MemoryError`). Both then surface as an evaluation error of the work unit. Note that `RLIMIT_AS` counts virtual
+    # address space, not resident memory: libraries that reserve large address ranges upfront (e.g. torch / CUDA) may
+    # fail well below the actual memory use, and failures inside native code may kill the worker instead.
+    if timeout is not None:
+
+        def raise_timeout(*args: Any) -> None:
+            raise TimeoutError(f"Benchmark work unit timed out after {timeout} seconds")
+
+        previous_handler = signal.signal(signal.SIGALRM, raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    if memory_limit is not None:
+        previous_limits = resource.getrlimit(resource.RLIMIT_AS)
+        hard_limit = previous_limits[1]
+        soft_limit = memory_limit if hard_limit == resource.RLIM_INFINITY else min(memory_limit, hard_limit)
+        resource.setrlimit(resource.RLIMIT_AS, (soft_limit, hard_limit))
+    try:
+        yield
+    finally:
+        if timeout is not None:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+        if memory_limit is not None:
+            resource.setrlimit(resource.RLIMIT_AS, previous_limits)
+
+
+def _run_work_unit(
+    testcase_idx: int,
+    fold_idx: int,
+    setup: "evaluation._FoldsSetup",
+    estimator: Any,
+    snapshot: "evaluation._DataSnapshot",
+    seed: int,
+    raise_exceptions: bool,
+    silence_warnings: bool,
+    timeout: Optional[float],
+    memory_limit: Optional[int],
+) -> Tuple[int, int, "evaluation._FoldResult"]:
+    data = evaluation._load_data_snapshot(snapshot)  # pylint: disable=protected-access
+    start = time()
+    try:
+        with _work_unit_limits(timeout, memory_limit):
+            fold_result = evaluation._evaluate_fold_seeded(  # pylint: disable=protected-access
+                setup.fold_func,
+                estimator,
+                data,
+                setup.folds[fold_idx],
+                seed,
+                raise_exceptions,
+                silence_warnings,
+                setup.fold_kwargs,
+            )
+    except (TimeoutError, MemoryError) as e:
+        # Limit exceeded outside of the model fitting and prediction, e.g. while copying the estimator.
+        log.error(f"Evaluation failed: {e}")
+        if raise_exceptions:
+            raise
+        fold_result = (dict(), 1, time() - start)
+    if timeout is not None and fold_result[1] == 0 and fold_result[2] > timeout:
+        # The `TimeoutError` may have been swallowed by exception handling inside the estimator.
+        message = f"Benchmark work unit timed out after {timeout} seconds"
+        log.error(f"Evaluation failed: {message}")
+        if raise_exceptions:
+            raise TimeoutError(message)
+        fold_result = (dict(), 1, fold_result[2])
+    return testcase_idx, fold_idx, fold_result
+
+
+def _run_serialized_work_unit(work_unit: bytes) -> Tuple[int, int, "evaluation._FoldResult"]:
+    # Work units are serialized with `cloudpickle`, as the estimators (e.g. pipelines) are often not plain-picklable.
+    args = serialization.load(work_unit)
+    return _run_work_unit(*args)
+
+
+_WorkUnitKey = Tuple[int, int]
+"""The ``(test case index, fold index)`` of a work unit."""
+
+_MAX_POOL_BREAKS = 2
+"""Number of broken process pools a work unit may be failed by, before it is run on its own."""
+
+
+def _run_work_units_pool(
+    work_units: Dict[_WorkUnitKey, bytes], max_workers: int, raise_exceptions: bool
+) -> Tuple[Dict[_WorkUnitKey, "evaluation._FoldResult"], List[_WorkUnitKey]]:
+    # Run the serialized work units on a new process pool. Return the fold results of the units that completed, and
+    # the units failed by the pool breaking (a worker process died). Other exceptions escaping a work unit are counted
+    # as an evaluation error of that unit, or raised if `raise_exceptions`.
+    results: Dict[_WorkUnitKey, "evaluation._FoldResult"] = dict()
+    broken: List[_WorkUnitKey] = []
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=min(max_workers, len(work_units)), mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        futures = {executor.submit(_run_serialized_work_unit, work_unit): key for key, work_unit in work_units.items()}
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                key = futures[future]
+                try:
+                    _, _, results[key] = future.result()
+                except BrokenProcessPool:
+                    broken.append(key)
+                except Exception as e:  # pylint: disable=broad-except
+                    if raise_exceptions:
+                        raise
+                    log.error(f"Evaluation failed: {e}")
+                    results[key] = (dict(), 1, 0.0)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+    return results, broken
+
+
+def _benchmark_work_units(
+    setup: "evaluation._FoldsSetup",
+    tests: List[Tuple[str, Any]],
+    data: dataset.PredictiveDataset,
+    random_state: int,
+    raise_exceptions: bool,
+    silence_warnings: bool,
+    n_jobs: Optional[int],
+    timeout: Optional[float],
+    memory_limit: Optional[int],
+) -> Dict[str, pd.DataFrame]:
+    # Schedule each (test case, fold) pair as a work unit on a pool of worker processes, and collect the fold results
+    # as they complete. The dataset is shared with the workers through a single snapshot file.
+    n_folds = len(setup.folds)
+    seeds = evaluation._fold_seeds(random_state, n_folds)  # pylint: disable=protected-access
+    fold_results: List[List[Any]] = [[None] * n_folds for _ in tests]
+
+    with tempfile.TemporaryDirectory() as snapshot_dir:
+        snapshot = evaluation._save_data_snapshot(data, snapshot_dir)  # pylint: disable=protected-access
+        work_units = {
+            (testcase_idx, fold_idx): serialization.save(
+                (
+                    testcase_idx,
+                    fold_idx,
+                    setup,
+                    plugin,
+                    snapshot,
+                    seeds[fold_idx],
+                    raise_exceptions,
+                    silence_warnings,
+                    timeout,
+                    memory_limit,
+                )
+            )
+            for testcase_idx, (_, plugin) in enumerate(tests)
+            for fold_idx in range(n_folds)
+        }
+
+        # A worker process that dies (e.g. killed by the OOM killer, or a crash in native code) breaks the whole pool,
+        # failing all of its outstanding work units. These are resubmitted to a new pool. A work unit that was failed
+        # by `_MAX_POOL_BREAKS` broken pools is run on its own, so that only the unit that kills its worker is
+        # counted as an evaluation error.
+        pool_breaks = {key: 0 for key in work_units}
+        pending = list(work_units)
+        while pending:
+            isolated = [key for key in pending if pool_breaks[key] >= _MAX_POOL_BREAKS]
+            pooled = [key for key in pending if pool_breaks[key] < _MAX_POOL_BREAKS]
+            pending = []
+            if pooled:
+                unit_results, broken = _run_work_units_pool(
+                    {key: work_units[key] for key in pooled}, joblib.effective_n_jobs(n_jobs), raise_exceptions
+                )
+                for key, fold_result in unit_results.items():
+                    fold_results[key[0]][key[1]] = fold_result
+                    log.info(f"Test case: {tests[key[0]][0]}, fold {key[1] + 1}/{n_folds} done")
+                if broken:
+                    log.warning(f"A benchmark worker process died, resubmitting {len(broken)} work unit(s)")
+                for key in broken:
+                    pool_breaks[key] += 1
+                    pending.append(key)
+            for key in isolated:
+                unit_results, broken = _run_work_units_pool({key: work_units[key]}, 1, raise_exceptions)
+                if key in broken:
+                    message = f"Benchmark worker process died running test case {tests[key[0]][0]}, fold {key[1]}"
+                    log.error(f"Evaluation failed: {message}")
+                    if raise_exceptions:
+                        raise RuntimeError(message)
+                    fold_results[key[0]][key[1]] = (dict(), 1, 0.0)
+                else:
+                    fold_results[key[0]][key[1]] = unit_results[key]
+                log.info(f"Test case: {tests[key[0]][0]}, fold {key[1] + 1}/{n_folds} done")
+
+    scores = dict()
+    for (testcase, _), testcase_fold_results in zip(tests, fold_results):
+        results = evaluation._collect_fold_results(  # pylint: disable=protected-access
+            setup.metrics, testcase_fold_results
+        )
+        scores[testcase] = evaluation._postprocess_results(results)  # pylint: disable=protected-access
+    return scores
+
+
+def _scores_to_results(scores: pd.DataFrame) -> pd.DataFrame:
+    mean_score = scores["mean"].to_dict()
+    stddev_score = scores["stddev"].to_dict()
+
+    local_scores = {}
+    for key in mean_score:
+        local_scores[key] = {
+            "mean": mean_score[key],
+            "stddev": stddev_score[key],
+        }
+    return pd.DataFrame(local_scores).T
+
+
 @pydantic_utils.validate_arguments(config=pydantic.ConfigDict(arbitrary_types_allowed=True))
 def benchmark_models(
     task_type: PredictiveTaskType,
@@ -36,6 +260,9 @@ def benchmark_models(
     horizons: Optional[data_typing.TimeIndex] = None,
     raise_exceptions: bool = False,
     silence_warnings: bool = True,
+    n_jobs: Optional[int] = None,
+    timeout: Optional[float] = None,
+    memory_limit: Optional[int] = None,
 ) -> Tuple[pd.DataFrame, Dict[str, pd.DataFrame]]:
     """Benchmark the performance of several algorithms.
 
@@ -60,6 +287,23 @@ def benchmark_models(
         silence_warnings (bool, optional):
             Whether to silence warnings raised. Some dependencies (e.g. `xgbse`) may circumvent this and raise warnings
             regardless. Defaults to `True`.
+        n_jobs (Optional[int], optional):
+            Number of worker processes to run the benchmark in (``-1`` for all CPUs). If any of ``n_jobs``,
+            ``timeout``, ``memory_limit`` is set, each ``(test case, cross-validation fold)`` pair is scheduled as a
+            separate work unit on a pool of worker processes, and the results are collected (and logged) as the units
+            complete. Each fold is seeded deterministically from ``random_state``, so the results do not depend on
+            ``n_jobs``. If all are `None`, the test cases are evaluated one after the other in the current process.
+            Defaults to `None`.
+        timeout (Optional[float], optional):
+            Time limit in seconds for each work unit. A unit exceeding it is counted as an evaluation error (or raises,
+            if ``raise_exceptions`` is `True`). Only supported on POSIX systems. Defaults to `None`.
+        memory_limit (Optional[int], optional):
+            Limit in bytes of the address space of the worker process while it runs a work unit. A unit exceeding it
+            is counted as an evaluation error (or raises, if ``raise_exceptions`` is `True`). Note that the limit
+            applies to the virtual address space (``RLIMIT_AS``), not the resident memory, so libraries which reserve
+            large address ranges (e.g. torch with CUDA) may fail well below the actual memory use. A work unit whose
+            worker process dies (e.g. due to the OOM killer) is also counted as an evaluation error. Only supported
+            on POSIX systems. Defaults to `None`.
 
     Returns:
         Tuple[pd.DataFrame, Dict[str, pd.DataFrame]]:
@@ -75,12 +319,17 @@ def benchmark_models(
     results = {}
 
     # TODO: Handle missing cases.
+    setup_kwargs: Dict[str, Any] = dict()
     if task_type == "prediction.one_off.classification":
         evaluator: Callable = evaluation.evaluate_prediction_oneoff_classifier
+        setup_folds: Callable = evaluation._setup_classifier_folds  # pylint: disable=protected-access
     elif task_type == "prediction.one_off.regression":
         evaluator = evaluation.evaluate_prediction_oneoff_regressor
+        setup_folds = evaluation._setup_regressor_folds  # pylint: disable=protected-access
     elif task_type == "time_to_event":
         evaluator = evaluation.evaluate_time_to_event
+        setup_folds = evaluation._setup_time_to_event_folds  # pylint: disable=protected-access
+        setup_kwargs["horizons"] = horizons
     elif task_type == "prediction.temporal.classification":  # pragma: no cover
         raise NotImplementedError
     elif task_type == "prediction.temporal.regression":  # pragma: no cover
@@ -97,29 +346,43 @@ def benchmark_models(
         # Should not reach here, will be caught by Pydantic.
         raise ValueError(f"Unsupported task type: {task_type}")
 
-    for testcase, plugin in tests:
-        log.info(f"Test case: {testcase}")
+    if n_jobs is not None or timeout is not None or memory_limit is not None:
+        if timeout is not None and not hasattr(signal, "SIGALRM"):  # pragma: no cover
+            raise tempor.exc.UnsupportedSetupException("`timeout` is not supported on this platform")
+        if memory_limit is not None and resource is None:  # pragma: no cover
+            raise tempor.exc.UnsupportedSetupException("`memory_limit` is not supported on this platform")
+        if n_splits < 2:
+            raise ValueError("n_splits must be an integer >= 2")
 
-        scores = evaluator(
-            plugin,
-            data=data,
-            n_splits=n_splits,
+        setup = setup_folds(data, n_splits=n_splits, random_state=random_state, **setup_kwargs)
+        testcase_scores = _benchmark_work_units(
+            setup,
+            tests,
+            data,
             random_state=random_state,
-            horizons=horizons,
             raise_exceptions=raise_exceptions,
             silence_warnings=silence_warnings,
+            n_jobs=n_jobs,
+            timeout=timeout,
+            memory_limit=memory_limit,
         )
+        for testcase, _ in tests:
+            results[testcase] = _scores_to_results(testcase_scores[testcase])
 
-        mean_score = scores["mean"].to_dict()
-        stddev_score = scores["stddev"].to_dict()
+    else:
+        for testcase, plugin in tests:
+            log.info(f"Test case: {testcase}")
 
-        local_scores = {}
-        for key in mean_score:
-            local_scores[key] = {
-                "mean": mean_score[key],
-                "stddev": stddev_score[key],
-            }
-        results[testcase] = pd.DataFrame(local_scores).T
+            scores = evaluator(
+                plugin,
+                data=data,
+                n_splits=n_splits,
+                random_state=random_state,
+                horizons=horizons,
+                raise_exceptions=raise_exceptions,
+                silence_warnings=silence_warnings,
+            )
+            results[testcase] = _scores_to_results(scores)
 
     means = []
     for testcase in results:
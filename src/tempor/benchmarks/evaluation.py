@@ -1,20 +1,28 @@
+import collections
 import copy
+import dataclasses
+import hashlib
+import os
+import tempfile
 import warnings
 from time import time
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Sequence, Union, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple, Union, cast
 
+import joblib
 import numpy as np
 import pandas as pd
 import pydantic
 import scipy.stats
 import sklearn.metrics
 import sklearn.model_selection
+from packaging.version import Version
 from typing_extensions import Literal, get_args
 
 from tempor.core import pydantic_utils
 from tempor.data import data_typing, dataset, samples
 from tempor.log import logger
 from tempor.models.utils import enable_reproducibility
+from tempor.utils import serialization
 
 from . import metrics as tempor_metrics
 from . import utils
@@ -167,6 +175,12 @@ time_to_event_supported_metrics = get_args(TimeToEventSupportedMetric)
 output_metrics = get_args(OutputMetric)
 """A tuple of all possible values of :obj:`~tempor.benchmarks.evaluation.OutputMetric`."""
 
+FoldCallback = Callable[[int, Dict[str, float]], None]
+"""Callback called as each cross-validation fold is evaluated, with the fold index and the metric scores of the fold
+(``{metric: score}``, empty if the fold evaluation failed). May raise an exception to stop the evaluation early,
+e.g. `optuna.TrialPruned`.
+"""
+
 
 class _InternalScores(pydantic.BaseModel):
     metrics: Dict[str, np.ndarray] = {}  # np.ndarray expected to be 1D, contain floats.
@@ -218,6 +232,175 @@ def _postprocess_results(results: _InternalScores) -> pd.DataFrame:
     return output
 
 
+_FoldResult = Tuple[Dict[str, float], int, float]
+"""The result of evaluating a single cross-validation fold: ``(scores, error, duration)``."""
+
+_FoldIlocs = Tuple[np.ndarray, np.ndarray]
+"""The ``(train, test)`` sample positions of a single cross-validation fold."""
+
+
+@dataclasses.dataclass(frozen=True)
+class _DataSnapshot:
+    """A dataset written to a file, to be shared with worker processes."""
+
+    path: str
+    """The path of the snapshot file."""
+    digest: str
+    """The SHA-256 hex digest of the snapshot file contents, which identifies the snapshot."""
+
+
+_JOBLIB_RETURNS_GENERATOR = Version(joblib.__version__) >= Version("1.3")
+"""Whether `joblib.Parallel` supports ``return_as="generator"``."""
+
+_SNAPSHOT_CACHE_MAXSIZE = 2
+"""Maximum number of loaded dataset snapshots kept by a (possibly long-lived) worker process."""
+
+_snapshot_cache: "collections.OrderedDict[str, Any]" = collections.OrderedDict()
+"""Least-recently-used cache of loaded dataset snapshots, keyed by `_DataSnapshot.digest`."""
+
+
+def _save_data_snapshot(data: dataset.PredictiveDataset, directory: str) -> _DataSnapshot:
+    path = os.path.join(directory, "data.pkl")
+    buff = serialization.save(data)
+    with open(path, "wb") as f:
+        f.write(buff)
+    return _DataSnapshot(path=path, digest=hashlib.sha256(buff).hexdigest())
+
+
+def _load_data_snapshot(snapshot: _DataSnapshot) -> Any:
+    # Each worker process loads the dataset snapshot once and reuses it for all the folds it evaluates. Workers may
+    # outlive an evaluation (e.g. `joblib`'s reusable executor), so only the most recently used snapshots are kept.
+    data = _snapshot_cache.get(snapshot.digest, None)
+    if data is None:
+        data = serialization.load_from_file(snapshot.path)
+        _snapshot_cache[snapshot.digest] = data
+    _snapshot_cache.move_to_end(snapshot.digest)
+    while len(_snapshot_cache) > _SNAPSHOT_CACHE_MAXSIZE:
+        _snapshot_cache.popitem(last=False)
+    return data
+
+
+def _evaluate_fold_seeded(
+    fold_func: Callable[..., _FoldResult],
+    estimator: Any,
+    data: Union[dataset.PredictiveDataset, _DataSnapshot],
+    fold_ilocs: _FoldIlocs,
+    seed: int,
+    raise_exceptions: bool,
+    silence_warnings: bool,
+    kwargs: Dict[str, Any],
+) -> _FoldResult:
+    with warnings.catch_warnings():
+        if silence_warnings:
+            warnings.simplefilter("ignore")
+        if isinstance(data, _DataSnapshot):
+            data = _load_data_snapshot(data)
+        enable_reproducibility(seed)
+        train_ilocs, test_ilocs = fold_ilocs
+        return fold_func(copy.deepcopy(estimator), data[train_ilocs], data[test_ilocs], raise_exceptions, **kwargs)
+
+
+@dataclasses.dataclass(frozen=True)
+class _FoldsSetup:
+    """The cross-validation folds of an evaluation, and how to evaluate each fold."""
+
+    fold_func: Callable[..., _FoldResult]
+    """Evaluates a fold: ``fold_func(model, train_data, test_data, raise_exceptions, **fold_kwargs)``."""
+    metrics: Tuple[str, ...]
+    """The metrics reported by ``fold_func``."""
+    folds: List[_FoldIlocs]
+    """The ``(train, test)`` sample positions of each fold."""
+    fold_kwargs: Dict[str, Any] = dataclasses.field(default_factory=dict)
+    """Additional keyword arguments for ``fold_func``."""
+
+
+def _fold_seeds(random_state: int, n_folds: int) -> List[int]:
+    return [int(seed) for seed in np.random.SeedSequence(random_state).generate_state(n_folds)]
+
+
+def _evaluate_folds(
+    setup: _FoldsSetup,
+    estimator: Any,
+    data: dataset.PredictiveDataset,
+    *,
+    random_state: int,
+    n_jobs: Optional[int],
+    raise_exceptions: bool,
+    silence_warnings: bool,
+    fold_callback: Optional[FoldCallback] = None,
+) -> List[_FoldResult]:
+    """Evaluate each of the folds in ``setup`` and return the fold results in fold order.
+
+    If ``n_jobs`` is `None`, the folds are evaluated one after the other in this process, sharing the random state
+    set up by the caller. Otherwise, each fold is seeded from ``random_state`` and its index, so that the results do
+    not depend on ``n_jobs``. For ``n_jobs != 1``, the folds are evaluated in a ``joblib`` process pool: the dataset
+    is written to a snapshot file once, and each worker loads it once, rather than it being pickled for every fold.
+
+    ``fold_callback`` is called after each fold, in fold order. In the process pool case, it is called as the result
+    of each fold becomes available, and the folds not yet evaluated are cancelled if it raises (requires
+    ``joblib>=1.3``, otherwise it is called once all the folds are done).
+    """
+    fold_func, folds, kwargs = setup.fold_func, setup.folds, setup.fold_kwargs
+    seeds = _fold_seeds(random_state, len(folds))
+
+    if n_jobs is None or n_jobs == 1:
+        fold_results: List[_FoldResult] = []
+        for fold_idx, fold in enumerate(folds):
+            if n_jobs is None:
+                train_ilocs, test_ilocs = fold
+                fold_result = fold_func(
+                    copy.deepcopy(estimator), data[train_ilocs], data[test_ilocs], raise_exceptions, **kwargs
+                )
+            else:
+                fold_result = _evaluate_fold_seeded(
+                    fold_func, estimator, data, fold, seeds[fold_idx], raise_exceptions, silence_warnings, kwargs
+                )
+            fold_results.append(fold_result)
+            if fold_callback is not None:
+                fold_callback(fold_idx, fold_result[0])
+        return fold_results
+
+    with tempfile.TemporaryDirectory() as snapshot_dir:
+        snapshot = _save_data_snapshot(data, snapshot_dir)
+        tasks = (
+            joblib.delayed(_evaluate_fold_seeded)(
+                fold_func, estimator, snapshot, fold, seed, raise_exceptions, silence_warnings, kwargs
+            )
+            for fold, seed in zip(folds, seeds)
+        )
+        if not _JOBLIB_RETURNS_GENERATOR:  # pragma: no cover
+            fold_results = joblib.Parallel(n_jobs=n_jobs)(tasks)
+            if fold_callback is not None:
+                for fold_idx, fold_result in enumerate(fold_results):
+                    fold_callback(fold_idx, fold_result[0])
+            return fold_results
+
+        # Collect the fold results in fold order as they become available, so that `fold_callback` can stop the
+        # evaluation early: closing the generator cancels the folds that have not been evaluated yet.
+        results_gen = joblib.Parallel(n_jobs=n_jobs, return_as="generator")(tasks)
+        fold_results = []
+        try:
+            for fold_idx, fold_result in enumerate(results_gen):
+                fold_results.append(fold_result)
+                if fold_callback is not None:
+                    fold_callback(fold_idx, fold_result[0])
+        finally:
+            results_gen.close()  # pyright: ignore
+    return fold_results
+
+
+def _collect_fold_results(metrics: Sequence[str], fold_results: List[_FoldResult]) -> _InternalScores:
+    results = _InternalScores()
+    for metric in metrics:
+        results.metrics[metric] = np.zeros(len(fold_results))
+    for indx, (scores, error, duration) in enumerate(fold_results):
+        for metric, value in scores.items():
+            results.metrics[metric][indx] = value
+        results.errors.append(error)
+        results.durations.append(duration)
+    return results
+
+
 class ClassifierMetrics:
     @pydantic_utils.validate_arguments
     def __init__(
@@ -334,6 +517,47 @@ class ClassifierMetrics:
         return utils.evaluate_auc_multiclass(y_test, y_pred_proba)[1]
 
 
+def _evaluate_classifier_fold(
+    model: "BaseOneOffClassifier",
+    train_data: dataset.PredictiveDataset,
+    test_data: dataset.PredictiveDataset,
+    raise_exceptions: bool,
+) -> _FoldResult:
+    evaluator = ClassifierMetrics()
+    scores: Dict[str, float] = dict()
+    error = 0
+    start = time()
+    try:
+        model.fit(train_data)
+
+        if TYPE_CHECKING:  # pragma: no cover
+            assert test_data.predictive.targets is not None  # nosec B101
+        test_labels = test_data.predictive.targets.numpy()
+        preds = model.predict_proba(test_data).numpy()
+
+        scores = evaluator.score_proba(test_labels, preds)
+    except BaseException as e:  # pylint: disable=broad-except
+        logger.error(f"Evaluation failed: {e}")
+        error = 1
+        if raise_exceptions:
+            raise
+
+    return scores, error, time() - start
+
+
+def _setup_classifier_folds(data: dataset.PredictiveDataset, n_splits: int, random_state: int) -> _FoldsSetup:
+    splitter = sklearn.model_selection.StratifiedKFold(n_splits=n_splits, shuffle=True, random_state=random_state)
+
+    if data.predictive.targets is None:
+        raise ValueError("The dataset for evaluation needs to contain targets but did not")
+    labels = data.predictive.targets.numpy().squeeze()
+    if len(labels.shape) > 1:
+        raise ValueError("Classifier evaluation expects 1D output")
+
+    folds = list(splitter.split(X=list(range(len(data))), y=labels))
+    return _FoldsSetup(_evaluate_classifier_fold, classifier_supported_metrics, folds)
+
+
 @pydantic_utils.validate_arguments(config=pydantic.ConfigDict(arbitrary_types_allowed=True))
 def evaluate_prediction_oneoff_classifier(  # pylint: disable=unused-argument
     estimator: Any,
@@ -342,6 +566,8 @@ def evaluate_prediction_oneoff_classifier(  # pylint: disable=unused-argument
     random_state: int = 0,
     raise_exceptions: bool = False,
     silence_warnings: bool = False,
+    n_jobs: Optional[int] = None,
+    fold_callback: Optional[FoldCallback] = None,
     **kwargs: Any,
 ) -> pd.DataFrame:
     """Helper for evaluating classifiers.
@@ -361,6 +587,15 @@ def evaluate_prediction_oneoff_classifier(  # pylint: disable=unused-argument
             dataframe. Defaults to `False`.
         silence_warnings (bool, optional):
             Whether to silence warnings raised. Defaults to `False`.
+        n_jobs (Optional[int], optional):
+            Number of processes to evaluate the cross-validation folds in (``-1`` for all CPUs). If `None`, the folds
+            are evaluated sequentially in the current process. If set, each fold is seeded deterministically from
+            ``random_state`` and the fold index, so the results are the same for any value of ``n_jobs``.
+            Defaults to `None`.
+        fold_callback (Optional[FoldCallback], optional):
+            If set, called with the fold index and the fold's metric scores as each cross-validation fold is
+            evaluated, e.g. to report intermediate results to a hyperparameter tuner. See
+            :obj:`~tempor.benchmarks.evaluation.FoldCallback`. Defaults to `None`.
 
     Returns:
         pd.DataFrame:
@@ -382,47 +617,57 @@ def evaluate_prediction_oneoff_classifier(  # pylint: disable=unused-argument
         estimator_ = cast("BaseOneOffClassifier", estimator)
         enable_reproducibility(random_state)
 
-        results = _InternalScores()
-        evaluator = ClassifierMetrics()
-        for metric in classifier_supported_metrics:
-            results.metrics[metric] = np.zeros(n_splits)
-
-        splitter = sklearn.model_selection.StratifiedKFold(n_splits=n_splits, shuffle=True, random_state=random_state)
-
-        if data.predictive.targets is None:
-            raise ValueError("The dataset for evaluation needs to contain targets but did not")
-        labels = data.predictive.targets.numpy().squeeze()
-        if len(labels.shape) > 1:
-            raise ValueError("Classifier evaluation expects 1D output")
-
-        indx = 0
-        for train_data, test_data in data.split(splitter=splitter, y=labels):
-            model = copy.deepcopy(estimator_)
-            start = time()
-            try:
-                model.fit(train_data)
-
-                if TYPE_CHECKING:  # pragma: no cover
-                    assert test_data.predictive.targets is not None  # nosec B101
-                test_labels = test_data.predictive.targets.numpy()
-                preds = model.predict_proba(test_data).numpy()
-
-                scores = evaluator.score_proba(test_labels, preds)
-                for metric in scores:
-                    results.metrics[metric][indx] = scores[metric]
-                results.errors.append(0)
-            except BaseException as e:  # pylint: disable=broad-except
-                logger.error(f"Evaluation failed: {e}")
-                results.errors.append(1)
-                if raise_exceptions:
-                    raise
-
-            results.durations.append(time() - start)
-            indx += 1
+        setup = _setup_classifier_folds(data, n_splits=n_splits, random_state=random_state)
+        fold_results = _evaluate_folds(
+            setup,
+            estimator_,
+            data,
+            random_state=random_state,
+            n_jobs=n_jobs,
+            raise_exceptions=raise_exceptions,
+            silence_warnings=silence_warnings,
+            fold_callback=fold_callback,
+        )
+        results = _collect_fold_results(setup.metrics, fold_results)
 
     return _postprocess_results(results)
 
 
+def _evaluate_regressor_fold(
+    model: "BaseOneOffRegressor",
+    train_data: dataset.PredictiveDataset,
+    test_data: dataset.PredictiveDataset,
+    raise_exceptions: bool,
+) -> _FoldResult:
+    scores: Dict[str, float] = dict()
+    error = 0
+    start = time()
+    try:
+        model.fit(train_data)
+
+        if TYPE_CHECKING:  # pragma: no cover
+            assert test_data.predictive.targets is not None  # nosec B101
+        targets = test_data.predictive.targets.numpy().squeeze()
+        preds = model.predict(test_data).numpy().squeeze()
+
+        scores["mse"] = sklearn.metrics.mean_squared_error(targets, preds)
+        scores["mae"] = sklearn.metrics.mean_absolute_error(targets, preds)
+        scores["r2"] = sklearn.metrics.r2_score(targets, preds)
+    except BaseException as e:  # pylint: disable=broad-except
+        logger.error(f"Regression evaluation failed: {e}")
+        error = 1
+        if raise_exceptions:
+            raise
+
+    return scores, error, time() - start
+
+
+def _setup_regressor_folds(data: dataset.PredictiveDataset, n_splits: int, random_state: int) -> _FoldsSetup:
+    splitter = sklearn.model_selection.KFold(n_splits=n_splits, shuffle=True, random_state=random_state)
+    folds = list(splitter.split(X=list(range(len(data)))))
+    return _FoldsSetup(_evaluate_regressor_fold, regression_supported_metrics, folds)
+
+
 @pydantic_utils.validate_arguments(config=pydantic.ConfigDict(arbitrary_types_allowed=True))
 def evaluate_prediction_oneoff_regressor(  # pylint: disable=unused-argument
     estimator: Any,
@@ -431,6 +676,8 @@ def evaluate_prediction_oneoff_regressor(  # pylint: disable=unused-argument
     random_state: int = 0,
     raise_exceptions: bool = False,
     silence_warnings: bool = False,
+    n_jobs: Optional[int] = None,
+    fold_callback: Optional[FoldCallback] = None,
     **kwargs: Any,
 ) -> pd.DataFrame:
     """Helper for evaluating regression tasks.
@@ -450,6 +697,15 @@ def evaluate_prediction_oneoff_regressor(  # pylint: disable=unused-argument
             dataframe. Defaults to `False`.
         silence_warnings (bool, optional):
             Whether to silence warnings raised. Defaults to `False`.
+        n_jobs (Optional[int], optional):
+            Number of processes to evaluate the cross-validation folds in (``-1`` for all CPUs). If `None`, the folds
+            are evaluated sequentially in the current process. If set, each fold is seeded deterministically from
+            ``random_state`` and the fold index, so the results are the same for any value of ``n_jobs``.
+            Defaults to `None`.
+        fold_callback (Optional[FoldCallback], optional):
+            If set, called with the fold index and the fold's metric scores as each cross-validation fold is
+            evaluated, e.g. to report intermediate results to a hyperparameter tuner. See
+            :obj:`~tempor.benchmarks.evaluation.FoldCallback`. Defaults to `None`.
 
     Returns:
         pd.DataFrame:
@@ -470,38 +726,19 @@ def evaluate_prediction_oneoff_regressor(  # pylint: disable=unused-argument
             raise ValueError("n_splits must be an integer >= 2")
         estimator_ = cast("BaseOneOffRegressor", estimator)
         enable_reproducibility(random_state)
-        metrics = regression_supported_metrics
-
-        results = _InternalScores()
-        for metric in metrics:
-            results.metrics[metric] = np.zeros(n_splits)
-
-        splitter = sklearn.model_selection.KFold(n_splits=n_splits, shuffle=True, random_state=random_state)
-
-        indx = 0
-        for train_data, test_data in data.split(splitter=splitter):
-            model = copy.deepcopy(estimator_)
-            start = time()
-            try:
-                model.fit(train_data)
-
-                if TYPE_CHECKING:  # pragma: no cover
-                    assert test_data.predictive.targets is not None  # nosec B101
-                targets = test_data.predictive.targets.numpy().squeeze()
-                preds = model.predict(test_data).numpy().squeeze()
-
-                results.metrics["mse"][indx] = sklearn.metrics.mean_squared_error(targets, preds)
-                results.metrics["mae"][indx] = sklearn.metrics.mean_absolute_error(targets, preds)
-                results.metrics["r2"][indx] = sklearn.metrics.r2_score(targets, preds)
-                results.errors.append(0)
-            except BaseException as e:  # pylint: disable=broad-except
-                logger.error(f"Regression evaluation failed: {e}")
-                results.errors.append(1)
-                if raise_exceptions:
-                    raise
-
-            results.durations.append(time() - start)
-            indx += 1
+
+        setup = _setup_regressor_folds(data, n_splits=n_splits, random_state=random_state)
+        fold_results = _evaluate_folds(
+            setup,
+            estimator_,
+            data,
+            random_state=random_state,
+            n_jobs=n_jobs,
+            raise_exceptions=raise_exceptions,
+            silence_warnings=silence_warnings,
+            fold_callback=fold_callback,
+        )
+        results = _collect_fold_results(setup.metrics, fold_results)
 
     return _postprocess_results(results)
 
@@ -584,6 +821,53 @@ def _compute_time_to_event_metric(
     return avg_metric
 
 
+def _evaluate_time_to_event_fold(
+    model: "BaseTimeToEventAnalysis",
+    train_data: dataset.TimeToEventAnalysisDataset,
+    test_data: dataset.TimeToEventAnalysisDataset,
+    raise_exceptions: bool,
+    horizons: data_typing.TimeIndex,
+) -> _FoldResult:
+    metrics_map = {
+        "c_index": compute_c_index,
+        "brier_score": compute_brier_score,
+    }
+    scores: Dict[str, float] = dict()
+    error = 0
+    start = time()
+    try:
+        model.fit(train_data)
+
+        # targets = test_data.predictive.targets.numpy().squeeze()
+        preds = model.predict(test_data, horizons=horizons)
+
+        for metric_name in time_to_event_supported_metrics:
+            metric_func = metrics_map[metric_name]
+            scores[metric_name] = _compute_time_to_event_metric(
+                metric_func,
+                train_data=train_data,
+                test_data=test_data,
+                horizons=horizons,
+                predictions=preds,
+            )
+
+    except BaseException as e:  # pylint: disable=broad-except
+        logger.error(f"Regression evaluation failed: {e}")
+        error = 1
+        if raise_exceptions:
+            raise
+
+    return scores, error, time() - start
+
+
+def _setup_time_to_event_folds(
+    data: dataset.PredictiveDataset, n_splits: int, random_state: int, horizons: data_typing.TimeIndex
+) -> _FoldsSetup:
+    splitter = sklearn.model_selection.KFold(n_splits=n_splits, shuffle=True, random_state=random_state)
+    folds = list(splitter.split(X=list(range(len(data)))))
+    return _FoldsSetup(_evaluate_time_to_event_fold, time_to_event_supported_metrics, folds, dict(horizons=horizons))
+
+
 @pydantic_utils.validate_arguments(config=pydantic.ConfigDict(arbitrary_types_allowed=True))
 def evaluate_time_to_event(  # pylint: disable=unused-argument
     estimator: Any,
@@ -593,6 +877,8 @@ def evaluate_time_to_event(  # pylint: disable=unused-argument
     random_state: int = 0,
     raise_exceptions: bool = False,
     silence_warnings: bool = False,
+    n_jobs: Optional[int] = None,
+    fold_callback: Optional[FoldCallback] = None,
     **kwargs: Any,
 ) -> pd.DataFrame:
     """Helper for evaluating time-to-event tasks.
@@ -614,6 +900,15 @@ def evaluate_time_to_event(  # pylint: disable=unused-argument
             dataframe. Defaults to `False`.
         silence_warnings (bool, optional):
             Whether to silence warnings raised. Defaults to `False`.
+        n_jobs (Optional[int], optional):
+            Number of processes to evaluate the cross-validation folds in (``-1`` for all CPUs). If `None`, the folds
+            are evaluated sequentially in the current process. If set, each fold is seeded deterministically from
+            ``random_state`` and the fold index, so the results are the same for any value of ``n_jobs``.
+            Defaults to `None`.
+        fold_callback (Optional[FoldCallback], optional):
+            If set, called with the fold index and the fold's metric scores as each cross-validation fold is
+            evaluated, e.g. to report intermediate results to a hyperparameter tuner. See
+            :obj:`~tempor.benchmarks.evaluation.FoldCallback`. Defaults to `None`.
 
     Returns:
         pd.DataFrame:
@@ -634,47 +929,18 @@ def evaluate_time_to_event(  # pylint: disable=unused-argument
             raise ValueError("n_splits must be an integer >= 2")
         estimator_ = cast("BaseTimeToEventAnalysis", estimator)
         enable_reproducibility(random_state)
-        metrics = time_to_event_supported_metrics
-        metrics_map = {
-            "c_index": compute_c_index,
-            "brier_score": compute_brier_score,
-        }
-
-        results = _InternalScores()
-        for metric in metrics:
-            results.metrics[metric] = np.zeros(n_splits)
-
-        splitter = sklearn.model_selection.KFold(n_splits=n_splits, shuffle=True, random_state=random_state)
-
-        indx = 0
-        for train_data, test_data in data.split(splitter=splitter):
-            model = copy.deepcopy(estimator_)
-            start = time()
-            try:
-                model.fit(train_data)
-
-                # targets = test_data.predictive.targets.numpy().squeeze()
-                preds = model.predict(test_data, horizons=horizons)
-
-                for metric_name in time_to_event_supported_metrics:
-                    metric_func = metrics_map[metric_name]
-                    results.metrics[metric_name][indx] = _compute_time_to_event_metric(
-                        metric_func,
-                        train_data=train_data,
-                        test_data=test_data,
-                        horizons=horizons,
-                        predictions=preds,
-                    )
-
-                results.errors.append(0)
-
-            except BaseException as e:  # pylint: disable=broad-except
-                logger.error(f"Regression evaluation failed: {e}")
-                results.errors.append(1)
-                if raise_exceptions:
-                    raise
-
-            results.durations.append(time() - start)
-            indx += 1
+
+        setup = _setup_time_to_event_folds(data, n_splits=n_splits, random_state=random_state, horizons=horizons)
+        fold_results = _evaluate_folds(
+            setup,
+            estimator_,
+            data,
+            random_state=random_state,
+            n_jobs=n_jobs,
+            raise_exceptions=raise_exceptions,
+            silence_warnings=silence_warnings,
+            fold_callback=fold_callback,
+        )
+        results = _collect_fold_results(setup.metrics, fold_results)
 
     return _postprocess_results(results)
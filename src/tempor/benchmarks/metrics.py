@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional, Tuple, Union
+from typing import Any, Optional, Tuple, Union
 
 import numpy as np
 import sklearn
@@ -451,34 +451,38 @@ class CensoringDistributionEstimator(SurvivalFunctionEstimator):
         return weights
 
 
-def _get_comparable(
-    event_indicator: np.ndarray, event_time: np.ndarray, order: np.ndarray
-) -> Tuple[Dict[int, np.ndarray], int]:
-    n_samples = len(event_time)
-    tied_time: int = 0
-    comparable: Dict[int, np.ndarray] = dict()
-    i = 0
-    while i < n_samples - 1:
-        time_i = event_time[order[i]]
-        start = i + 1
-        end = start
-        while end < n_samples and event_time[order[end]] == time_i:
-            end += 1
-
-        # check for tied event times
-        event_at_same_time = event_indicator[order[i:end]]
-        censored_at_same_time = ~event_at_same_time
-        for j in range(i, end):
-            if event_indicator[order[j]]:
-                mask = np.zeros(n_samples, dtype=bool)
-                mask[end:] = True
-                # an event is comparable to censored samples at same time point
-                mask[i:end] = censored_at_same_time
-                comparable[j] = mask
-                tied_time += censored_at_same_time.sum()
-        i = end
-
-    return comparable, tied_time
+def _count_preceding_less(ranks: np.ndarray, cutoffs: np.ndarray, thresholds: np.ndarray) -> np.ndarray:
+    """For each query ``q``, count the elements among the first ``cutoffs[q]`` elements of ``ranks`` whose rank is less
+    than ``thresholds[q]``.
+
+    A prefix ``[0, cutoff)`` is the union of the blocks of a Fenwick tree (binary indexed tree) over the positions: one
+    block of ``2 ** level`` positions for each bit ``level`` set in ``cutoff``. Rather than inserting and querying the
+    elements one at a time, the tree is evaluated level by level: the ranks are sorted within the blocks of the level
+    (keyed by ``block * stride + rank``), and the queries which use a block of the level are all answered with one
+    ``np.searchsorted``. This takes ``O(n log^2 n)`` time, in vectorized operations, and ``O(n)`` memory.
+
+    Args:
+        ranks (np.ndarray): The ``int64`` ranks of the elements, in order.
+        cutoffs (np.ndarray): The ``int64`` length of the prefix of each query.
+        thresholds (np.ndarray): The ``int64`` rank threshold of each query.
+
+    Returns:
+        np.ndarray: The count of each query.
+    """
+    n_elements = len(ranks)
+    stride = max(int(ranks.max(initial=0)), int(thresholds.max(initial=0))) + 1
+    positions = np.arange(n_elements, dtype=np.int64)
+    counts = np.zeros(len(cutoffs), dtype=np.int64)
+    level = 0
+    while (1 << level) <= n_elements:
+        uses_level = ((cutoffs >> level) & 1).astype(bool)
+        if uses_level.any():
+            keys = np.sort((positions >> level) * stride + ranks)
+            # The block of this level in the prefix, preceded by ``block`` full blocks of ``2 ** level`` elements.
+            block = (cutoffs[uses_level] >> level) - 1
+            counts[uses_level] += np.searchsorted(keys, block * stride + thresholds[uses_level]) - (block << level)
+        level += 1
+    return counts
 
 
 def _estimate_concordance_index(
@@ -488,40 +492,42 @@ def _estimate_concordance_index(
     weights: np.ndarray,
     tied_tol: float = 1e-8,
 ) -> Tuple[float, int, int, int, int]:
-    order = np.argsort(event_time)
-
-    comparable, tied_time = _get_comparable(event_indicator, event_time, order)
-
-    if len(comparable) == 0:
+    # A sample with an event is comparable to the samples with a later time, and to the censored samples at the same
+    # time. Ordered by decreasing time, and censored samples first among tied times, the samples comparable to an
+    # event are those before the first event at its time. The concordant and tied pairs are then counted with
+    # prefix rank queries on the estimates, see `_count_preceding_less`, in O(n log^2 n) rather than O(n^2).
+    event_indicator = np.asarray(event_indicator, dtype=bool)
+    order = np.lexsort((event_indicator, -np.asarray(event_time)))
+    event_s, time_s, estimate_s = event_indicator[order], np.asarray(event_time)[order], estimate[order]
+
+    group_start = np.flatnonzero(np.r_[True, time_s[1:] != time_s[:-1]])
+    group_sizes = np.diff(np.r_[group_start, len(order)])
+    # An event alone at the latest time is not compared to any sample.
+    lone_latest_event = len(order) > 0 and event_s[0] and group_sizes[0] == 1
+    if event_s.sum() - int(lone_latest_event) == 0:
         raise ValueError("Data has no comparable pairs, cannot estimate concordance index.")
 
-    concordant = 0
-    discordant = 0
-    tied_risk = 0
-    numerator = 0.0
-    denominator = 0.0
-    for ind, mask in comparable.items():
-        est_i = estimate[order[ind]]
-        event_i = event_indicator[order[ind]]
-        w_i = weights[order[ind]]
-
-        est = estimate[order[mask]]
+    n_censored_at_time = np.repeat(np.add.reduceat(~event_s, group_start), group_sizes)[event_s]
+    comparable = np.repeat(group_start, group_sizes)[event_s] + n_censored_at_time
 
-        if not event_i:  # pragma: no cover
-            raise RuntimeError("got censored sample at index %d, but expected uncensored" % order[ind])
+    # An event should have a higher score. Scores within ``tied_tol`` of each other are tied.
+    unique_estimates = np.unique(estimate_s)
+    ranks = np.searchsorted(unique_estimates, estimate_s)
+    estimate_i = estimate_s[event_s]
+    lower = np.searchsorted(unique_estimates, estimate_i - tied_tol, side="left")
+    upper = np.searchsorted(unique_estimates, estimate_i + tied_tol, side="right")
+    n_events = len(estimate_i)
+    counts = _count_preceding_less(ranks, np.r_[comparable, comparable], np.r_[lower, upper])
+    n_con, n_ties = counts[:n_events], counts[n_events:] - counts[:n_events]
 
-        ties = np.absolute(est - est_i) <= tied_tol
-        n_ties = ties.sum()
-        # an event should have a higher score
-        con = est < est_i
-        n_con = con[~ties].sum()
+    w_i = weights[order][event_s]
+    numerator = np.sum(w_i * n_con + 0.5 * w_i * n_ties)
+    denominator = np.sum(w_i * comparable)
 
-        numerator += w_i * n_con + 0.5 * w_i * n_ties
-        denominator += w_i * mask.sum()
-
-        tied_risk += n_ties
-        concordant += n_con
-        discordant += est.size - n_con - n_ties
+    concordant = int(n_con.sum())
+    tied_risk = int(n_ties.sum())
+    discordant = int(comparable.sum()) - concordant - tied_risk
+    tied_time = int(n_censored_at_time.sum())
 
     cindex = numerator / denominator
     return cindex, concordant, discordant, tied_risk, tied_time
@@ -656,6 +662,50 @@ def brier_score(
     return times, brier_scores
 
 
+def concordance_index_censored(
+    event_indicator: Any,
+    event_time: Any,
+    estimate: Any,
+    tied_tol: float = 1e-8,
+) -> Tuple[float, int, int, int, int]:
+    """Harrell's concordance index for right-censored data.
+
+    The concordance index is the fraction of comparable pairs of samples whose predictions are ordered like their
+    survival times: a sample with an event should have a higher estimated risk than a sample that survives longer.
+    A pair is comparable if the sample with the shorter time experienced an event (or, for tied times, if one sample
+    experienced an event and the other was censored). Pairs with tied estimated risks count as half concordant.
+
+    Note that this estimator is biased when the amount of censoring is high, see :func:`concordance_index_ipcw` for an
+    alternative. The pairs are counted in ``O(n log^2 n)`` time, so this can be used with large test sets.
+
+    Args:
+        event_indicator:
+            Array-like of `bool`, ``shape = (n_samples,)``. Whether each sample experienced an event.
+        event_time:
+            Array-like, ``shape = (n_samples,)``. Time of event or time of censoring.
+        estimate:
+            Array-like, ``shape = (n_samples,)``. Estimated risk of experiencing an event.
+        tied_tol (float, optional):
+            The tolerance value for considering ties. If the absolute difference between risk scores is smaller or
+            equal than ``tied_tol``, risk scores are considered tied. Defaults to ``1e-8``.
+
+    Returns:
+        Tuple[float, int, int, int, int]:
+            Tuple like ``(cindex, concordant, discordant, tied_risk, tied_time)``, see :func:`concordance_index_ipcw`.
+
+    References:
+        [1] Harrell, F. E., Califf, R. M., Pryor, D. B., Lee, K. L., & Rosati, R. A. (1982). "Evaluating the yield of
+        medical tests". Journal of the American Medical Association, 247(18), 2543-2546.
+    """
+    event_indicator, event_time = check_y_survival(  # pylint: disable=unbalanced-tuple-unpacking
+        event_indicator, event_time
+    )
+    estimate_arr = _check_estimate_1d(estimate, event_time)
+    w = np.ones_like(estimate_arr)
+
+    return _estimate_concordance_index(event_indicator, event_time, estimate_arr, w, tied_tol)
+
+
 def concordance_index_ipcw(
     survival_train: np.ndarray,
     survival_test: np.ndarray,
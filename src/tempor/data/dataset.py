@@ -1,6 +1,7 @@
 # pylint: disable=unnecessary-ellipsis
 
 import abc
+import copy
 import dataclasses
 from typing import Any, ClassVar, Generator, Optional, Tuple, Union
 
@@ -175,21 +176,24 @@ class BaseDataset(abc.ABC):
         return self.time_series.num_samples
 
     def __getitem__(self, key: data_typing.GetItemKey) -> Self:
+        """Select samples by integer position. The returned dataset holds lazy views (see
+        :meth:`~tempor.data.samples.DataSamples.view`) of the data samples of this dataset, so no data is copied
+        until it is accessed. As the components of this dataset have already been validated together, the dataset
+        is not re-validated.
+        """
         key_ = utils.ensure_pd_iloc_key_returns_df(key)
-        new_dataset = self.__class__(
-            time_series=self.time_series[key_].dataframe(),  # pyright: ignore
-            static=self.static[key_].dataframe() if self.has_static else None,  # type: ignore[union-attr,index]
-            targets=(
-                self.predictive.targets[key_].dataframe()  # type: ignore[union-attr]
-                if (self.has_predictive_data and self.predictive.targets is not None)  # type: ignore[union-attr]
-                else None
-            ),
-            treatments=(
-                self.predictive.treatments[key_].dataframe()  # type: ignore[union-attr]
-                if (self.has_predictive_data and self.predictive.treatments is not None)  # type: ignore[union-attr]
-                else None
-            ),
-        )
+        new_dataset = copy.copy(self)
+        new_dataset._time_series = self.time_series.view(key_)
+        new_dataset._static = self.static.view(key_) if self.static is not None else None
+        if self.predictive is not None:
+            new_predictive = copy.copy(self.predictive)
+            new_predictive.parent_dataset = new_dataset  # type: ignore [assignment]
+            # pylint: disable=protected-access
+            if self.predictive.targets is not None:
+                new_predictive._targets = self.predictive.targets.view(key_)
+            if self.predictive.treatments is not None:
+                new_predictive._treatments = self.predictive.treatments.view(key_)
+            new_dataset.predictive = new_predictive
         return new_dataset
 
     def train_test_split(
@@ -1,4 +1,19 @@
-from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, NoReturn, Optional, Tuple, Type, Union, cast
+import collections
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    NoReturn,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 import numpy as np
 import pandas as pd
@@ -230,6 +245,21 @@ class UnionDtype(pd_engine.DataType):
         raise NotImplementedError(f"`coerce` not supported by {self.__class__.__name__}")
 
 
+def dtype_satisfies(dtype: Any, union_dtype: Any) -> bool:
+    """Return whether ``dtype`` (a `numpy` or `pandas` dtype) satisfies ``union_dtype`` (a :class:`UnionDtype`).
+    Only the dtype itself is checked, not the data, so this is suitable for non-`object` dtypes.
+    """
+    return bool(pd_engine.Engine.dtype(union_dtype).check(pd_engine.Engine.dtype(dtype)))
+
+
+def validate_index(index: pd.Index, *, dtype: Any, name: str, nullable: bool) -> None:
+    """Validate a standalone ``index`` (`pandas.Index`) against ``dtype`` and ``nullable``, in the same way as the
+    index of a dataframe is validated by a schema set up with :func:`set_up_index`. Raises
+    `pandera.errors.SchemaError` on failure.
+    """
+    pa.SeriesSchema(dtype, name=name, nullable=nullable, coerce=False).validate(pd.Series(index, name=name, copy=False))
+
+
 def init_schema(data: pd.DataFrame, **kwargs: Any) -> pa.DataFrameSchema:
     schema = cast(pa.DataFrameSchema, pa.infer_schema(data))
     schema = update_schema(schema, **kwargs)
@@ -348,6 +378,64 @@ def set_up_2level_multiindex(
     return schema, data
 
 
+def compile_schema(schema: pa.DataFrameSchema) -> pa.DataFrameSchema:
+    """Return a data-independent version of ``schema`` which is safe to reuse for other dataframes of the same
+    structure: the non-regex columns (inferred by :func:`init_schema` from the specific data, e.g. their nullability)
+    are removed, while dataframe-level checks, regex column checks and the index schema are kept.
+    """
+    inferred_columns = [name for name, column in schema.columns.items() if not column.regex]
+    schema_out = schema.remove_columns(inferred_columns)
+    if TYPE_CHECKING:  # pragma: no cover
+        assert isinstance(schema_out, pa.DataFrameSchema)  # nosec B101
+    return schema_out
+
+
+def schema_cache_key(data: pd.DataFrame, *extra: Hashable) -> Tuple:
+    """Get a `SchemaCache` key for ``data``, made up of its columns, column dtypes, and index dtypes, as well as any
+    ``extra`` hashable items (e.g. the kind of data samples).
+    """
+    index = data.index
+    index_dtypes = tuple(str(dt) for dt in index.dtypes) if isinstance(index, pd.MultiIndex) else (str(index.dtype),)
+    return (
+        *extra,
+        tuple(data.columns),
+        tuple(str(dt) for dt in data.dtypes),
+        index.nlevels,
+        data.columns.nlevels,
+        index_dtypes,
+    )
+
+
+class SchemaCache:
+    def __init__(self, maxsize: int = 128) -> None:
+        """A least-recently-used cache of compiled `pandera.DataFrameSchema` s (see :func:`compile_schema`), keyed by
+        :func:`schema_cache_key`.
+
+        Args:
+            maxsize (int, optional): Maximum number of schemas to keep. Defaults to ``128``.
+        """
+        self.maxsize = maxsize
+        self._cache: "collections.OrderedDict[Tuple, pa.DataFrameSchema]" = collections.OrderedDict()
+
+    def get(self, key: Tuple) -> Optional[pa.DataFrameSchema]:
+        schema = self._cache.get(key, None)
+        if schema is not None:
+            self._cache.move_to_end(key)
+        return schema
+
+    def put(self, key: Tuple, schema: pa.DataFrameSchema) -> None:
+        self._cache[key] = schema
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
 class checks:
     """Namespace containing reusable `pandera.Check` s."""
 
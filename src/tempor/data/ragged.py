@@ -0,0 +1,262 @@
+"""Array-backed ("ragged", CSR-style) storage for time series data samples.
+
+The data of all samples is kept in one contiguous 2D values buffer with dimensions ``(row, feature)``, where the rows
+of each sample are stored consecutively. A ``(num_samples + 1,)`` array of ``int64`` offsets delimits the rows of each
+sample, and a flat time index holds the timestep of each row.
+"""
+
+from typing import Any, Generator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from . import data_typing, pandera_utils, utils
+from .settings import DATA_SETTINGS
+
+
+def _row_positions(offsets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # Get the (sample position, time position) of each row, given the offsets.
+    lengths = np.diff(offsets)
+    sample_pos = np.repeat(np.arange(len(lengths), dtype=np.int64), lengths)
+    time_pos = np.arange(offsets[-1] - offsets[0], dtype=np.int64) - np.repeat(offsets[:-1] - offsets[0], lengths)
+    return sample_pos, time_pos
+
+
+def _gather_rows(offsets: np.ndarray, positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # Get the row indices of the samples at ``positions``, and the offsets of the gathered samples.
+    lengths = np.diff(offsets)[positions]
+    new_offsets = np.zeros(len(positions) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=new_offsets[1:])
+    rows = np.arange(new_offsets[-1], dtype=np.int64) + np.repeat(offsets[positions] - new_offsets[:-1], lengths)
+    return rows, new_offsets
+
+
+class RaggedTimeSeries:
+    values: np.ndarray
+    offsets: np.ndarray
+    time_index: pd.Index
+    sample_index: pd.Index
+    feature_index: pd.Index
+    dtypes: Optional[pd.Series]
+
+    def __init__(
+        self,
+        values: np.ndarray,
+        *,
+        offsets: np.ndarray,
+        time_index: Any,
+        sample_index: Any,
+        feature_index: Any,
+        dtypes: Optional[pd.Series] = None,
+    ) -> None:
+        """Array-backed storage of time series data samples.
+
+        Args:
+            values (np.ndarray):
+                2D values buffer with dimensions ``(row, feature)``, rows of each sample stored consecutively.
+            offsets (np.ndarray):
+                1D ``int64`` array of shape ``(num_samples + 1,)``, the rows of sample ``i`` are
+                ``values[offsets[i]:offsets[i + 1]]``. Offsets must start at ``0`` and end at the number of rows.
+            time_index (Any):
+                Flat time index, the timestep of each row. Will be converted to `pandas.Index`.
+            sample_index (Any):
+                The sample index, of length ``num_samples``. Will be converted to `pandas.Index`.
+            feature_index (Any):
+                The feature index, of length ``num_features``. Will be converted to `pandas.Index`.
+            dtypes (pd.Series, optional):
+                Per-feature dtypes to restore when converting to a `pandas.DataFrame` (the values buffer has a
+                single dtype). If `None`, the dtype of the values buffer is kept. Defaults to `None`.
+        """
+        self.values = values
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.time_index = pd.Index(time_index)
+        self.sample_index = pd.Index(sample_index)
+        self.feature_index = pd.Index(feature_index)
+        self.dtypes = dtypes
+
+    def validate(self) -> None:
+        """Validate the consistency of the storage arrays, and the index and values dtypes as per `DATA_SETTINGS`.
+        Raises `ValueError`, `TypeError` or `pandera.errors.SchemaError` on failure.
+        """
+        if self.values.ndim != 2:
+            raise ValueError(utils.EXCEPTION_MESSAGES.expected_array2d)
+        if self.offsets.ndim != 1 or len(self.offsets) != len(self.sample_index) + 1:
+            raise ValueError("Expected `offsets` to be a 1d array of length `num_samples + 1`")
+        if self.offsets[0] != 0 or self.offsets[-1] != self.values.shape[0] or (np.diff(self.offsets) < 0).any():
+            raise ValueError("Expected `offsets` to be non-decreasing, starting at 0 and ending at the number of rows")
+        if len(self.time_index) != self.values.shape[0]:
+            raise ValueError("Expected `time_index` to have the same length as the number of rows of `values`")
+        if len(self.feature_index) != self.values.shape[1]:
+            raise ValueError("Expected `feature_index` to have the same length as the number of columns of `values`")
+        if not self.sample_index.is_unique:
+            raise ValueError(f"Sample index `{DATA_SETTINGS.sample_index_name}` not unique")
+        if self.time_index.hasnans:
+            raise ValueError(f"Time index `{DATA_SETTINGS.time_index_name}` must not contain null values")
+        sample_pos, _ = _row_positions(self.offsets)
+        if not pd.MultiIndex.from_arrays([sample_pos, self.time_index]).is_unique:
+            raise ValueError(
+                f"Time index `{DATA_SETTINGS.time_index_name}` not unique within sample "
+                f"`{DATA_SETTINGS.sample_index_name}`"
+            )
+        if not all(isinstance(f, str) for f in self.feature_index):
+            raise TypeError("Expected feature index to contain `str` elements only")
+
+        # Mirror the index and values dtype checks of the dataframe storage schema.
+        pandera_utils.validate_index(
+            self.sample_index,
+            dtype=pandera_utils.UnionDtype[DATA_SETTINGS.sample_index_dtypes],  # type: ignore
+            name=DATA_SETTINGS.sample_index_name,
+            nullable=DATA_SETTINGS.sample_index_nullable,
+        )
+        pandera_utils.validate_index(
+            self.time_index,
+            dtype=pandera_utils.UnionDtype[DATA_SETTINGS.time_index_dtypes],  # type: ignore
+            name=DATA_SETTINGS.time_index_name,
+            nullable=DATA_SETTINGS.time_index_nullable,
+        )
+        value_dtypes = list(self.dtypes) if self.dtypes is not None else [self.values.dtype] * self.num_features
+        allowed_dtypes = pandera_utils.UnionDtype[DATA_SETTINGS.time_series_value_dtypes]  # type: ignore
+        for feature, dtype in zip(self.feature_index, value_dtypes):
+            if not pandera_utils.dtype_satisfies(dtype, allowed_dtypes):
+                raise TypeError(
+                    f"Values dtype `{dtype}` of feature `{feature}` not supported, must be of type: {allowed_dtypes}"
+                )
+        if not DATA_SETTINGS.time_series_values_nullable and pd.isna(self.values).any():
+            raise ValueError("Values must not contain null values")
+
+    @staticmethod
+    def from_dataframe(df: pd.DataFrame) -> "RaggedTimeSeries":
+        """Create :class:`RaggedTimeSeries` from a 2-level multiindex (sample, timestep) dataframe."""
+        offsets = utils.get_multiindex_sample_offsets(df.index)  # type: ignore [arg-type]
+        values = df.to_numpy()
+        time_index = df.index.get_level_values(1)
+        if offsets.order is not None:
+            values = values[offsets.order]
+            time_index = time_index[offsets.order]
+        dtypes = df.dtypes
+        keep_dtypes = not (dtypes == values.dtype).all()
+        return RaggedTimeSeries(
+            values,
+            offsets=np.append(offsets.starts, len(df)),
+            time_index=time_index,
+            sample_index=utils.get_df_index_level0_unique(df),
+            feature_index=df.columns,
+            dtypes=dtypes if keep_dtypes else None,
+        )
+
+    @staticmethod
+    def from_array3d(
+        array: np.ndarray,
+        *,
+        lengths: List[int],
+        sample_index: data_typing.SampleIndex,
+        time_indexes: data_typing.TimeIndexList,
+        feature_index: data_typing.FeatureIndex,
+    ) -> "RaggedTimeSeries":
+        """Create :class:`RaggedTimeSeries` from a padded 3D array with dimensions ``(sample, timestep, feature)``."""
+        lengths_ = np.asarray(lengths, dtype=np.int64)
+        offsets = np.zeros(len(lengths_) + 1, dtype=np.int64)
+        np.cumsum(lengths_, out=offsets[1:])
+        sample_pos, time_pos = _row_positions(offsets)
+        return RaggedTimeSeries(
+            array[sample_pos, time_pos, :],
+            offsets=offsets,
+            time_index=[t for ti in time_indexes for t in ti],
+            sample_index=sample_index,
+            feature_index=feature_index,
+        )
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Build a 2-level multiindex (sample, timestep) dataframe from the storage."""
+        index = pd.MultiIndex.from_arrays(
+            [self.sample_index.repeat(self.lengths), self.time_index],
+            names=[DATA_SETTINGS.sample_index_name, DATA_SETTINGS.time_index_name],
+        )
+        # Copy the values, as the buffer may be a view shared with other storage objects.
+        df = pd.DataFrame(self.values, index=index, columns=self.feature_index, copy=True)
+        if self.dtypes is not None:
+            df = df.astype(self.dtypes.to_dict())
+        return df
+
+    def to_array3d(self, *, padding_indicator: Any, max_timesteps: Optional[int] = None) -> np.ndarray:
+        """Pad the data to a 3D array with dimensions ``(sample, timestep, feature)``, see
+        :func:`~tempor.data.utils.multiindex_timeseries_dataframe_to_array3d`.
+        """
+        if utils.value_in_array(self.values, value=padding_indicator):
+            raise ValueError(f"Value `{padding_indicator}` found in data, choose a different padding indicator")
+        lengths = self.lengths
+        max_actual_timesteps = int(lengths.max()) if self.num_samples > 0 else 0
+        sample_pos, time_pos = _row_positions(self.offsets)
+        return utils.scatter_rows_to_array3d(
+            self.values,
+            sample_pos=sample_pos,
+            time_pos=time_pos,
+            num_samples=self.num_samples,
+            max_timesteps=max_actual_timesteps if max_timesteps is None else max_timesteps,
+            padding_indicator=padding_indicator,
+        )
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """Number of timesteps of each sample."""
+        return np.diff(self.offsets)
+
+    @property
+    def num_samples(self) -> int:
+        return len(self.sample_index)
+
+    @property
+    def num_features(self) -> int:
+        return self.values.shape[1]
+
+    def sample(self, position: int) -> Tuple[pd.Index, np.ndarray]:
+        """Return the ``(time index, values)`` of the sample at integer ``position``, as views into the storage."""
+        start, stop = self.offsets[position], self.offsets[position + 1]
+        return self.time_index[start:stop], self.values[start:stop]
+
+    def iter_samples(self) -> Generator[Tuple[Any, pd.Index, np.ndarray], None, None]:
+        """Iterate over the samples, yielding ``(sample ID, time index, values)``, as views into the storage."""
+        for position, sample_id in enumerate(self.sample_index):
+            yield (sample_id, *self.sample(position))
+
+    def time_indexes(self) -> List[pd.Index]:
+        """Return the time index of each sample."""
+        return [self.time_index[start:stop] for start, stop in zip(self.offsets[:-1], self.offsets[1:])]
+
+    def __len__(self) -> int:
+        return self.num_samples
+
+    def __getitem__(self, key: data_typing.GetItemKey) -> "RaggedTimeSeries":
+        """Select samples by integer position. Contiguous selections (slices with step ``1``, or ascending runs of
+        consecutive positions) return views into the storage, other selections gather the rows with a single
+        fancy-indexing operation.
+        """
+        key_ = utils.ensure_pd_iloc_key_returns_df(key)
+        positions = None
+        if not isinstance(key_, slice):
+            positions = np.arange(self.num_samples, dtype=np.int64)[key_]  # pyright: ignore
+            if len(positions) > 0 and (np.diff(positions) == 1).all():
+                key_ = slice(int(positions[0]), int(positions[-1]) + 1)
+        if isinstance(key_, slice) and key_.step in (None, 1):
+            start, stop, _ = key_.indices(self.num_samples)
+            stop = max(start, stop)
+            row_start, row_stop = self.offsets[start], self.offsets[stop]
+            return RaggedTimeSeries(
+                self.values[row_start:row_stop],
+                offsets=self.offsets[start : stop + 1] - row_start,
+                time_index=self.time_index[row_start:row_stop],
+                sample_index=self.sample_index[start:stop],
+                feature_index=self.feature_index,
+                dtypes=self.dtypes,
+            )
+        if positions is None:
+            positions = np.arange(self.num_samples, dtype=np.int64)[key_]
+        rows, offsets = _gather_rows(self.offsets, positions)
+        return RaggedTimeSeries(
+            self.values[rows],
+            offsets=offsets,
+            time_index=self.time_index[rows],
+            sample_index=self.sample_index[positions],
+            feature_index=self.feature_index,
+            dtypes=self.dtypes,
+        )
@@ -4,26 +4,102 @@
 
 import abc
 import contextlib
-from typing import TYPE_CHECKING, Any, Generator, List, Optional, Tuple
+import enum
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, Generator, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 import pandera as pa
 import pydantic
 from packaging.version import Version
-from typing_extensions import Self
+from typing_extensions import Literal, Self
 
 import tempor.exc
 from tempor.core import pydantic_utils
 from tempor.log import log_helpers, logger
 
-from . import data_typing, pandera_utils, utils
+from . import data_typing, pandera_utils, ragged, utils
 from .settings import DATA_SETTINGS
 
 
+class ValidationMode(enum.Enum):
+    """Data samples validation mode, see :func:`set_validation_mode`."""
+
+    FULL = enum.auto()
+    """Build the validation schema from the data and validate in stages, on every construction."""
+    CACHED = enum.auto()
+    """Reuse validation schemas compiled for data of the same structure (columns, dtypes, index dtypes), and validate
+    the data in a single pass. Data of a new structure is validated as in ``FULL`` mode."""
+    TRUST_INTERNAL = enum.auto()
+    """As ``CACHED``, but skip validation of data samples constructed by TemporAI transformers' ``transform``, see
+    :func:`internal_transform_scope`."""
+
+
+_VALIDATION_MODE = ValidationMode.CACHED
+_INTERNAL_TRANSFORM_DEPTH = 0
+_SCHEMA_CACHE = pandera_utils.SchemaCache()
+
+
+def get_validation_mode() -> ValidationMode:
+    """Get the current data samples :class:`ValidationMode`."""
+    return _VALIDATION_MODE
+
+
+def set_validation_mode(mode: ValidationMode) -> None:
+    """Set the data samples :class:`ValidationMode`. The default is ``ValidationMode.CACHED``.
+
+    Args:
+        mode (ValidationMode): The validation mode to use.
+    """
+    global _VALIDATION_MODE  # pylint: disable=global-statement
+    _VALIDATION_MODE = mode
+
+
+@contextlib.contextmanager
+def validation_mode(mode: ValidationMode) -> Generator:
+    """A context manager to temporarily use a different :class:`ValidationMode`."""
+    previous = get_validation_mode()
+    set_validation_mode(mode)
+    try:
+        yield
+    finally:
+        set_validation_mode(previous)
+
+
+@contextlib.contextmanager
+def internal_transform_scope() -> Generator:
+    """A context manager marking data samples constructed inside it as the output of a TemporAI transformer. Their
+    validation is skipped in ``ValidationMode.TRUST_INTERNAL``.
+    """
+    global _INTERNAL_TRANSFORM_DEPTH  # pylint: disable=global-statement
+    _INTERNAL_TRANSFORM_DEPTH += 1
+    try:
+        yield
+    finally:
+        _INTERNAL_TRANSFORM_DEPTH -= 1
+
+
+def _validation_trusted() -> bool:
+    return _VALIDATION_MODE == ValidationMode.TRUST_INTERNAL and _INTERNAL_TRANSFORM_DEPTH > 0
+
+
+def _get_cached_schema(key: Tuple) -> Optional[pa.DataFrameSchema]:
+    if _VALIDATION_MODE == ValidationMode.FULL:
+        return None
+    return _SCHEMA_CACHE.get(key)
+
+
+def _put_cached_schema(key: Tuple, schema: pa.DataFrameSchema) -> None:
+    if _VALIDATION_MODE != ValidationMode.FULL:
+        _SCHEMA_CACHE.put(key, pandera_utils.compile_schema(schema))
+
+
 class DataSamples(abc.ABC):
     _data: Any
 
+    _VIEW_ATTRIBUTES: ClassVar[Tuple[str, ...]] = ("_data",)
+    """Instance attributes holding the data, which are resolved from the parent on first access of a lazy view."""
+
     @property
     @abc.abstractmethod
     def modality(self) -> data_typing.DataModality:  # pragma: no cover
@@ -34,7 +110,7 @@ class DataSamples(abc.ABC):
         data: data_typing.DataContainer,  # pylint: disable=unused-argument
         **kwargs: Any,
     ) -> None:  # pragma: no cover
-        if "_skip_validate" not in kwargs:
+        if "_skip_validate" not in kwargs and not _validation_trusted():
             # For efficiency, pass `_skip_validate` internally (e.g. in `__getitem__`)
             # when there is no need to validate.
             self.validate()
@@ -142,6 +218,61 @@ class DataSamples(abc.ABC):
     def __getitem__(self, key: data_typing.GetItemKey) -> Self:  # pragma: no cover
         ...
 
+    def view(self, key: data_typing.GetItemKey) -> Self:
+        """Lazy counterpart of ``__getitem__``. Return the selected samples as a view, which only holds the integer
+        positions of the samples in this object. The data is selected from this object on first access of the view
+        (e.g. by ``dataframe()`` or ``numpy()``), and is never re-validated. Views of views refer to the original
+        object directly. Note that in-place modifications of the original data made before the view is first accessed
+        will be reflected in the view.
+
+        Args:
+            key (GetItemKey): Integer position(s) (or a slice) of the samples to select.
+
+        Returns:
+            Self: The view of the selected samples.
+        """
+        key_ = utils.ensure_pd_iloc_key_returns_df(key)
+        if "_view" in self.__dict__:
+            parent, parent_positions = self.__dict__["_view"]
+            positions = parent_positions[key_]
+        else:
+            parent, positions = self, np.arange(self.num_samples, dtype=np.int64)[key_]  # pyright: ignore
+        view = self.__class__.__new__(self.__class__)
+        view.__dict__["_view"] = (parent, positions)
+        return view
+
+    @property
+    def is_view(self) -> bool:
+        """Whether this object is a lazy view (see :meth:`view`) whose data has not been selected yet."""
+        return "_view" in self.__dict__
+
+    def _get_view(self) -> Optional[Tuple["DataSamples", np.ndarray]]:
+        # The (parent, positions) of a lazy view whose data has not been selected yet, `None` otherwise. Metadata,
+        # such as the number of samples or the sample index, is answered from these without materializing the view.
+        return self.__dict__.get("_view", None)
+
+    def _view_sample_index(self, view: Tuple["DataSamples", np.ndarray]) -> data_typing.SampleIndex:
+        parent, positions = view
+        parent_sample_index = parent.sample_index()
+        return [parent_sample_index[p] for p in positions.tolist()]  # type: ignore [return-value]
+
+    def _materialize_view(self) -> None:
+        parent, positions = self.__dict__.pop("_view")
+        self.__dict__.update(parent[positions].__dict__)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called if regular attribute lookup fails: resolves the data of a lazy view on first access.
+        if name in self._VIEW_ATTRIBUTES and "_view" in self.__dict__:
+            self._materialize_view()
+            return getattr(self, name)
+        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Materialize a lazy view before pickling (or copying), so that the parent is not serialized along with it.
+        if "_view" in self.__dict__:
+            self._materialize_view()
+        return self.__dict__
+
 
 def _array_default_sample_index(array: np.ndarray) -> List[int]:
     n_samples, *_ = array.shape
@@ -196,6 +327,14 @@ class StaticSamples(DataSamples):
         return data_typing.DataModality.STATIC
 
     def _validate(self) -> None:
+        cache_key = pandera_utils.schema_cache_key(self._data, self.__class__.__name__)
+        cached_schema = _get_cached_schema(cache_key)
+        if cached_schema is not None:
+            self._data.index.set_names(DATA_SETTINGS.sample_index_name, inplace=True)
+            self._data = cached_schema.validate(self._data)
+            self._schema = cached_schema
+            return
+
         schema = pandera_utils.init_schema(self._data, coerce=False)
         if TYPE_CHECKING:  # pragma: no cover
             assert isinstance(schema, pa.DataFrameSchema)  # nosec B101
@@ -238,6 +377,7 @@ class StaticSamples(DataSamples):
 
         logger.debug(f"Final schema:\n{schema}")
         self._schema = schema
+        _put_cached_schema(cache_key, schema)
 
     @staticmethod
     def from_dataframe(dataframe: pd.DataFrame, **kwargs: Any) -> "StaticSamples":
@@ -274,14 +414,23 @@ class StaticSamples(DataSamples):
         return self._data
 
     def sample_index(self) -> data_typing.SampleIndex:
+        view = self._get_view()
+        if view is not None:
+            return self._view_sample_index(view)
         return list(self._data.index)  # pyright: ignore
 
     @property
     def num_samples(self) -> int:
+        view = self._get_view()
+        if view is not None:
+            return len(view[1])
         return self._data.shape[0]
 
     @property
     def num_features(self) -> int:
+        view = self._get_view()
+        if view is not None:
+            return view[0].num_features
         return self._data.shape[1]
 
     def short_repr(self) -> str:
@@ -330,10 +479,22 @@ def workaround_pandera_pd2_1_0_multiindex_compatibility(schema: pa.DataFrameSche
         pass
 
 
+TimeSeriesStorage = Literal["dataframe", "array"]
+"""Storage backend of :class:`TimeSeriesSamples`:
+    - ``"dataframe"``: the data is stored as a 2-level multiindex (sample, timestep) `pandas.DataFrame`.
+    - ``"array"``: the data is stored as a :class:`~tempor.data.ragged.RaggedTimeSeries` (one contiguous values \
+buffer plus sample offsets), and the `pandas.DataFrame` is only built when requested.
+"""
+
+
 class TimeSeriesSamples(DataSamples):
-    _data: pd.DataFrame
+    _df: Optional[pd.DataFrame]
+    _ragged: Optional[ragged.RaggedTimeSeries]
+    _sample_offsets: Optional[utils.MultiindexSampleOffsets]
     _schema: pa.DataFrameSchema
 
+    _VIEW_ATTRIBUTES = ("_df", "_ragged", "_sample_offsets")
+
     @property
     def modality(self) -> data_typing.DataModality:
         return data_typing.DataModality.TIME_SERIES
@@ -341,12 +502,13 @@ class TimeSeriesSamples(DataSamples):
     @pydantic_utils.validate_arguments(config=pydantic.ConfigDict(arbitrary_types_allowed=True))
     def __init__(
         self,
-        data: data_typing.DataContainer,
+        data: Union[data_typing.DataContainer, ragged.RaggedTimeSeries],
         *,
         padding_indicator: Any = None,
         sample_index: Optional[data_typing.SampleIndex] = None,
         time_indexes: Optional[data_typing.TimeIndexList] = None,
         feature_index: Optional[data_typing.FeatureIndex] = None,
+        storage: Optional[TimeSeriesStorage] = None,
         **kwargs: Any,
     ) -> None:
         """Create a :class:`TimeSeriesSamples` object from the ``data``.
@@ -358,8 +520,10 @@ class TimeSeriesSamples(DataSamples):
         of different samples in case they differ. Padding needs to go at the end of the timesteps (dim 1). Padding must
         be the same across the feature dimension (dim 2) for each sample.
 
+        If ``data`` is a :class:`~tempor.data.ragged.RaggedTimeSeries`, the ``"array"`` storage is used directly.
+
         Args:
-            data (numpy.ndarray | pandas.DataFrame):
+            data (numpy.ndarray | pandas.DataFrame | RaggedTimeSeries):
                 A container with the data.
             padding_indicator (Any, optional):
                 Padding indicator used in ``data`` to indicate padding. Defaults to `None`.
@@ -374,23 +538,103 @@ class TimeSeriesSamples(DataSamples):
             feature_index (List[<feature element>], optional):
                 Used only if ``data`` is a `numpy.ndarray`.  List with feature (column) index for each feature.
                 Optional, if `None`, will be of form ``["feat_0", "feat_1", ...]``.
+            storage (TimeSeriesStorage, optional):
+                The storage backend to use, ``"dataframe"`` or ``"array"``, see `TimeSeriesStorage`. If `None`, will
+                be ``"array"`` if ``data`` is a :class:`~tempor.data.ragged.RaggedTimeSeries`, ``"dataframe"``
+                otherwise. Defaults to `None`.
         """
+        self._df = None
+        self._ragged = None
+        self._sample_offsets = None
+        if storage is None:
+            storage = "array" if isinstance(data, ragged.RaggedTimeSeries) else "dataframe"
         if isinstance(data, pd.DataFrame):
             self._data = data
         elif isinstance(data, np.ndarray):
-            self._data = self._array_to_df(
-                data,
-                padding_indicator=padding_indicator,
-                sample_index=sample_index,
-                time_indexes=time_indexes,
-                feature_index=feature_index,
-                **kwargs,
-            )
+            if storage == "array":
+                self._ragged = self._array_to_ragged(
+                    data,
+                    padding_indicator=padding_indicator,
+                    sample_index=sample_index,
+                    time_indexes=time_indexes,
+                    feature_index=feature_index,
+                )
+            else:
+                self._data = self._array_to_df(
+                    data,
+                    padding_indicator=padding_indicator,
+                    sample_index=sample_index,
+                    time_indexes=time_indexes,
+                    feature_index=feature_index,
+                    **kwargs,
+                )
+        elif isinstance(data, ragged.RaggedTimeSeries):
+            if storage == "array":
+                self._ragged = data
+            else:
+                self._data = data.to_dataframe()
         else:  # pragma: no cover  # Prevented by pydantic check.
             raise ValueError(f"Data object {type(data)} not supported")
         super().__init__(data, **kwargs)
+        if storage == "array" and self._ragged is None:
+            # The dataframe was validated above, now move it to the array storage.
+            self._ragged = ragged.RaggedTimeSeries.from_dataframe(self._data)
+            self._df = None
+
+    @property
+    def _data(self) -> pd.DataFrame:
+        if self._df is None:
+            # Materialize the dataframe: from this point on, the dataframe is the source of truth, as it may be
+            # modified by the caller.
+            if TYPE_CHECKING:  # pragma: no cover
+                assert self._ragged is not None  # nosec B101
+            self._df = self._ragged.to_dataframe()
+            self._ragged = None
+        return self._df
+
+    @_data.setter
+    def _data(self, value: pd.DataFrame) -> None:
+        self.__dict__.pop("_view", None)
+        self._df = value
+        self._ragged = None
+        self._sample_offsets = None
+
+    def _get_sample_offsets(self) -> utils.MultiindexSampleOffsets:
+        # Per-sample layout of the dataframe multiindex, computed once and cached until the data is reassigned.
+        if self._sample_offsets is None:
+            self._sample_offsets = utils.get_multiindex_sample_offsets(self._data.index)  # type: ignore [arg-type]
+        return self._sample_offsets
+
+    @property
+    def storage(self) -> TimeSeriesStorage:
+        """The current storage backend, see `TimeSeriesStorage`."""
+        return "array" if self._ragged is not None else "dataframe"
+
+    def as_ragged(self) -> ragged.RaggedTimeSeries:
+        """Return the :class:`~tempor.data.ragged.RaggedTimeSeries` representation of the data. If the storage is
+        ``"dataframe"``, this will be built from the dataframe.
+
+        Returns:
+            RaggedTimeSeries: The array-backed representation of the data.
+        """
+        if self._ragged is not None:
+            return self._ragged
+        return ragged.RaggedTimeSeries.from_dataframe(self._data)
 
     def _validate(self) -> None:
+        if self._ragged is not None:
+            self._ragged.validate()
+            return
+
+        cache_key = pandera_utils.schema_cache_key(self._data, self.__class__.__name__)
+        cached_schema = _get_cached_schema(cache_key)
+        if cached_schema is not None:
+            self._data.index.set_names([DATA_SETTINGS.sample_index_name, DATA_SETTINGS.time_index_name], inplace=True)
+            with workaround_pandera_pd2_1_0_multiindex_compatibility(cached_schema, self._data):
+                self._data = cached_schema.validate(self._data)
+            self._schema = cached_schema
+            return
+
         schema = pandera_utils.init_schema(self._data, coerce=False)
         if TYPE_CHECKING:  # pragma: no cover
             assert isinstance(schema, pa.DataFrameSchema)  # nosec B101
@@ -440,6 +684,7 @@ class TimeSeriesSamples(DataSamples):
 
         logger.debug(f"Final schema:\n{schema}")
         self._schema = schema
+        _put_cached_schema(cache_key, schema)
 
         # TODO:
         # Possible additional validation checks:
@@ -495,16 +740,60 @@ class TimeSeriesSamples(DataSamples):
             padding_indicator=padding_indicator,
         )
 
-    def numpy(self, *, padding_indicator: Any = DATA_SETTINGS.default_padding_indicator, **kwargs: Any) -> np.ndarray:
-        return utils.multiindex_timeseries_dataframe_to_array3d(
-            df=self._data, padding_indicator=padding_indicator, max_timesteps=None
+    @staticmethod
+    def _array_to_ragged(
+        array: np.ndarray,
+        *,
+        padding_indicator: Any,
+        sample_index: Optional[data_typing.SampleIndex] = None,
+        time_indexes: Optional[data_typing.TimeIndexList] = None,
+        feature_index: Optional[data_typing.FeatureIndex] = None,
+    ) -> ragged.RaggedTimeSeries:
+        utils.validate_timeseries_array3d(array, padding_indicator)
+        lengths = utils.get_seq_lengths_timeseries_array3d(array, padding_indicator)
+        if sample_index is None:
+            sample_index = _array_default_sample_index(array)  # pyright: ignore
+        if feature_index is None:
+            feature_index = _array_default_feature_index(array)
+        if time_indexes is None:
+            time_indexes = [list(range(x)) for x in lengths]  # pyright: ignore
+        if TYPE_CHECKING:  # pragma: no cover
+            assert sample_index is not None and feature_index is not None and time_indexes is not None  # nosec B101
+        return ragged.RaggedTimeSeries.from_array3d(
+            array,
+            lengths=lengths,
+            sample_index=sample_index,
+            time_indexes=time_indexes,
+            feature_index=feature_index,
         )
 
+    def numpy(self, *, padding_indicator: Any = DATA_SETTINGS.default_padding_indicator, **kwargs: Any) -> np.ndarray:
+        view = self._get_view()
+        if view is not None and view[0].storage == "array":  # type: ignore [attr-defined]
+            # Read from the parent's buffer (contiguous selections share it), leaving the view unmaterialized.
+            parent, positions = view
+            return parent.as_ragged()[positions].to_array3d(  # type: ignore [attr-defined]
+                padding_indicator=padding_indicator
+            )
+        if self._ragged is not None:
+            return self._ragged.to_array3d(padding_indicator=padding_indicator)
+        return utils.multiindex_timeseries_dataframe_to_array3d_ext(
+            self._data, padding_indicator=padding_indicator, offsets=self._get_sample_offsets()
+        ).array
+
     def dataframe(self, **kwargs: Any) -> pd.DataFrame:
         return self._data
 
     def sample_index(self) -> data_typing.SampleIndex:
-        return list(utils.get_df_index_level0_unique(self._data))  # pyright: ignore
+        view = self._get_view()
+        if view is not None:
+            return self._view_sample_index(view)
+        if self._ragged is not None:
+            return list(self._ragged.sample_index)  # pyright: ignore
+        multiindex = self._data.index
+        if TYPE_CHECKING:  # pragma: no cover
+            assert isinstance(multiindex, pd.MultiIndex)  # nosec B101
+        return list(multiindex.levels[0].take(self._get_sample_offsets().sample_codes))  # pyright: ignore
 
     def time_indexes(self) -> data_typing.TimeIndexList:
         """Get a list containing time indexes for each sample. Each time index is represented as a list of time step
@@ -513,7 +802,17 @@ class TimeSeriesSamples(DataSamples):
         Returns:
             List[List[<timestep element>]]: A list containing time indexes for each sample.
         """
-        return list(self.time_indexes_as_dict().values())  # pyright: ignore
+        if self._ragged is not None:
+            time_index = self._ragged.time_index
+            bounds = self._ragged.offsets.tolist()
+        else:
+            offsets = self._get_sample_offsets()
+            time_index = self._data.index.get_level_values(1)
+            if offsets.order is not None:
+                time_index = time_index[offsets.order]
+            bounds = [0, *offsets.stops.tolist()]
+        flat = time_index.tolist()
+        return [flat[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]  # pyright: ignore
 
     def time_indexes_as_dict(self) -> data_typing.SampleToTimeIndexDict:
         """Get a dictionary mapping each sample index to its time index. Time index is represented as a list of time
@@ -522,15 +821,7 @@ class TimeSeriesSamples(DataSamples):
         Returns:
             Dict[<sample element>, List[<timestep element>]]: A list containing time indexes for each sample.
         """
-        multiindex = self._data.index
-        if TYPE_CHECKING:  # pragma: no cover
-            assert isinstance(multiindex, pd.MultiIndex)  # nosec B101
-        sample_index = self.sample_index()
-        d = dict()
-        for s in sample_index:
-            time_index_locs = multiindex.get_locs([s, slice(None)])
-            d[s] = list(multiindex.get_level_values(1)[time_index_locs])
-        return d  # type: ignore[return-value]
+        return dict(zip(self.sample_index(), self.time_indexes()))  # type: ignore[arg-type]
 
     def time_indexes_float(self) -> List[np.ndarray]:
         """Return time indexes but converting their elements to `float` values.
@@ -540,7 +831,12 @@ class TimeSeriesSamples(DataSamples):
         Returns:
             List[np.ndarray]: List of 1D `numpy.ndarray` s of `float` values, corresponding to the time index.
         """
-        return [utils.datetime_time_index_to_float(ti) for ti in self.time_indexes()]
+        if self._ragged is not None:
+            time_index_float = utils.datetime_time_index_to_float(self._ragged.time_index)
+            return np.split(time_index_float, self._ragged.offsets[1:-1])
+        return self._get_sample_offsets().split(
+            utils.datetime_time_index_to_float(self._data.index.get_level_values(1))
+        )
 
     def num_timesteps(self) -> List[int]:
         """Get the number of timesteps for each sample.
@@ -548,7 +844,16 @@ class TimeSeriesSamples(DataSamples):
         Returns:
             List[int]: List containing the number of timesteps for each sample.
         """
-        return [len(x) for x in self.time_indexes()]
+        return self._lengths().tolist()
+
+    def _lengths(self) -> np.ndarray:
+        view = self._get_view()
+        if view is not None:
+            parent, positions = view
+            return parent._lengths()[positions]  # type: ignore [attr-defined]  # pylint: disable=protected-access
+        if self._ragged is not None:
+            return self._ragged.lengths
+        return self._get_sample_offsets().lengths
 
     def num_timesteps_as_dict(self) -> data_typing.SampleToNumTimestepsDict:
         """Get a dictionary mapping each sample index to its the number of timesteps.
@@ -556,7 +861,7 @@ class TimeSeriesSamples(DataSamples):
         Returns:
             List[int]: List containing the number of timesteps for each sample.
         """
-        return {key: len(x) for key, x in self.time_indexes_as_dict().items()}  # type: ignore
+        return dict(zip(self.sample_index(), self.num_timesteps()))  # type: ignore
 
     def num_timesteps_equal(self) -> bool:
         """Returns `True` if all samples share the same number of timesteps, `False` otherwise.
@@ -564,8 +869,8 @@ class TimeSeriesSamples(DataSamples):
         Returns:
             bool: whether all samples share the same number of timesteps.
         """
-        timesteps = self.num_timesteps()
-        return True if len(timesteps) == 0 else all([x == timesteps[0] for x in timesteps])
+        lengths = self._lengths()
+        return True if len(lengths) == 0 else bool((lengths == lengths[0]).all())
 
     def list_of_dataframes(self) -> List[pd.DataFrame]:
         """Returns a list of dataframes where each dataframe has the data for each sample.
@@ -573,26 +878,44 @@ class TimeSeriesSamples(DataSamples):
         Returns:
             List[pd.DataFrame]: List of dataframes for each sample.
         """
-        return utils.multiindex_timeseries_dataframe_to_list_of_dataframes(self._data)
+        offsets = self._get_sample_offsets()
+        if offsets.order is None:
+            return [self._data.iloc[start:stop] for start, stop in zip(offsets.starts.tolist(), offsets.stops.tolist())]
+        return [self._data.iloc[rows] for rows in offsets.split(np.arange(len(self._data)))]
 
     @property
     def num_samples(self) -> int:
+        view = self._get_view()
+        if view is not None:
+            return len(view[1])
+        if self._ragged is not None:
+            return self._ragged.num_samples
         sample_ids = utils.get_df_index_level0_unique(self._data)
         return len(sample_ids)
 
     @property
     def num_features(self) -> int:
+        view = self._get_view()
+        if view is not None:
+            return view[0].num_features
+        if self._ragged is not None:
+            return self._ragged.num_features
         return self._data.shape[1]
 
     def short_repr(self) -> str:
         return f"{self.__class__.__name__}([{self.num_samples}, *, {self.num_features}])"
 
     def __getitem__(self, key: data_typing.GetItemKey) -> Self:
+        if self._ragged is not None:
+            return TimeSeriesSamples(  # type: ignore [return-value]
+                self._ragged[key],
+                _skip_validate=True,
+            )
         key_ = utils.ensure_pd_iloc_key_returns_df(key)
-        sample_index = utils.get_df_index_level0_unique(self._data)
-        selected = list(sample_index[key_])  # pyright: ignore
+        offsets = self._get_sample_offsets()
+        positions = np.arange(offsets.num_samples, dtype=np.int64)[key_]  # pyright: ignore
         return TimeSeriesSamples(  # type: ignore [return-value]
-            self._data.loc[(selected, slice(None)), :],  # pyright: ignore
+            self._data.iloc[offsets.take_rows(positions), :],
             _skip_validate=True,
         )
 
@@ -639,6 +962,20 @@ class EventSamples(DataSamples):
         super().__init__(data, **kwargs)
 
     def _validate(self) -> None:
+        cache_key = pandera_utils.schema_cache_key(self._data, self.__class__.__name__)
+        cached_schema = _get_cached_schema(cache_key)
+        if cached_schema is not None:
+            self._data.index.set_names(DATA_SETTINGS.sample_index_name, inplace=True)
+            self._data = cached_schema.validate(self._data)
+            data_split = self.split(time_feature_suffix=_DEFAULT_EVENTS_TIME_FEATURE_SUFFIX)
+            cache_key_split = pandera_utils.schema_cache_key(data_split, self.__class__.__name__, "split")
+            cached_schema_split = _get_cached_schema(cache_key_split)
+            if cached_schema_split is not None:
+                cached_schema_split.validate(data_split)
+                self._schema = cached_schema
+                self._schema_split = cached_schema_split
+                return
+
         schema = pandera_utils.init_schema(self._data, coerce=False)
         if TYPE_CHECKING:  # pragma: no cover
             assert isinstance(schema, pa.DataFrameSchema)  # nosec B101
@@ -686,6 +1023,7 @@ class EventSamples(DataSamples):
         logger.debug(f"Time split-off schema (checks event time and values separately):\n{schema_split}")
         schema_split.validate(data_split)
         self._schema_split = schema_split
+        _put_cached_schema(pandera_utils.schema_cache_key(data_split, self.__class__.__name__, "split"), schema_split)
 
         # Index validation:
         schema, data = pandera_utils.set_up_index(
@@ -701,6 +1039,7 @@ class EventSamples(DataSamples):
 
         logger.debug(f"Final schema:\n{schema}")
         self._schema = schema
+        _put_cached_schema(cache_key, schema)
 
     @staticmethod
     def from_dataframe(dataframe: pd.DataFrame, **kwargs: Any) -> "EventSamples":
@@ -738,14 +1077,23 @@ class EventSamples(DataSamples):
         return self._data
 
     def sample_index(self) -> data_typing.SampleIndex:
+        view = self._get_view()
+        if view is not None:
+            return self._view_sample_index(view)
         return list(self._data.index)  # pyright: ignore
 
     @property
     def num_samples(self) -> int:
+        view = self._get_view()
+        if view is not None:
+            return len(view[1])
         return self._data.shape[0]
 
     @property
     def num_features(self) -> int:
+        view = self._get_view()
+        if view is not None:
+            return view[0].num_features
         return self._data.shape[1]
 
     @pydantic_utils.validate_arguments(config=pydantic.ConfigDict(arbitrary_types_allowed=True))
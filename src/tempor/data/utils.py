@@ -1,17 +1,22 @@
 import dataclasses
+import hashlib
 import itertools
-from typing import Any, ClassVar, Iterable, List, Optional, Sequence, Tuple, Union
+from typing import TYPE_CHECKING, Any, ClassVar, Iterable, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
 import pydantic
 from packaging.version import Version
+from typing_extensions import Literal
 
 import tempor.core.utils
 from tempor.core import pydantic_utils
 
 from . import data_typing, settings
 
+if TYPE_CHECKING:  # pragma: no cover
+    from .dataset import BaseDataset
+
 
 @dataclasses.dataclass(frozen=True)
 class _ExceptionMessages:
@@ -46,6 +51,218 @@ def get_df_index_level0_unique(df: pd.DataFrame) -> pd.Index:
 # --- Multiindex timeseries dataframe --> 3D numpy array. ---
 
 
+@dataclasses.dataclass(frozen=True)
+class MultiindexSampleOffsets:
+    """Per-sample layout of a 2-level multiindex (sample, timestep) dataframe, derived from the multiindex codes.
+
+    Samples are enumerated in order of first appearance in the index (as in :func:`get_df_index_level0_unique`),
+    and rows within each sample keep their original relative order.
+    """
+
+    sample_codes: np.ndarray
+    """Level ``0`` code of each sample, shape ``(num_samples,)``."""
+    sample_pos: np.ndarray
+    """Integer position of the sample each row belongs to, shape ``(num_rows,)``."""
+    time_pos: np.ndarray
+    """Integer position of each row within its sample, shape ``(num_rows,)``."""
+    order: Optional[np.ndarray]
+    """Stable permutation which groups the rows by sample, `None` if the rows are already grouped contiguously."""
+    starts: np.ndarray
+    """Row offset at which each sample starts (in the grouped row order), shape ``(num_samples,)``."""
+    lengths: np.ndarray
+    """Number of timesteps of each sample, shape ``(num_samples,)``."""
+
+    @property
+    def num_samples(self) -> int:
+        return len(self.lengths)
+
+    @property
+    def stops(self) -> np.ndarray:
+        """Row offset at which each sample stops (exclusive), shape ``(num_samples,)``."""
+        return self.starts + self.lengths
+
+    def split(self, array: Any) -> List[Any]:
+        """Split the per-row ``array`` (or `pandas.Index`) into a list of per-sample parts."""
+        if self.order is not None:
+            array = array[self.order]
+        return [array[start:stop] for start, stop in zip(self.starts.tolist(), self.stops.tolist())]
+
+    def take_rows(self, positions: np.ndarray) -> np.ndarray:
+        """Get the (original order) row positions of the samples at integer ``positions``, grouped by sample in the
+        order of ``positions``.
+        """
+        lengths = self.lengths[positions]
+        new_starts = np.cumsum(lengths) - lengths
+        rows = np.arange(int(lengths.sum()), dtype=np.int64) + np.repeat(self.starts[positions] - new_starts, lengths)
+        if self.order is not None:
+            rows = self.order[rows]
+        return rows
+
+
+def get_multiindex_sample_offsets(index: pd.MultiIndex) -> MultiindexSampleOffsets:
+    """Compute :class:`MultiindexSampleOffsets` for a 2-level multiindex (sample, timestep) in a single vectorized
+    pass over the level ``0`` codes, without any per-sample lookups.
+
+    Args:
+        index (pd.MultiIndex): The 2-level multiindex.
+
+    Returns:
+        MultiindexSampleOffsets: The per-sample layout.
+    """
+    num_rows = len(index)
+    # Relabel level 0 codes in order of first appearance (level codes are in sorted-label order).
+    sample_pos, sample_codes = pd.factorize(np.asarray(index.codes[0]))
+    sample_pos = sample_pos.astype(np.int64, copy=False)
+    num_samples = int(sample_pos.max()) + 1 if num_rows > 0 else 0
+    lengths = np.bincount(sample_pos, minlength=num_samples).astype(np.int64, copy=False)
+    starts = np.zeros(num_samples, dtype=np.int64)
+    np.cumsum(lengths[:-1], out=starts[1:])
+
+    if num_rows == 0 or bool((np.diff(sample_pos) >= 0).all()):
+        # Rows already grouped contiguously by sample (the common case).
+        order = None
+        time_pos = np.arange(num_rows, dtype=np.int64) - starts[sample_pos]
+    else:
+        order = np.argsort(sample_pos, kind="stable")
+        time_pos = np.empty(num_rows, dtype=np.int64)
+        time_pos[order] = np.arange(num_rows, dtype=np.int64) - starts[sample_pos[order]]
+
+    return MultiindexSampleOffsets(
+        sample_codes=np.asarray(sample_codes, dtype=np.int64),
+        sample_pos=sample_pos,
+        time_pos=time_pos,
+        order=order,
+        starts=starts,
+        lengths=lengths,
+    )
+
+
+def value_in_array(array: np.ndarray, *, value: Any) -> bool:
+    """Check if ``value`` exists in ``array``, accounting for the case where ``value`` is `numpy.nan`."""
+    if pd.isnull(value):
+        return bool(pd.isnull(array).any())
+    return bool((array == value).any())
+
+
+def scatter_rows_to_array3d(
+    values: np.ndarray,
+    *,
+    sample_pos: np.ndarray,
+    time_pos: np.ndarray,
+    num_samples: int,
+    max_timesteps: int,
+    padding_indicator: Any,
+) -> np.ndarray:
+    """Scatter the rows of the 2D ``values`` array into a padded 3D array with dimensions
+    ``(sample, timestep, feature)``, using a single fancy-indexing assignment. Rows whose ``time_pos`` is not less than
+    ``max_timesteps`` are dropped.
+
+    Args:
+        values (np.ndarray): 2D array of values, with dimensions ``(row, feature)``.
+        sample_pos (np.ndarray): Integer position of the sample each row belongs to.
+        time_pos (np.ndarray): Integer position of each row within its sample.
+        num_samples (int): Number of samples (size of dim 0 of the output array).
+        max_timesteps (int): Number of timesteps (size of dim 1 of the output array).
+        padding_indicator (Any): Value to fill the padding with.
+
+    Returns:
+        np.ndarray: Output 3D numpy array, of the same dtype as ``values``.
+    """
+    array = np.full(shape=(num_samples, max_timesteps, values.shape[1]), fill_value=padding_indicator)
+    if array.dtype != values.dtype:
+        array = array.astype(values.dtype)  # Need to cast to the type matching source data.
+    keep = time_pos < max_timesteps
+    if bool(keep.all()):
+        array[sample_pos, time_pos, :] = values
+    else:
+        array[sample_pos[keep], time_pos[keep], :] = values[keep]
+    return array
+
+
+@dataclasses.dataclass(frozen=True)
+class Array3dConversionOutput:
+    """Output of :func:`multiindex_timeseries_dataframe_to_array3d_ext`."""
+
+    array: np.ndarray
+    """The 3D array with dimensions ``(sample, timestep, feature)``."""
+    lengths: Optional[np.ndarray] = None
+    """Number of (non-padding) timesteps of each sample in ``array``, if requested."""
+    time_array: Optional[np.ndarray] = None
+    """The 2D `float` time index array with dimensions ``(sample, timestep)``, padded like ``array``, if requested."""
+
+
+@pydantic_utils.validate_arguments(config=pydantic.ConfigDict(arbitrary_types_allowed=True))
+def multiindex_timeseries_dataframe_to_array3d_ext(
+    df: pd.DataFrame,
+    *,
+    padding_indicator: Any,
+    max_timesteps: Optional[int] = None,
+    return_lengths: bool = False,
+    return_time_array: bool = False,
+    offsets: Optional[MultiindexSampleOffsets] = None,
+) -> Array3dConversionOutput:
+    """Single-pass conversion of timeseries dataframe ``df`` with a 2-level multiindex (sample, timestep) to a 3D numpy
+    array with dimensions ``(sample, timestep, feature)``, optionally also returning the per-sample lengths and the
+    `float` time index array.
+
+    The values are scattered into the padded output array with a single fancy-indexing assignment, using the sample
+    offsets derived from the multiindex codes (see :func:`get_multiindex_sample_offsets`).
+
+    Args:
+        df (pd.DataFrame):
+            Input dataframe.
+        padding_indicator (Any):
+            padding indicator value to use to pad the output array(s) in case of unequal number of timesteps for
+            different samples.
+        max_timesteps (int, optional):
+            Maximum number of timesteps to use. This will become the size of the dim 1 of the output array. If set to
+            `None`, this dimension will be set as the highest number of timesteps among the samples. Defaults to `None`.
+        return_lengths (bool, optional):
+            Whether to also return the number of (non-padding) timesteps of each sample. Defaults to `False`.
+        return_time_array (bool, optional):
+            Whether to also return the time index converted to `float` (see :func:`datetime_time_index_to_float`) as a
+            padded 2D array. Defaults to `False`.
+        offsets (MultiindexSampleOffsets, optional):
+            Precomputed sample offsets of ``df.index``, if available. Defaults to `None`.
+
+    Raises:
+        ValueError: raised if the ``padding_indicator`` found as one of the data values in ``df``.
+
+    Returns:
+        Array3dConversionOutput: The output array(s).
+    """
+    values = df.to_numpy()
+    if value_in_array(values, value=padding_indicator):
+        raise ValueError(f"Value `{padding_indicator}` found in data frame, choose a different padding indicator")
+    if offsets is None:
+        offsets = get_multiindex_sample_offsets(df.index)  # type: ignore [arg-type]
+
+    max_actual_timesteps = int(offsets.lengths.max()) if offsets.num_samples > 0 else 0
+    max_timesteps = max_actual_timesteps if max_timesteps is None else max_timesteps
+
+    array = scatter_rows_to_array3d(
+        values,
+        sample_pos=offsets.sample_pos,
+        time_pos=offsets.time_pos,
+        num_samples=offsets.num_samples,
+        max_timesteps=max_timesteps,
+        padding_indicator=padding_indicator,
+    )
+    lengths = np.minimum(offsets.lengths, max_timesteps) if return_lengths else None
+    time_array = None
+    if return_time_array:
+        time_array = scatter_rows_to_array3d(
+            datetime_time_index_to_float(df.index.get_level_values(1)).reshape(-1, 1),
+            sample_pos=offsets.sample_pos,
+            time_pos=offsets.time_pos,
+            num_samples=offsets.num_samples,
+            max_timesteps=max_timesteps,
+            padding_indicator=padding_indicator,
+        )[:, :, 0]
+
+    return Array3dConversionOutput(array=array, lengths=lengths, time_array=time_array)
+
+
 @pydantic_utils.validate_arguments(config=pydantic.ConfigDict(arbitrary_types_allowed=True))
 def multiindex_timeseries_dataframe_to_array3d(
     df: pd.DataFrame, *, padding_indicator: Any, max_timesteps: Optional[int] = None
@@ -53,6 +270,9 @@ def multiindex_timeseries_dataframe_to_array3d(
     """Convert timeseries dataframe ``df`` with a 2-level multiindex (sample, timestep) to a 3D numpy array with
     dimensions ``(sample, timestep, feature)``.
 
+    See :func:`multiindex_timeseries_dataframe_to_array3d_ext` for a variant that can also return the per-sample
+    lengths and the `float` time index array in the same pass.
+
     Args:
         df (pd.DataFrame):
             Input dataframe.
@@ -69,21 +289,9 @@ def multiindex_timeseries_dataframe_to_array3d(
     Returns:
         np.ndarray: Output 3D numpy array.
     """
-    if value_in_df(df, value=padding_indicator):
-        raise ValueError(f"Value `{padding_indicator}` found in data frame, choose a different padding indicator")
-    samples = get_df_index_level0_unique(df)
-    num_samples = len(samples)
-    num_features = len(df.columns)
-    num_timesteps_per_sample = df.groupby(level=0).size()
-    max_actual_timesteps = num_timesteps_per_sample.max()
-    max_timesteps = max_actual_timesteps if max_timesteps is None else max_timesteps
-    array = np.full(shape=(num_samples, max_timesteps, num_features), fill_value=padding_indicator)
-    for i_sample, idx_sample in enumerate(samples):
-        set_vals = df.loc[idx_sample, :, :].to_numpy()[:max_timesteps, :]  # pyright: ignore
-        if i_sample == 0:
-            array = array.astype(set_vals.dtype)  # Need to cast to the type matching source data.
-        array[i_sample, : num_timesteps_per_sample[idx_sample], :] = set_vals  # pyright: ignore
-    return array
+    return multiindex_timeseries_dataframe_to_array3d_ext(
+        df, padding_indicator=padding_indicator, max_timesteps=max_timesteps
+    ).array
 
 
 # --- 3D numpy array --> Multiindex timeseries dataframe. ---
@@ -378,6 +586,107 @@ def multiindex_timeseries_dataframe_to_list_of_dataframes(df: pd.DataFrame) -> L
     return [df.loc[(si, slice(None)), :] for si in sample_index]
 
 
+# --- Per-sample missing value filling for multiindex timeseries dataframes. ---
+
+FillMethod = Literal["ffill", "bfill"]
+
+
+def fill_array2d_within_segments(
+    values: np.ndarray,
+    *,
+    starts: np.ndarray,
+    lengths: np.ndarray,
+    method: FillMethod,
+) -> np.ndarray:
+    """Propagate the last (``"ffill"``) or next (``"bfill"``) non-`numpy.nan` value along dim ``0`` of the 2D float
+    ``values`` array, independently within each contiguous segment of rows (given by ``starts`` and ``lengths``),
+    and for each column. Done in a single vectorized pass as a running maximum (minimum) of the positions of
+    non-missing values, so that no values are carried across segment boundaries.
+
+    Args:
+        values (np.ndarray): 2D float array with dimensions ``(row, feature)``.
+        starts (np.ndarray): The starting row of each segment. Segments must cover all rows, in order.
+        lengths (np.ndarray): The number of rows in each segment.
+        method (FillMethod): ``"ffill"`` or ``"bfill"``.
+
+    Returns:
+        np.ndarray: The filled array (a new array), values that have nothing to propagate from remain `numpy.nan`.
+    """
+    num_rows = values.shape[0]
+    if num_rows == 0:
+        return values.copy()
+    missing = np.isnan(values)
+    rows = np.arange(num_rows, dtype=np.int64)[:, np.newaxis]
+    if method == "ffill":
+        source = np.where(missing, -1, rows)
+        np.maximum.accumulate(source, axis=0, out=source)
+        found = source >= np.repeat(starts, lengths)[:, np.newaxis]
+    elif method == "bfill":
+        source = np.where(missing, num_rows, rows)
+        source = np.minimum.accumulate(source[::-1], axis=0)[::-1]
+        found = source < np.repeat(starts + lengths, lengths)[:, np.newaxis]
+    else:
+        raise ValueError(f"Unknown fill method '{method}'")
+    filled = np.take_along_axis(values, np.where(found, source, 0), axis=0)
+    filled[~found] = np.nan
+    return filled
+
+
+def multiindex_timeseries_dataframe_fill_per_sample(
+    df: pd.DataFrame,
+    *,
+    methods: Sequence[FillMethod],
+    fill_value: Any = None,
+    offsets: Optional[MultiindexSampleOffsets] = None,
+) -> pd.DataFrame:
+    """Fill the missing values of the timeseries dataframe ``df`` with a 2-level multiindex (sample, timestep) within
+    each sample, applying each of the ``methods`` (``"ffill"``, ``"bfill"``) in turn, and then
+    ``fillna(fill_value)`` if ``fill_value`` is not `None`. The result is the same as applying these to the dataframe
+    of each sample separately, but all samples are processed at once: float columns by
+    :func:`fill_array2d_within_segments`, any other columns containing missing values by a ``groupby`` fill.
+
+    Args:
+        df (pd.DataFrame): Input multiindex dataframe.
+        methods (Sequence[FillMethod]): The fill methods to apply, in order.
+        fill_value (Any, optional): Value to fill any remaining missing values with. Defaults to `None`.
+        offsets (MultiindexSampleOffsets, optional):
+            Precomputed sample offsets of ``df`` (see :func:`get_multiindex_sample_offsets`). Defaults to `None`.
+
+    Returns:
+        pd.DataFrame: The filled dataframe (a new dataframe).
+    """
+    df = df.copy()
+    missing = df.isna().any(axis=0)
+    columns_with_missing = df.columns[missing.to_numpy()]
+    float_columns = [c for c in columns_with_missing if pd.api.types.is_float_dtype(df[c].dtype)]
+    other_columns = [c for c in columns_with_missing if c not in float_columns]
+
+    if float_columns:
+        if offsets is None:
+            offsets = get_multiindex_sample_offsets(df.index)  # type: ignore [arg-type]
+        values = df[float_columns].to_numpy()
+        if offsets.order is not None:
+            values = values[offsets.order]
+        for method in methods:
+            values = fill_array2d_within_segments(values, starts=offsets.starts, lengths=offsets.lengths, method=method)
+        if fill_value is not None:
+            values[np.isnan(values)] = fill_value
+        if offsets.order is not None:
+            values_grouped, values = values, np.empty_like(values)
+            values[offsets.order] = values_grouped
+        df[float_columns] = values
+
+    if other_columns:
+        grouped = df[other_columns]
+        for method in methods:
+            grouped = getattr(grouped.groupby(level=0, sort=False), method)()
+        if fill_value is not None:
+            grouped = grouped.fillna(fill_value)
+        df[other_columns] = grouped
+
+    return df
+
+
 # --- [(event_times, event_values), ...] --> DataFrame compatible with EventSamples. ---
 
 
@@ -458,3 +767,40 @@ def ensure_pd_iloc_key_returns_df(key: Any) -> Union[Iterable, slice]:
     else:
         key_ = [key]
     return key_
+
+
+def dataset_components(data: "BaseDataset") -> List[Any]:
+    """Get the data components of ``data``: the time series, static, and (if predictive) targets and treatments
+    samples, each of which may be `None`.
+
+    Args:
+        data (BaseDataset): The dataset.
+
+    Returns:
+        List[Any]: The data components.
+    """
+    components = [data.time_series, data.static]
+    if data.predictive is not None:
+        components.extend([data.predictive.targets, data.predictive.treatments])
+    return components
+
+
+def data_fingerprint(data: "BaseDataset") -> str:
+    """A hash of the content of ``data``: the class of the dataset, and the values, index and columns of each of its
+    data components.
+
+    Args:
+        data (BaseDataset): The dataset.
+
+    Returns:
+        str: The fingerprint (hex digest).
+    """
+    hasher = hashlib.sha256(data.__class__.__name__.encode())
+    for component in dataset_components(data):
+        if component is None:
+            hasher.update(b"None")
+            continue
+        df = component.dataframe()
+        hasher.update(repr(list(df.columns)).encode())
+        hasher.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return hasher.hexdigest()
@@ -2,9 +2,10 @@ import abc
 from typing import Any
 
 import pydantic
+from typing_extensions import Self
 
 from tempor.core import pydantic_utils
-from tempor.data import dataset
+from tempor.data import dataset, samples
 from tempor.log import logger
 
 from . import _base_estimator as estimator
@@ -21,7 +22,8 @@ class BaseTransformer(estimator.BaseEstimator):
         **kwargs: Any,
     ) -> Any:
         logger.debug(f"Calling _transform() implementation on {self.__class__.__name__}")
-        transformed_data = self._transform(data, *args, **kwargs)
+        with samples.internal_transform_scope():
+            transformed_data = self._transform(data, *args, **kwargs)
 
         return transformed_data
 
@@ -35,6 +37,38 @@ class BaseTransformer(estimator.BaseEstimator):
         self.fit(data, *args, **kwargs)
         return self.transform(data, *args, **kwargs)
 
+    @pydantic_utils.validate_arguments(config=pydantic.ConfigDict(arbitrary_types_allowed=True))
+    def partial_fit(
+        self,
+        data: dataset.BaseDataset,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Self:
+        """Incrementally fit the transformer on ``data``, one chunk (e.g. a shard) of the full dataset. Calling
+        ``partial_fit`` on each of the chunks in turn fits the transformer as ``fit`` on the full dataset would, while
+        only one chunk needs to be in memory at a time. Supported only by transformers which implement
+        ``_partial_fit``.
+
+        Args:
+            data (dataset.BaseDataset): A chunk of the dataset.
+
+        Returns:
+            Self: The transformer.
+        """
+        if not data.fit_ready:
+            raise ValueError(
+                f"The dataset was not fit-ready, check that all necessary data components are present:\n{data}"
+            )
+
+        logger.debug(f"Calling _partial_fit() implementation on {self.__class__.__name__}")
+        fitted_model = self._partial_fit(data, *args, **kwargs)
+
+        self._fitted = True
+        return fitted_model
+
+    def _partial_fit(self, data: dataset.BaseDataset, *args: Any, **kwargs: Any) -> Self:
+        raise NotImplementedError(f"`partial_fit` is not supported by {self.__class__.__name__}")
+
     @abc.abstractmethod
     def _transform(
         self, data: dataset.BaseDataset, *args: Any, **kwargs: Any
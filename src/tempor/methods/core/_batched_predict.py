@@ -0,0 +1,92 @@
+"""Batched, memory-bounded prediction: the samples of a dataset are streamed through a predictor in batches, so that
+only one batch's worth of model input is held in memory at any point, and the (small) per-batch outputs are written
+into one preallocated output buffer.
+"""
+
+from typing import Callable, Optional
+
+import numpy as np
+
+from tempor.data import dataset, samples
+
+FLOAT32_BYTES = 4
+
+
+def input_bytes_per_sample(data: dataset.PredictiveDataset) -> int:
+    """An upper bound on the memory taken by one sample of ``data`` in the ``float32`` model input: the time series
+    (with the observation times as an additional channel) padded to the longest sample, and the static features.
+
+    Args:
+        data (dataset.PredictiveDataset): The dataset.
+
+    Returns:
+        int: The number of bytes.
+    """
+    max_timesteps = max(data.time_series.num_timesteps(), default=0)
+    n_static_features = data.static.num_features if data.static is not None else 0
+    return FLOAT32_BYTES * (max_timesteps * (data.time_series.num_features + 1) + n_static_features)
+
+
+def resolve_batch_size(
+    data: dataset.PredictiveDataset, batch_size: Optional[int] = None, max_memory: Optional[int] = None
+) -> Optional[int]:
+    """Get the number of samples per prediction batch, given a ``batch_size`` and/or a ``max_memory`` budget. If both
+    are given, the smaller of the two batch sizes is used.
+
+    Args:
+        data (dataset.PredictiveDataset): The dataset to predict on.
+        batch_size (Optional[int], optional):
+            The maximum number of samples per batch. Defaults to `None`.
+        max_memory (Optional[int], optional):
+            The maximum memory, in bytes, of the model input of a batch, see :func:`input_bytes_per_sample`. At least
+            one sample is included in each batch. Defaults to `None`.
+
+    Returns:
+        Optional[int]: The batch size, or `None` to predict on all the samples at once.
+    """
+    if batch_size is not None and batch_size < 1:
+        raise ValueError(f"`batch_size` must be a positive integer or None, was {batch_size}")
+    if max_memory is not None:
+        if max_memory < 1:
+            raise ValueError(f"`max_memory` must be a positive integer or None, was {max_memory}")
+        memory_batch_size = max(1, max_memory // max(1, input_bytes_per_sample(data)))
+        batch_size = memory_batch_size if batch_size is None else min(batch_size, memory_batch_size)
+    return batch_size
+
+
+def predict_in_batches(
+    predict_batch: Callable[[dataset.PredictiveDataset], samples.StaticSamples],
+    data: dataset.PredictiveDataset,
+    batch_size: Optional[int],
+) -> samples.StaticSamples:
+    """Predict on ``data`` in batches of ``batch_size`` samples. The batches are lazy views of ``data`` (see
+    :meth:`~tempor.data.dataset.BaseDataset.__getitem__`), so only the data of the current batch is materialized.
+
+    The per-batch outputs of ``predict_batch`` must be indexed by position, as the outputs of the one-off predictors
+    are. The output of the full dataset has the same (positional) index as a non-batched prediction.
+
+    Args:
+        predict_batch (Callable[[dataset.PredictiveDataset], samples.StaticSamples]):
+            Prediction on one batch of samples.
+        data (dataset.PredictiveDataset):
+            The dataset to predict on.
+        batch_size (Optional[int]):
+            The number of samples per batch. If `None`, all the samples are predicted on at once.
+
+    Returns:
+        samples.StaticSamples: The predictions.
+    """
+    if batch_size is None or batch_size >= len(data):
+        return predict_batch(data)
+
+    output: Optional[np.ndarray] = None
+    feature_index = None
+    for start in range(0, len(data), batch_size):
+        batch_output = predict_batch(data[start : start + batch_size])
+        values = batch_output.numpy()
+        if output is None:
+            output = np.empty((len(data), *values.shape[1:]), dtype=values.dtype)
+            feature_index = list(batch_output.dataframe().columns)
+        output[start : start + len(values)] = values
+
+    return samples.StaticSamples.from_numpy(output, feature_index=feature_index)  # type: ignore [arg-type]
@@ -122,24 +122,38 @@ class PipelineBase:
         """
         raise NotImplementedError("Not implemented")
 
-    def predict(self, data: dataset.PredictiveDataset, *args: Any, **kwargs: Any) -> Any:  # pragma: no cover
+    def predict(
+        self, data: dataset.PredictiveDataset, *args: Any, chunk_size: Optional[int] = None, **kwargs: Any
+    ) -> Any:  # pragma: no cover
         """The pipeline version of the estimator ``predict`` method. Applicable if the final step of the pipeline has
         a ``predict`` method implemented.
 
         Args:
             data (dataset.PredictiveDataset): Input dataset.
+            chunk_size (Optional[int], optional):
+                If set, stream the dataset through the pipeline ``chunk_size`` samples at a time and concatenate the
+                per-chunk outputs. Peak memory is then bounded by the chunk size rather than by the number of
+                transformer steps times the dataset size. If `None`, process the whole dataset at once.
+                Defaults to None.
 
         Returns:
             Any: the same return type as the final step of the pipeline.
         """
         raise NotImplementedError("Not implemented")
 
-    def predict_proba(self, data: dataset.PredictiveDataset, *args: Any, **kwargs: Any) -> Any:  # pragma: no cover
+    def predict_proba(
+        self, data: dataset.PredictiveDataset, *args: Any, chunk_size: Optional[int] = None, **kwargs: Any
+    ) -> Any:  # pragma: no cover
         """The pipeline version of the estimator ``predict_proba`` method. Applicable if the final step of the pipeline
         has a ``predict_proba`` method implemented.
 
         Args:
             data (dataset.PredictiveDataset): Input dataset.
+            chunk_size (Optional[int], optional):
+                If set, stream the dataset through the pipeline ``chunk_size`` samples at a time and concatenate the
+                per-chunk outputs. Peak memory is then bounded by the chunk size rather than by the number of
+                transformer steps times the dataset size. If `None`, process the whole dataset at once.
+                Defaults to None.
 
         Returns:
             Any: the same return type as the final step of the pipeline.
@@ -147,13 +161,19 @@ class PipelineBase:
         raise NotImplementedError("Not implemented")
 
     def predict_counterfactuals(
-        self, data: dataset.PredictiveDataset, *args: Any, **kwargs: Any
+        self, data: dataset.PredictiveDataset, *args: Any, chunk_size: Optional[int] = None, **kwargs: Any
     ) -> Any:  # pragma: no cover
         """The pipeline version of the estimator ``predict_counterfactuals`` method. Applicable if the final step of
         the pipeline has a ``predict_counterfactuals`` method implemented.
 
         Args:
             data (dataset.PredictiveDataset): Input dataset.
+            chunk_size (Optional[int], optional):
+                If set, stream the dataset through the pipeline ``chunk_size`` samples at a time and concatenate the
+                per-chunk outputs. Peak memory is then bounded by the chunk size rather than by the number of
+                transformer steps times the dataset size. Sequence arguments with one entry per sample (e.g.
+                ``horizons``, ``treatment_scenarios``) are sliced to match each chunk. If `None`, process the whole
+                dataset at once. Defaults to None.
 
         Returns:
             Any: the same return type as the final step of the pipeline.
@@ -1,6 +1,11 @@
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Type
 
-from tempor.data import dataset
+import numpy as np
+import pandas as pd
+
+from tempor.data import dataset, samples
+
+from . import prefix_cache
 
 if TYPE_CHECKING:  # pragma: no cover
     from tempor.methods.core import Params
@@ -80,8 +85,15 @@ def _generate_constructor() -> Callable:
 def _generate_fit() -> Callable:
     def fit_impl(self: Any, data: dataset.BaseDataset, *args: Any, **kwargs: Any) -> Any:
         local_X = data
-        for stage in self.stages[:-1]:
-            local_X = stage.fit_transform(local_X)
+        cache = prefix_cache.get_active_prefix_cache()
+        if cache is not None:
+            transformers = self.stages[:-1]
+            local_X, self._prefix_cache_keys = cache.fit_transform(transformers, local_X)
+            self.stages[:-1] = transformers
+        else:
+            self._prefix_cache_keys = None
+            for stage in self.stages[:-1]:
+                local_X = stage.fit_transform(local_X)
 
         self.stages[-1].fit(local_X, *args, **kwargs)
 
@@ -90,35 +102,117 @@ def _generate_fit() -> Callable:
     return fit_impl
 
 
+def _transform_prefix(self: Any, data: dataset.BaseDataset, *args: Any, **kwargs: Any) -> Any:
+    # Transform the data with the transformer steps, reusing the cached outputs if the pipeline was fitted with an
+    # active prefix cache (only applicable if there are no additional transform arguments).
+    cache = prefix_cache.get_active_prefix_cache()
+    keys = getattr(self, "_prefix_cache_keys", None)
+    if cache is not None and keys is not None and not args and not kwargs:
+        return cache.transform(self.stages[:-1], keys, data)
+    for stage in self.stages[:-1]:
+        data = stage.transform(data, *args, **kwargs)
+    return data
+
+
+def _concatenate_samples(outputs: List[samples.DataSamples], chunk_slices: List[slice]) -> samples.DataSamples:
+    # Many predictors index their outputs by position (0, 1, ...) rather than by the input sample IDs. In that case,
+    # shift each chunk's index by the chunk's start position to get the same index as a non-chunked prediction.
+    positional = all(list(o.sample_index()) == list(range(len(o))) for o in outputs)
+    dfs = []
+    for output, chunk_slice in zip(outputs, chunk_slices):
+        df = output.dataframe()
+        if positional and chunk_slice.start:
+            offset = chunk_slice.start
+            if isinstance(df.index, pd.MultiIndex):
+                df = df.set_axis(df.index.set_levels(df.index.levels[0] + offset, level=0), axis=0)
+            else:
+                df = df.set_axis(df.index + offset, axis=0)
+        dfs.append(df)
+    return outputs[0].__class__.from_dataframe(pd.concat(dfs, axis=0))
+
+
+def _concatenate_outputs(outputs: List[Any], chunk_slices: List[slice]) -> Any:
+    first = outputs[0]
+    if isinstance(first, samples.DataSamples):
+        return _concatenate_samples(outputs, chunk_slices)
+    elif isinstance(first, np.ndarray):
+        return np.concatenate(outputs, axis=0)
+    elif isinstance(first, list):
+        return [item for o in outputs for item in o]
+    else:
+        raise TypeError(f"Chunked prediction does not support outputs of type {type(first)}")
+
+
+def _predict_in_chunks(
+    predict_chunk: Callable[[dataset.PredictiveDataset, slice], Any],
+    data: dataset.PredictiveDataset,
+    chunk_size: Optional[int],
+) -> Any:
+    # Stream the samples of `data` through the pipeline `chunk_size` samples at a time, so that only one chunk's worth
+    # of transformed data is held in memory at any point. Only the (small) per-chunk outputs are collected.
+    # `predict_chunk` receives the chunk and the slice of sample positions it covers.
+    if chunk_size is None:
+        return predict_chunk(data, slice(None))
+    if chunk_size < 1:
+        raise ValueError(f"`chunk_size` must be a positive integer or None, was {chunk_size}")
+    if len(data) == 0:
+        # No chunks to concatenate: predict on the empty dataset directly, so that the output type is the same as in
+        # the non-chunked case.
+        return predict_chunk(data, slice(None))
+
+    outputs = []
+    chunk_slices = [slice(start, start + chunk_size) for start in range(0, len(data), chunk_size)]
+    for chunk_slice in chunk_slices:
+        outputs.append(predict_chunk(data[chunk_slice], chunk_slice))
+    return _concatenate_outputs(outputs, chunk_slices)
+
+
+def _slice_per_sample_argument(value: Any, n_samples: int, chunk_slice: slice) -> Any:
+    # Arguments given as a sequence with one entry per sample (e.g. counterfactual `horizons`) follow the data chunk.
+    if isinstance(value, (list, tuple)) and len(value) == n_samples:
+        return value[chunk_slice]
+    return value
+
+
 def _generate_predict() -> Callable:
-    def predict_impl(self: Any, data: dataset.PredictiveDataset, *args: Any, **kwargs: Any) -> Any:
-        local_X = data
-        for stage in self.stages[:-1]:
-            local_X = stage.transform(local_X)
+    def predict_impl(
+        self: Any, data: dataset.PredictiveDataset, *args: Any, chunk_size: Optional[int] = None, **kwargs: Any
+    ) -> Any:
+        def predict_chunk(local_X: dataset.PredictiveDataset, _: slice) -> Any:
+            local_X = _transform_prefix(self, local_X)
+            return self.stages[-1].predict(local_X, *args, **kwargs)
 
-        return self.stages[-1].predict(local_X, *args, **kwargs)
+        return _predict_in_chunks(predict_chunk, data, chunk_size)
 
     return predict_impl
 
 
 def _generate_predict_proba() -> Callable:
-    def predict_proba_impl(self: Any, data: dataset.PredictiveDataset, *args: Any, **kwargs: Any) -> Any:
-        local_X = data
-        for stage in self.stages[:-1]:
-            local_X = stage.transform(local_X, *args, **kwargs)
+    def predict_proba_impl(
+        self: Any, data: dataset.PredictiveDataset, *args: Any, chunk_size: Optional[int] = None, **kwargs: Any
+    ) -> Any:
+        def predict_chunk(local_X: dataset.PredictiveDataset, _: slice) -> Any:
+            local_X = _transform_prefix(self, local_X)
+            return self.stages[-1].predict_proba(local_X, *args, **kwargs)
 
-        return self.stages[-1].predict_proba(local_X)
+        return _predict_in_chunks(predict_chunk, data, chunk_size)
 
     return predict_proba_impl
 
 
 def _generate_predict_counterfactuals() -> Callable:
-    def predict_counterfactuals_impl(self: Any, data: dataset.PredictiveDataset, *args: Any, **kwargs: Any) -> Any:
-        local_X = data
-        for stage in self.stages[:-1]:
-            local_X = stage.transform(local_X, *args, **kwargs)
-
-        return self.stages[-1].predict_counterfactuals(local_X, *args, **kwargs)
+    def predict_counterfactuals_impl(
+        self: Any, data: dataset.PredictiveDataset, *args: Any, chunk_size: Optional[int] = None, **kwargs: Any
+    ) -> Any:
+        n_samples = len(data)
+
+        def predict_chunk(local_X: dataset.PredictiveDataset, chunk_slice: slice) -> Any:
+            chunk_args = [_slice_per_sample_argument(a, n_samples, chunk_slice) for a in args]
+            chunk_kwargs = {k: _slice_per_sample_argument(v, n_samples, chunk_slice) for k, v in kwargs.items()}
+            local_X = _transform_prefix(self, local_X, *chunk_args, **chunk_kwargs)
+            return self.stages[-1].predict_counterfactuals(local_X, *chunk_args, **chunk_kwargs)
+
+        return _predict_in_chunks(predict_chunk, data, chunk_size)
 
     return predict_counterfactuals_impl
 
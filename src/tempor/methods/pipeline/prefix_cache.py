@@ -0,0 +1,157 @@
+"""A cache of fitted pipeline transformer prefixes, for reuse across pipelines which share the same preprocessing
+steps, e.g. across the trials of an AutoML pipeline search.
+"""
+
+import collections
+import contextlib
+import copy
+import hashlib
+import json
+from typing import Any, Generator, List, Optional, Tuple
+
+import omegaconf
+
+from tempor.data import dataset
+from tempor.data.utils import data_fingerprint, dataset_components
+from tempor.log import logger
+
+_ACTIVE_PREFIX_CACHE: Optional["PrefixCache"] = None
+
+
+def _data_nbytes(data: dataset.BaseDataset) -> int:
+    return sum(
+        int(component.dataframe().memory_usage(deep=True).sum())
+        for component in dataset_components(data)
+        if component is not None
+    )
+
+
+def _chain_key(previous_key: str, *parts: Any) -> str:
+    hasher = hashlib.sha256(previous_key.encode())
+    for part in parts:
+        hasher.update(json.dumps(part, sort_keys=True, default=str).encode())
+    return hasher.hexdigest()
+
+
+def _step_params(stage: Any) -> Any:
+    return omegaconf.OmegaConf.to_container(stage.params)
+
+
+class PrefixCache:
+    def __init__(self, max_bytes: int) -> None:
+        """A least-recently-used cache of fitted pipeline transformer steps and their output data, keyed by content:
+        by the fingerprint of the pipeline's input data (see :func:`data_fingerprint`), and the chain of names and
+        parameters of the steps up to and including the cached one. Pipelines (fitted while the cache is active, see
+        :func:`prefix_cache_scope`) which start with the same steps, fitted on the same data, then fit the shared
+        prefix once, and likewise transform the same data with it once.
+
+        Entries are stored and returned as copies, as the transformers may modify the data in place.
+
+        Args:
+            max_bytes (int):
+                The memory budget of the cache, in bytes of cached data. Least recently used entries are evicted
+                once the budget is exceeded.
+        """
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._cache: "collections.OrderedDict[str, Tuple[Any, int]]" = collections.OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._cache.get(key, None)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._cache.move_to_end(key)
+        return copy.deepcopy(entry[0])
+
+    def put(self, key: str, value: Any, nbytes: int) -> None:
+        if nbytes > self.max_bytes:
+            return
+        if key in self._cache:
+            self.nbytes -= self._cache.pop(key)[1]
+        self._cache[key] = (copy.deepcopy(value), nbytes)
+        self.nbytes += nbytes
+        while self.nbytes > self.max_bytes:
+            _, (_, evicted_nbytes) = self._cache.popitem(last=False)
+            self.nbytes -= evicted_nbytes
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self.nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def fit_transform(self, stages: List[Any], data: dataset.BaseDataset) -> Tuple[dataset.BaseDataset, List[str]]:
+        """Fit and transform ``data`` with each of the transformer ``stages`` in turn, reusing cached fitted steps.
+        The ``stages`` list is updated in place with the fitted (possibly cached) transformers.
+
+        Args:
+            stages (List[Any]): The transformer steps of the pipeline.
+            data (dataset.BaseDataset): The input data.
+
+        Returns:
+            Tuple[dataset.BaseDataset, List[str]]: The transformed data and the cache key of each fitted step.
+        """
+        key = data_fingerprint(data)
+        keys = []
+        for idx, stage in enumerate(stages):
+            key = _chain_key(key, stage.full_name(), _step_params(stage))
+            entry = self.get(key)
+            if entry is None:
+                data = stage.fit_transform(data)
+                self.put(key, (stage, data), _data_nbytes(data))
+            else:
+                logger.debug(f"Reusing cached fitted pipeline step {stage.name}")
+                stages[idx], data = entry
+            keys.append(key)
+        return data, keys
+
+    def transform(self, stages: List[Any], step_keys: List[str], data: dataset.BaseDataset) -> dataset.BaseDataset:
+        """Transform ``data`` with each of the fitted transformer ``stages`` in turn, reusing cached outputs.
+
+        Args:
+            stages (List[Any]): The fitted transformer steps of the pipeline.
+            step_keys (List[str]): The cache keys of the fitted steps, as returned by ``fit_transform``.
+            data (dataset.BaseDataset): The input data.
+
+        Returns:
+            dataset.BaseDataset: The transformed data.
+        """
+        key = data_fingerprint(data)
+        for stage, step_key in zip(stages, step_keys):
+            key = _chain_key(key, "transform", step_key)
+            cached = self.get(key)
+            if cached is None:
+                data = stage.transform(data)
+                self.put(key, data, _data_nbytes(data))
+            else:
+                data = cached
+        return data
+
+
+@contextlib.contextmanager
+def prefix_cache_scope(max_bytes: int) -> Generator:
+    """A context manager inside which pipelines share a :class:`PrefixCache` of fitted transformer steps.
+
+    Args:
+        max_bytes (int): The memory budget of the cache, see :class:`PrefixCache`.
+
+    Yields:
+        PrefixCache: The active cache.
+    """
+    global _ACTIVE_PREFIX_CACHE  # pylint: disable=global-statement
+    previous = _ACTIVE_PREFIX_CACHE
+    _ACTIVE_PREFIX_CACHE = PrefixCache(max_bytes)
+    try:
+        yield _ACTIVE_PREFIX_CACHE
+    finally:
+        _ACTIVE_PREFIX_CACHE = previous
+
+
+def get_active_prefix_cache() -> Optional[PrefixCache]:
+    """Get the :class:`PrefixCache` of the current :func:`prefix_cache_scope`, if any."""
+    return _ACTIVE_PREFIX_CACHE
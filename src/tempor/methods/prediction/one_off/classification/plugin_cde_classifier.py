@@ -10,7 +10,7 @@ from tempor.methods.core import Params
 from tempor.methods.core._params import CategoricalParams, FloatParams, IntegerParams
 from tempor.methods.prediction.one_off.classification import BaseOneOffClassifier
 from tempor.models import utils as model_utils
-from tempor.models.constants import Nonlin, Samp
+from tempor.models.constants import Batching, Nonlin, Samp
 from tempor.models.ts_ode import Interpolation, NeuralODE
 
 
@@ -54,6 +54,9 @@ class CDEClassifierParams:
     """Gradients clipping value."""
     train_ratio: float = 0.8
     """Train/test split ratio."""
+    batching: Batching = "exact_length"
+    """How to batch samples of different sequence lengths: in buckets of exactly equal lengths, or padded in buckets of
+    similar lengths. Available options: :obj:`~tempor.models.constants.Batching`."""
     device: Optional[str] = None
     """String representing PyTorch device. If `None`, `~tempor.models.constants.DEVICE`."""
     dataloader_sampler: Optional[Samp] = None
@@ -112,7 +115,7 @@ class CDEClassifier(BaseOneOffClassifier):
         self.model = NeuralODE(
             task_type="classification",
             n_static_units_in=static.shape[-1],
-            n_temporal_units_in=temporal.shape[-1],
+            n_temporal_units_in=temporal.num_features,
             output_shape=[n_classes],
             n_units_hidden=self.params.n_units_hidden,
             n_layers_hidden=self.params.n_layers_hidden,
@@ -135,6 +138,7 @@ class CDEClassifier(BaseOneOffClassifier):
             clipping_value=self.params.clipping_value,
             patience=self.params.patience,
             train_ratio=self.params.train_ratio,
+            batching=self.params.batching,
         )
 
         self.model.fit(static, temporal, observation_times, outcome)
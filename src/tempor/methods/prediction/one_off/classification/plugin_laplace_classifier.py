@@ -116,7 +116,7 @@ class LaplaceODEClassifier(BaseOneOffClassifier):
         self.model = NeuralODE(
             task_type="classification",
             n_static_units_in=static.shape[-1],
-            n_temporal_units_in=temporal.shape[-1],
+            n_temporal_units_in=temporal.num_features,
             output_shape=[n_classes],
             n_units_hidden=self.params.n_units_hidden,
             n_layers_hidden=self.params.n_layers_hidden,
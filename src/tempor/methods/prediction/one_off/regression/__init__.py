@@ -1,5 +1,5 @@
 import abc
-from typing import Any, Tuple
+from typing import Any, Optional, Tuple
 
 import numpy as np
 import pydantic
@@ -8,6 +8,7 @@ from typing_extensions import Self
 import tempor.methods.core as methods_core
 from tempor.core import plugins, pydantic_utils
 from tempor.data import dataset, samples
+from tempor.methods.core import _batched_predict
 
 
 def check_data_class(data: Any) -> None:
@@ -32,10 +33,33 @@ class BaseOneOffRegressor(methods_core.BasePredictor):
         self,
         data: dataset.PredictiveDataset,
         *args: Any,
+        batch_size: Optional[int] = None,
+        max_memory: Optional[int] = None,
         **kwargs: Any,
     ) -> samples.StaticSamples:
+        """Predict on ``data``, optionally in batches of samples streamed through the model one at a time, with the
+        outputs written into one preallocated buffer.
+
+        Args:
+            data (dataset.PredictiveDataset):
+                The dataset to predict on.
+            batch_size (Optional[int], optional):
+                The maximum number of samples per batch. Defaults to `None`.
+            max_memory (Optional[int], optional):
+                The maximum memory, in bytes, of the model input of a batch. If both ``batch_size`` and
+                ``max_memory`` are `None`, all the samples are predicted on at once. Defaults to `None`.
+
+        Returns:
+            samples.StaticSamples: The predictions.
+        """
         check_data_class(data)
-        return super().predict(data, *args, **kwargs)
+        base_predict = super().predict
+
+        def predict_batch(batch: dataset.PredictiveDataset) -> samples.StaticSamples:
+            return base_predict(batch, *args, **kwargs)
+
+        batch_size = _batched_predict.resolve_batch_size(data, batch_size, max_memory)
+        return _batched_predict.predict_in_batches(predict_batch, data, batch_size)
 
     @abc.abstractmethod
     def _predict(
@@ -44,8 +68,9 @@ class BaseOneOffRegressor(methods_core.BasePredictor):
         ...
 
     def _unpack_dataset(self, data: dataset.BaseDataset) -> Tuple:
-        temporal = data.time_series.numpy()
-        observation_times = data.time_series.time_indexes()
+        # The samples' values buffer, which the models gather their input batches from without padding the whole data.
+        temporal = data.time_series.as_ragged()
+        observation_times = data.time_series.time_indexes_float()
         if data.predictive is not None and data.predictive.targets is not None:
             outcome = data.predictive.targets.numpy()
         else:
@@ -9,7 +9,7 @@ from tempor.methods.core import Params
 from tempor.methods.core._params import CategoricalParams, FloatParams, IntegerParams
 from tempor.methods.prediction.one_off.regression import BaseOneOffRegressor
 from tempor.models import utils as model_utils
-from tempor.models.constants import Nonlin, Samp
+from tempor.models.constants import Batching, Nonlin, Samp
 from tempor.models.ts_ode import Interpolation, NeuralODE
 
 
@@ -53,6 +53,9 @@ class CDERegressorParams:
     """Gradients clipping value."""
     train_ratio: float = 0.8
     """Train/test split ratio."""
+    batching: Batching = "exact_length"
+    """How to batch samples of different sequence lengths: in buckets of exactly equal lengths, or padded in buckets of
+    similar lengths. Available options: :obj:`~tempor.models.constants.Batching`."""
     device: Optional[str] = None
     """String representing PyTorch device. If `None`, `~tempor.models.constants.DEVICE`."""
     dataloader_sampler: Optional[Samp] = None
@@ -109,7 +112,7 @@ class CDERegressor(BaseOneOffRegressor):
         self.model = NeuralODE(
             task_type="regression",
             n_static_units_in=static.shape[-1],
-            n_temporal_units_in=temporal.shape[-1],
+            n_temporal_units_in=temporal.num_features,
             output_shape=[1],
             n_units_hidden=self.params.n_units_hidden,
             n_layers_hidden=self.params.n_layers_hidden,
@@ -132,6 +135,7 @@ class CDERegressor(BaseOneOffRegressor):
             clipping_value=self.params.clipping_value,
             patience=self.params.patience,
             train_ratio=self.params.train_ratio,
+            batching=self.params.batching,
         )
 
         self.model.fit(static, temporal, observation_times, outcome)
@@ -113,7 +113,7 @@ class LaplaceODERegressor(BaseOneOffRegressor):
         self.model = NeuralODE(
             task_type="regression",
             n_static_units_in=static.shape[-1],
-            n_temporal_units_in=temporal.shape[-1],
+            n_temporal_units_in=temporal.num_features,
             output_shape=[1],
             n_units_hidden=self.params.n_units_hidden,
             n_layers_hidden=self.params.n_layers_hidden,
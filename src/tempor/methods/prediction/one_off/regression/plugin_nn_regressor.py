@@ -9,7 +9,7 @@ from tempor.methods.core import Params
 from tempor.methods.core._params import CategoricalParams, FloatParams, IntegerParams
 from tempor.methods.prediction.one_off.regression import BaseOneOffRegressor
 from tempor.models import utils as model_utils
-from tempor.models.constants import Nonlin, Samp
+from tempor.models.constants import Batching, ExecutionMode, Nonlin, Samp
 from tempor.models.ts_model import TimeSeriesModel, TSModelMode
 
 
@@ -55,6 +55,12 @@ class NeuralNetRegressorParams:
     """How many ``epoch * n_iter_print`` to wait without loss improvement."""
     train_ratio: float = 0.8
     """Train/test split ratio."""
+    execution_mode: ExecutionMode = "eager"
+    """Execution mode of the model (``torch.compile`` and/or bfloat16 mixed precision). Available options:
+    :obj:`~tempor.models.constants.ExecutionMode`."""
+    batching: Batching = "exact_length"
+    """How to batch samples of different sequence lengths: in buckets of exactly equal lengths, or padded in buckets of
+    similar lengths. Available options: :obj:`~tempor.models.constants.Batching`."""
 
 
 @plugins.register_plugin(name="nn_regressor", category="prediction.one_off.regression")
@@ -103,8 +109,8 @@ class NeuralNetRegressor(BaseOneOffRegressor):
         self.model = TimeSeriesModel(
             task_type="regression",
             n_static_units_in=static.shape[-1],
-            n_temporal_units_in=temporal.shape[-1],
-            n_temporal_window=temporal.shape[1],
+            n_temporal_units_in=temporal.num_features,
+            n_temporal_window=int(temporal.lengths.max()),
             output_shape=[1],
             n_static_units_hidden=self.params.n_static_units_hidden,
             n_static_layers_hidden=self.params.n_static_layers_hidden,
@@ -125,6 +131,8 @@ class NeuralNetRegressor(BaseOneOffRegressor):
             clipping_value=self.params.clipping_value,
             patience=self.params.patience,
             train_ratio=self.params.train_ratio,
+            execution_mode=self.params.execution_mode,
+            batching=self.params.batching,
         )
 
         if TYPE_CHECKING:  # pragma: no cover
@@ -1,4 +1,8 @@
-from typing import Any
+from typing import Any, Dict
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import OneHotEncoder
 
 import tempor.methods.core as methods_core
 
@@ -6,3 +10,36 @@ import tempor.methods.core as methods_core
 class BaseEncoder(methods_core.BaseTransformer):
     def __init__(self, **params: Any) -> None:  # pylint: disable=useless-super-delegation
         super().__init__(**params)
+
+
+def partial_fit_onehot_encoder(model: OneHotEncoder, df: pd.DataFrame) -> None:
+    """Incrementally fit the `sklearn.preprocessing.OneHotEncoder` ``model`` on the data chunk ``df``.
+
+    With ``categories="auto"``, the categories of each feature are accumulated as the union of the categories already
+    fitted (if any) and those found in ``df``, and ``model`` is refitted on a compact dataframe containing only these
+    categories. The fitted categories are thus the same as when fitting on all the chunks at once. Infrequent category
+    handling (``min_frequency``, ``max_categories``) requires the category counts over all the data, and is therefore
+    not supported.
+
+    Args:
+        model (OneHotEncoder): The encoder to fit.
+        df (pd.DataFrame): The data chunk, containing the features to encode.
+    """
+    if getattr(model, "min_frequency", None) is not None or getattr(model, "max_categories", None) is not None:
+        raise ValueError("`partial_fit` does not support `min_frequency` or `max_categories`")
+    if not (isinstance(model.categories, str) and model.categories == "auto"):
+        # Categories are given, nothing to accumulate.
+        model.fit(df)
+        return
+    if len(df) == 0:
+        return
+
+    fitted_categories = getattr(model, "categories_", None)
+    categories: Dict[Any, np.ndarray] = dict()
+    for idx, feature in enumerate(df.columns):
+        values = pd.unique(df[feature].to_numpy())
+        if fitted_categories is not None:
+            values = pd.unique(np.concatenate([fitted_categories[idx], values]))
+        categories[feature] = values
+    max_num_categories = max(len(values) for values in categories.values())
+    model.fit(pd.DataFrame({f: np.resize(values, max_num_categories) for f, values in categories.items()}))
@@ -13,7 +13,7 @@ from tempor.data.data_typing import FeatureIndex
 from tempor.data.samples import StaticSamples
 from tempor.methods.core import Params
 from tempor.methods.core._params import CategoricalParams, FloatParams
-from tempor.methods.preprocessing.encoding._base import BaseEncoder
+from tempor.methods.preprocessing.encoding._base import BaseEncoder, partial_fit_onehot_encoder
 
 # TODO: Handle SklearnArrayLike rather than just list, requires dropping OmegaConf stuff.
 # TODO: Remember the column positions - esp. relevant for when inverse_transform is introduced.
@@ -127,6 +127,22 @@ class StaticOneHotEncoder(BaseEncoder):
         self.model.fit(df_to_use)
         return self
 
+    def _partial_fit(
+        self,
+        data: dataset.BaseDataset,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Self:
+        if data.static is None:
+            return self
+
+        df_to_use = data.static.dataframe()
+        if self.features is None:
+            self.features = df_to_use.columns.tolist()
+
+        partial_fit_onehot_encoder(self.model, df_to_use[self.features])
+        return self
+
     def _transform(self, data: dataset.BaseDataset, *args: Any, **kwargs: Any) -> dataset.BaseDataset:
         if data.static is None:
             return data
@@ -13,7 +13,7 @@ from tempor.data.data_typing import FeatureIndex
 from tempor.data.samples import TimeSeriesSamples
 from tempor.methods.core import Params
 from tempor.methods.core._params import CategoricalParams, FloatParams
-from tempor.methods.preprocessing.encoding._base import BaseEncoder
+from tempor.methods.preprocessing.encoding._base import BaseEncoder, partial_fit_onehot_encoder
 
 # TODO: Factor out code for applying sklearn transformer to arbitrary subset of columns.
 
@@ -122,6 +122,19 @@ class TimeSeriesOneHotEncoder(BaseEncoder):
         self.model.fit(df_to_use)
         return self
 
+    def _partial_fit(
+        self,
+        data: dataset.BaseDataset,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Self:
+        df_to_use = data.time_series.dataframe()
+        if self.features is None:
+            self.features = df_to_use.columns.tolist()
+
+        partial_fit_onehot_encoder(self.model, df_to_use[self.features])
+        return self
+
     def _transform(self, data: dataset.BaseDataset, *args: Any, **kwargs: Any) -> dataset.BaseDataset:
         df_to_encode = data.time_series.dataframe()[self.features]
         encoded_arr = self.model.transform(df_to_encode)  # pyright: ignore
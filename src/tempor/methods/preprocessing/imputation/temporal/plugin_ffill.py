@@ -3,7 +3,7 @@ from typing import Any, List
 from typing_extensions import Self
 
 from tempor.core import plugins
-from tempor.data import dataset
+from tempor.data import dataset, utils
 from tempor.data.samples import TimeSeriesSamples
 from tempor.methods.core import Params
 from tempor.methods.preprocessing.imputation._base import BaseImputer
@@ -45,13 +45,10 @@ class FFillImputer(BaseImputer):
         return self
 
     def _transform(self, data: dataset.BaseDataset, *args: Any, **kwargs: Any) -> dataset.BaseDataset:
-        # Impute temporal data.
-        sample_ts_index = data.time_series.sample_index()
-        imputed_ts = data.time_series.dataframe()
-        for idx in sample_ts_index:
-            imputed_ts.loc[(idx, slice(None)), :] = imputed_ts.loc[(idx, slice(None)), :].ffill()  # pyright: ignore
-            imputed_ts.loc[(idx, slice(None)), :] = imputed_ts.loc[(idx, slice(None)), :].bfill()  # pyright: ignore
-            imputed_ts.loc[(idx, slice(None)), :] = imputed_ts.loc[(idx, slice(None)), :].fillna(0.0)  # pyright: ignore
+        # Impute temporal data, all samples at once.
+        imputed_ts = utils.multiindex_timeseries_dataframe_fill_per_sample(
+            data.time_series.dataframe(), methods=("ffill", "bfill"), fill_value=0.0
+        )
         data.time_series = TimeSeriesSamples.from_dataframe(imputed_ts)
         return data
 
@@ -72,6 +72,18 @@ class StaticMinMaxScaler(BaseScaler):
         self.model.fit(data.static.dataframe())
         return self
 
+    def _partial_fit(
+        self,
+        data: dataset.BaseDataset,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Self:
+        if data.static is None:
+            return self
+
+        self.model.partial_fit(data.static.dataframe())
+        return self
+
     def _transform(self, data: dataset.BaseDataset, *args: Any, **kwargs: Any) -> dataset.BaseDataset:
         if data.static is None:
             return data
@@ -66,6 +66,15 @@ class TimeSeriesStandardScaler(BaseScaler):
         self.model.fit(data.time_series.dataframe())
         return self
 
+    def _partial_fit(
+        self,
+        data: dataset.BaseDataset,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Self:
+        self.model.partial_fit(data.time_series.dataframe())
+        return self
+
     def _transform(self, data: dataset.BaseDataset, *args: Any, **kwargs: Any) -> dataset.BaseDataset:
         temporal_data = data.time_series.dataframe()
         scaled = pd.DataFrame(self.model.transform(temporal_data))
@@ -1,5 +1,9 @@
 import abc
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple, cast
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union, cast
 
 import numpy as np
 import pandas as pd
@@ -7,10 +11,13 @@ from typing_extensions import Self
 
 import tempor.exc
 from tempor.data import data_typing, dataset, samples
+from tempor.data.ragged import RaggedTimeSeries
+from tempor.data.utils import data_fingerprint, datetime_time_index_to_float
 from tempor.methods.core import Params
 from tempor.methods.core._params import CategoricalParams, FloatParams, IntegerParams
 from tempor.models import utils
 from tempor.models.ddh import DynamicDeepHitModel, output_modes, rnn_modes
+from tempor.utils import serialization
 
 
 class OutputTimeToEventAnalysis:
@@ -23,6 +30,69 @@ class OutputTimeToEventAnalysis:
         ...
 
 
+class DDHEmbeddingCache:
+    def __init__(self, cache_dir: Union[str, Path]) -> None:
+        """A cache of fitted :class:`tempor.models.ddh.DynamicDeepHitModel` embedding models, persisted to
+        ``cache_dir``. Entries are keyed by the fingerprint of the training data (see
+        :func:`~tempor.data.utils.data_fingerprint`) and the hyperparameters of the embedding model,
+        including its random seed, and also hold the embeddings of the training data. Models which only differ in their
+        output model (e.g. the AutoML trials of ``ts_xgb`` or ``ts_coxph`` which only vary the XGB/CoxPH
+        hyperparameters) then train the embedding model once, and fit their output models on the same embeddings.
+
+        Args:
+            cache_dir (Union[str, Path]): The directory to persist the cache entries to, created if needed.
+        """
+        self.cache_dir = Path(cache_dir)
+
+    @staticmethod
+    def key(data: dataset.BaseDataset, emb_model: DynamicDeepHitModel) -> str:
+        """The cache key of ``emb_model`` fitted on ``data``.
+
+        Args:
+            data (dataset.BaseDataset): The training data.
+            emb_model (DynamicDeepHitModel): The (not yet fitted) embedding model.
+
+        Returns:
+            str: The key (hex digest).
+        """
+        hyperparameters = {k: v for k, v in vars(emb_model).items() if k not in ("model", "best_epoch")}
+        hasher = hashlib.sha256(data_fingerprint(data).encode())
+        hasher.update(json.dumps(hyperparameters, sort_keys=True, default=str).encode())
+        return hasher.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"ddh_embedding_{key}.pkl"
+
+    def load(self, key: str) -> Optional[Tuple[DynamicDeepHitModel, np.ndarray]]:
+        """Load the fitted embedding model and the training data embeddings cached at ``key``, if any.
+
+        Args:
+            key (str): The cache key, see :meth:`key`.
+
+        Returns:
+            Optional[Tuple[DynamicDeepHitModel, np.ndarray]]: The fitted model and embeddings, or `None`.
+        """
+        path = self._path(key)
+        if not path.exists():
+            return None
+        entry = serialization.load_from_file(path)
+        return entry["emb_model"], entry["embeddings"]
+
+    def save(self, key: str, emb_model: DynamicDeepHitModel, embeddings: np.ndarray) -> None:
+        """Persist the fitted embedding model and the training data embeddings at ``key``. The entry is written to a
+        temporary file first, so that concurrent readers never see a partially written entry.
+
+        Args:
+            key (str): The cache key, see :meth:`key`.
+            emb_model (DynamicDeepHitModel): The fitted embedding model.
+            embeddings (np.ndarray): The embeddings of the training data.
+        """
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        serialization.save_to_file(tmp_path, {"emb_model": emb_model, "embeddings": embeddings})
+        os.replace(tmp_path, path)
+
+
 class DDHEmbedding:
     def __init__(self, emb_model: DynamicDeepHitModel) -> None:
         """Survival analysis embedding creation for time-series with :class:`tempor.models.ddh.DynamicDeepHitModel`.
@@ -36,27 +106,26 @@ class DDHEmbedding:
     def _merge_data(
         self,
         static: Optional[np.ndarray],
-        temporal: List[np.ndarray],
-        observation_times: List[np.ndarray],
+        temporal: RaggedTimeSeries,
+        observation_times: np.ndarray,
     ) -> np.ndarray:
+        # Build the NaN-padded ``(sample, timestep, temporal + static features + observation time)`` model input
+        # directly: the rows of the values buffer and the observation times are scattered to the observed steps with a
+        # boolean mask (whose row-major order is the order of the rows in the buffer), and the static features are
+        # broadcast over the timesteps.
         if static is None:
-            static = np.zeros((len(temporal), 0))
-
-        merged = []
-        for idx, item in enumerate(temporal):  # pylint: disable=unused-variable
-            local_static = static[idx].reshape(1, -1)
-            local_static = np.repeat(local_static, len(temporal[idx]), axis=0)
-            tst = np.concatenate(
-                [
-                    temporal[idx],
-                    local_static,
-                    np.asarray(observation_times[idx]).reshape(-1, 1),
-                ],
-                axis=1,
-            )
-            merged.append(tst)
+            static = np.zeros((temporal.num_samples, 0))
+
+        lengths = temporal.lengths
+        n_temporal, n_static = temporal.num_features, static.shape[1]
+        observed = np.arange(lengths.max(initial=0))[None, :] < lengths[:, None]
 
-        return np.array(merged, dtype=object)
+        merged = np.empty((*observed.shape, n_temporal + n_static + 1), dtype=np.float32)
+        merged[:, :, n_temporal:-1] = static[:, None, :]
+        merged[observed, :n_temporal] = temporal.values
+        merged[observed, -1] = observation_times
+        merged[~observed] = np.nan
+        return merged
 
     def _validate_data(self, data: dataset.TimeToEventAnalysisDataset) -> None:
         if data.predictive.targets is not None and data.predictive.targets.num_features > 1:
@@ -73,13 +142,13 @@ class DDHEmbedding:
 
     def _convert_data(
         self, data: dataset.TimeToEventAnalysisDataset
-    ) -> Tuple[Optional[np.ndarray], List[np.ndarray], List[np.ndarray], Optional[np.ndarray], Optional[np.ndarray]]:
+    ) -> Tuple[Optional[np.ndarray], RaggedTimeSeries, np.ndarray, Optional[np.ndarray], Optional[np.ndarray]]:
         if data.has_static:
             static = data.static.numpy() if data.static is not None else None
         else:
             static = np.zeros((data.time_series.num_samples, 0))
-        temporal = [df.to_numpy() for df in data.time_series.list_of_dataframes()]
-        observation_times = data.time_series.time_indexes_float()
+        temporal = data.time_series.as_ragged()
+        observation_times = datetime_time_index_to_float(temporal.time_index)
         if data.predictive is not None and data.predictive.targets is not None:
             event_times, event_values = (
                 df.to_numpy().reshape((-1,)) for df in data.predictive.targets.split_as_two_dataframes()
@@ -136,6 +205,7 @@ class DDHEmbeddingTimeToEventAnalysis(DDHEmbedding):
         self,
         output_model: OutputTimeToEventAnalysis,
         emb_model: DynamicDeepHitModel,
+        emb_cache: Optional[DDHEmbeddingCache] = None,
     ) -> None:
         """Survival analysis embedding creation for time-series with :class:`tempor.models.ddh.DynamicDeepHitModel`
         followed by ``output_model`` :class:`OutputTimeToEventAnalysis` survival analysis estimator.
@@ -145,9 +215,12 @@ class DDHEmbeddingTimeToEventAnalysis(DDHEmbedding):
                 Output model to use for predicting risk.
             emb_model (DynamicDeepHitModel):
                 :class:`tempor.models.ddh.DynamicDeepHitModel` to use for temporal feature embedding.
+            emb_cache (Optional[DDHEmbeddingCache], optional):
+                Cache of fitted embedding models to reuse, if any. Defaults to `None`.
         """
         DDHEmbedding.__init__(self, emb_model=emb_model)
         self.output_model = output_model
+        self.emb_cache = emb_cache
 
     def fit(
         self,
@@ -157,8 +230,18 @@ class DDHEmbeddingTimeToEventAnalysis(DDHEmbedding):
     ) -> Self:
         processed_data, event_times, event_values = self.prepare_fit(data)
 
-        self.emb_model.fit(processed_data, event_times, event_values)
-        embeddings = self.emb_model.predict_emb(processed_data)
+        cached = None
+        if self.emb_cache is not None:
+            key = self.emb_cache.key(data, self.emb_model)
+            cached = self.emb_cache.load(key)
+        if cached is not None:
+            self.emb_model, embeddings = cached
+        else:
+            self.emb_model.fit(processed_data, event_times, event_values)
+            embeddings = self.emb_model.predict_emb(processed_data)
+            if self.emb_cache is not None:
+                self.emb_cache.save(key, self.emb_model, embeddings)
+
         self.output_model.fit(
             pd.DataFrame(embeddings),  # pyright: ignore
             pd.Series(event_times),
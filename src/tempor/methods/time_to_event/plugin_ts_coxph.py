@@ -16,7 +16,7 @@ from tempor.methods.core._params import FloatParams
 from tempor.methods.time_to_event import BaseTimeToEventAnalysis
 from tempor.models.ddh import DynamicDeepHitModel, OutputMode, RnnMode
 
-from .helper_embedding import DDHEmbeddingTimeToEventAnalysis, OutputTimeToEventAnalysis
+from .helper_embedding import DDHEmbeddingCache, DDHEmbeddingTimeToEventAnalysis, OutputTimeToEventAnalysis
 
 
 @contextlib.contextmanager
@@ -93,6 +93,8 @@ class CoxPHTimeToEventAnalysisParams:
     """Output network, on of `OutputMode`."""
     random_state: int = 0
     """Random seed."""
+    emb_cache_dir: Optional[str] = None
+    """Directory of the cache of fitted embedding models, see `DDHEmbeddingCache`. If `None`, no cache is used."""
 
 
 def drop_constant_columns(dataframe: pd.DataFrame) -> list:
@@ -203,7 +205,9 @@ class CoxPHTimeToEventAnalysis(BaseTimeToEventAnalysis):
                 n_iter=self.params.n_iter,
                 output_mode=self.params.output_mode,
                 device=self.params.device,
+                random_state=self.params.random_state,
             ),
+            emb_cache=DDHEmbeddingCache(self.params.emb_cache_dir) if self.params.emb_cache_dir is not None else None,
         )
 
     def _fit(
@@ -1,6 +1,6 @@
 import contextlib
 import dataclasses
-from typing import Any, Generator, List
+from typing import Any, Generator, List, Optional
 
 import numpy as np
 import pandas as pd
@@ -18,7 +18,7 @@ from tempor.methods.time_to_event import BaseTimeToEventAnalysis
 from tempor.models.constants import DEVICE
 from tempor.models.ddh import DynamicDeepHitModel, OutputMode, RnnMode
 
-from .helper_embedding import DDHEmbeddingTimeToEventAnalysis, OutputTimeToEventAnalysis
+from .helper_embedding import DDHEmbeddingCache, DDHEmbeddingTimeToEventAnalysis, OutputTimeToEventAnalysis
 
 XGBObjective = Literal["aft", "cox"]
 XGBStrategy = Literal["weibull", "debiased_bce", "km"]
@@ -155,6 +155,8 @@ class XGBTimeToEventAnalysisParams:
     """Output network, on of `OutputMode`."""
     random_state: int = 0
     """Random seed."""
+    emb_cache_dir: Optional[str] = None
+    """Directory of the cache of fitted embedding models, see `DDHEmbeddingCache`. If `None`, no cache is used."""
 
 
 class XGBSurvivalAnalysis(OutputTimeToEventAnalysis):
@@ -326,7 +328,9 @@ class XGBTimeToEventAnalysis(BaseTimeToEventAnalysis):
                 n_iter=self.params.n_iter,
                 output_mode=self.params.output_mode,
                 device=self.params.device,
+                random_state=self.params.random_state,
             ),
+            emb_cache=DDHEmbeddingCache(self.params.emb_cache_dir) if self.params.emb_cache_dir is not None else None,
         )
 
     def _fit(
@@ -0,0 +1,147 @@
+"""Grouping of variable-length time series samples into batches of model input data, see
+:obj:`~tempor.models.constants.Batching`, and conversion of the data to ``float32`` model input tensors.
+"""
+
+from typing import Any, Dict, List, Sequence, Union
+
+import numpy as np
+import torch
+from typing_extensions import Literal
+
+from tempor.data.ragged import RaggedTimeSeries
+
+from .constants import Batching
+
+PadFill = Literal["zero", "last"]
+"""How to fill the padding of sequences shorter than their batch: with zeros, or with the last observation."""
+
+
+def sequence_lengths(observation_times: Sequence) -> np.ndarray:
+    """Get the length of each sample's sequence, from the samples' observation times.
+
+    Args:
+        observation_times (Sequence): The observation times of each sample.
+
+    Returns:
+        np.ndarray: The ``int64`` lengths.
+    """
+    return np.fromiter((len(item) for item in observation_times), dtype=np.int64, count=len(observation_times))
+
+
+def length_buckets(lengths: np.ndarray, batching: Batching) -> Dict[int, List[int]]:
+    """Group the samples into buckets by sequence length. For ``"exact_length"`` batching, a bucket holds the samples
+    of exactly the same length. For ``"padded"`` batching, a bucket holds the samples with lengths in the range
+    ``(2 ** (k - 1), 2 ** k]``, so there are at most ``log2(max_length) + 1`` buckets whatever the length diversity.
+
+    Args:
+        lengths (np.ndarray): The sequence length of each sample.
+        batching (Batching): The batching mode.
+
+    Returns:
+        Dict[int, List[int]]:
+            Mapping from the bucket key (the length, or the upper bound of the length range) to the positions of the\
+            samples in the bucket. Buckets are in the order of their first sample.
+    """
+    if batching == "padded":
+        keys = (2 ** np.ceil(np.log2(np.maximum(lengths, 1)))).astype(np.int64)
+    else:
+        keys = lengths
+    buckets: Dict[int, List[int]] = {}
+    for idx, key in enumerate(keys.tolist()):
+        buckets.setdefault(key, []).append(idx)
+    return buckets
+
+
+def pad_sequences(
+    sequences: Sequence, lengths: np.ndarray, fill: PadFill = "zero", dtype: Any = np.float32
+) -> np.ndarray:
+    """Stack the first ``lengths[i]`` steps of each of the ``sequences`` into one array, padded at the end to the
+    longest of the ``lengths``.
+
+    Args:
+        sequences (Sequence):
+            The sequences, array-likes with the time steps as the first dimension, which may be longer than the
+            corresponding length (e.g. the rows of a padded 3D array).
+        lengths (np.ndarray):
+            The length of each sequence.
+        fill (PadFill, optional):
+            How to fill the padding, see :obj:`PadFill`. Defaults to ``"zero"``.
+        dtype (Any, optional):
+            The dtype of the output array. Defaults to ``np.float32``.
+
+    Returns:
+        np.ndarray: The array of shape ``(len(sequences), max(lengths), *step_shape)``.
+    """
+    max_len = int(lengths.max())
+    step_shape = np.asarray(sequences[0]).shape[1:]
+    out = np.zeros((len(sequences), max_len, *step_shape), dtype=dtype)
+    for idx, (sequence, length) in enumerate(zip(sequences, lengths.tolist())):
+        values = np.asarray(sequence)[:length]
+        out[idx, :length] = values
+        if fill == "last" and 0 < length < max_len:
+            out[idx, length:] = values[-1]
+    return out
+
+
+def gather_padded(
+    data: Union[RaggedTimeSeries, np.ndarray, torch.Tensor, Sequence],
+    indices: Sequence[int],
+    lengths: np.ndarray,
+    fill: PadFill = "zero",
+    dtype: Any = np.float32,
+) -> np.ndarray:
+    """Gather the first ``lengths[i]`` steps of the sequence of each of the samples at ``indices`` of ``data`` into one
+    array, padded at the end to the longest of the ``lengths``, see :func:`pad_sequences`.
+
+    If ``data`` is a :class:`~tempor.data.ragged.RaggedTimeSeries` (the values buffer of the samples), or a padded
+    array (e.g. a 3D ``(sample, timestep, feature)`` array), the steps are gathered with a single fancy-indexing
+    operation. Otherwise (e.g. a list of per-sample arrays of different lengths), the sequences are copied one by one
+    into the preallocated output.
+
+    Args:
+        data (Union[RaggedTimeSeries, np.ndarray, torch.Tensor, Sequence]):
+            The sequences of all samples.
+        indices (Sequence[int]):
+            The positions of the samples to gather.
+        lengths (np.ndarray):
+            The length of the sequence of each of the samples at ``indices``.
+        fill (PadFill, optional):
+            How to fill the padding, see :obj:`PadFill`. Defaults to ``"zero"``.
+        dtype (Any, optional):
+            The dtype of the output array. Defaults to ``np.float32``.
+
+    Returns:
+        np.ndarray: The array of shape ``(len(indices), max(lengths), *step_shape)``.
+    """
+    if isinstance(data, torch.Tensor):
+        data = data.cpu().numpy()
+    if isinstance(data, RaggedTimeSeries):
+        buffer, starts = data.values, data.offsets[np.asarray(indices, dtype=np.int64)]
+    elif isinstance(data, np.ndarray) and data.ndim >= 2 and data.dtype != object:
+        buffer, starts = data.reshape(-1, *data.shape[2:]), np.asarray(indices, dtype=np.int64) * data.shape[1]
+    else:
+        return pad_sequences([data[idx] for idx in indices], lengths, fill=fill, dtype=dtype)
+
+    # Steps past the end of a sequence read its last step, which is the padding for ``"last"`` filling.
+    max_len = int(lengths.max())
+    steps = np.minimum(np.arange(max_len, dtype=np.int64)[None, :], np.maximum(lengths - 1, 0)[:, None])
+    out = buffer[starts[:, None] + steps].astype(dtype, copy=False)
+    if fill == "zero":
+        out[steps < np.arange(max_len)[None, :]] = 0
+    return out
+
+
+def as_float32_tensor(data: Union[np.ndarray, torch.Tensor], device: Any) -> torch.Tensor:
+    """Convert ``data`` to a ``float32`` tensor on ``device``. No copy is made if ``data`` already is a contiguous
+    ``float32`` array (which the tensor will share the memory of, on CPU) or a ``float32`` tensor on ``device``.
+
+    Args:
+        data (Union[np.ndarray, torch.Tensor]): The data.
+        device (Any): The PyTorch device.
+
+    Returns:
+        torch.Tensor: The tensor.
+    """
+    if isinstance(data, torch.Tensor):
+        return data.to(device=device, dtype=torch.float32)
+    return torch.from_numpy(np.ascontiguousarray(data, dtype=np.float32)).to(device)
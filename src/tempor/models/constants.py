@@ -30,3 +30,31 @@ Samp = Literal[
     "WeightedRandomSampler",
 ]
 """Possible values specifying a Sampler."""
+
+ExecutionMode = Literal[
+    "eager",
+    "compile",
+    "bf16",
+    "compile_bf16",
+]
+"""Possible values specifying the execution mode of a model: ``"eager"`` (default PyTorch execution, in fp32),
+``"compile"`` (the core network compiled with ``torch.compile``), ``"bf16"`` (bfloat16 mixed precision, with
+``torch.autocast``), or ``"compile_bf16"`` (both). Each falls back to eager fp32 execution where it is not supported."""
+
+NaNCheck = Literal[
+    "input",
+    "debug",
+]
+"""Possible values specifying when a model checks for NaNs: ``"input"`` checks the input data once, when it is
+converted to tensors for training or prediction; ``"debug"`` also checks the inputs and the intermediate outputs of
+every forward pass, which forces a host synchronization at each step."""
+
+Batching = Literal[
+    "exact_length",
+    "padded",
+]
+"""Possible values specifying how a model groups variable-length time series samples into batches:
+``"exact_length"`` only batches together samples of exactly the same sequence length, while ``"padded"`` batches
+together samples of similar lengths (within a factor of two), padded to the same length, with the padding ignored by
+the model where it supports this (see the model). With ``"padded"``, the number of forward passes per epoch is governed
+by the batch size rather than by the diversity of the sequence lengths."""
@@ -1,5 +1,4 @@
 import warnings
-from copy import deepcopy
 from typing import Any, List, Optional, Tuple, Union
 
 import numpy as np
@@ -7,8 +6,9 @@ import torch
 import torch.nn as nn
 from typing_extensions import Literal, Self, get_args
 
-from tempor.models import constants
+from tempor.models import batching, constants
 
+from .early_stopping import BestEpoch, EarlyStopping
 from .mlp import MLP
 from .transformer import TransformerModel
 from .ts_model import TimeSeriesLayer
@@ -37,23 +37,36 @@ output_modes = get_args(OutputMode)
 
 
 def get_padded_features(
-    x: Union[np.ndarray, List[np.ndarray]], pad_size: Optional[int] = None, fill: float = np.nan
+    x: Union[np.ndarray, List[np.ndarray]], pad_size: Optional[int] = None, fill: float = np.nan, dtype: Any = float
 ) -> np.ndarray:
-    """Helper function to pad variable length RNN inputs with nans."""
+    """Helper function to pad variable length RNN inputs with nans. The sequences are copied (truncated to
+    ``pad_size``, if longer) into one preallocated array of ``dtype``. An input which already is a padded numeric
+    ``(sample, timestep, feature)`` array is only cast, and padded or truncated to ``pad_size``."""
+    if isinstance(x, np.ndarray) and x.ndim == 3 and x.dtype != object:
+        if pad_size is None or pad_size <= x.shape[1]:
+            return x[:, :pad_size].astype(dtype, copy=False)
+        x_padded = np.full((x.shape[0], pad_size, x.shape[2]), fill, dtype=dtype)
+        x_padded[:, : x.shape[1]] = x
+        return x_padded
+
     if pad_size is None:
         pad_size = max([len(x_) for x_ in x])
 
-    x_padded = []
-    for i in range(len(x)):
-        if pad_size == len(x[i]):
-            x_padded.append(x[i].astype(float))
-        elif pad_size > len(x[i]):
-            pads = fill * np.ones((pad_size - len(x[i]),) + x[i].shape[1:])
-            x_padded.append(np.concatenate([x[i], pads]).astype(float))
-        else:
-            x_padded.append(x[i][:pad_size].astype(float))
+    x_padded = np.full((len(x), pad_size, *np.shape(x[0])[1:]), fill, dtype=dtype)
+    for i, x_ in enumerate(x):
+        length = min(len(x_), pad_size)
+        x_padded[i, :length] = x_[:length]
+
+    return x_padded
+
 
-    return np.asarray(x_padded)
+def sequence_lengths(x: Union[np.ndarray, List[np.ndarray]]) -> np.ndarray:
+    """Get the length of each of the sequences ``x``. For a padded numeric ``(sample, timestep, feature)`` array, the
+    padding is the all-NaN timesteps at the end of each sequence."""
+    if isinstance(x, np.ndarray) and x.ndim == 3 and x.dtype != object:
+        observed = ~np.isnan(x).all(axis=2)
+        return np.where(observed.any(axis=1), x.shape[1] - np.argmax(observed[:, ::-1], axis=1), 0).astype(np.int64)
+    return np.asarray([len(x_) for x_ in x], dtype=np.int64)
 
 
 class DynamicDeepHitModel:
@@ -107,6 +120,7 @@ class DynamicDeepHitModel:
         self.output_type = output_mode
 
         self.model: Optional[DynamicDeepHitLayers] = None
+        self.best_epoch: Optional[BestEpoch] = None
 
     def _setup_model(self, inputdim: int, seqlen: int, risks: int) -> "DynamicDeepHitLayers":
         return (
@@ -143,13 +157,13 @@ class DynamicDeepHitModel:
         self.model = self._setup_model(inputdim, seqlen, risks=maxrisk)
         optimizer = torch.optim.Adam(self.model.parameters(), lr=self.lr)
 
-        patience, old_loss = 0, np.inf
         nbatches = int(x_train.shape[0] / self.batch_size) + 1
         valbatches = int(x_val.shape[0] / self.batch_size) + 1
 
-        best_param = deepcopy(self.model.state_dict())
+        # Training stops once ``patience`` epochs in a row did not improve the validation loss.
+        early_stopping = EarlyStopping(self.model, patience=max(self.patience - 1, 0))
 
-        for i in range(self.n_iter):  # pylint: disable=unused-variable
+        for i in range(self.n_iter):
             self.model.train()
             for j in range(nbatches):
                 xb = x_train[j * self.batch_size : (j + 1) * self.batch_size]
@@ -173,32 +187,24 @@ class DynamicDeepHitModel:
 
             self.model.eval()
             valid_loss: Any = 0.0
-            for j in range(valbatches):
-                xb = x_val[j * self.batch_size : (j + 1) * self.batch_size]
-                tb = t_val[j * self.batch_size : (j + 1) * self.batch_size]
-                eb = e_val[j * self.batch_size : (j + 1) * self.batch_size]
+            with torch.no_grad():
+                for j in range(valbatches):
+                    xb = x_val[j * self.batch_size : (j + 1) * self.batch_size]
+                    tb = t_val[j * self.batch_size : (j + 1) * self.batch_size]
+                    eb = e_val[j * self.batch_size : (j + 1) * self.batch_size]
 
-                if xb.shape[0] == 0:  # pragma: no cover
-                    continue
+                    if xb.shape[0] == 0:  # pragma: no cover
+                        continue
 
-                valid_loss += self.total_loss(xb, tb, eb)
+                    valid_loss += self.total_loss(xb, tb, eb)
 
             if torch.isnan(valid_loss):  # pragma: no cover
                 raise RuntimeError("NaNs detected in the total loss")
 
-            valid_loss = valid_loss.item()
-
-            if valid_loss < old_loss:
-                patience = 0
-                old_loss = valid_loss
-                best_param = deepcopy(self.model.state_dict())
-            else:
-                patience += 1
-
-            if patience == self.patience:
+            if early_stopping.step(i, valid_loss.item()):
                 break
 
-        self.model.load_state_dict(best_param)
+        self.best_epoch = early_stopping.restore()
         self.model.eval()
 
         return self
@@ -216,13 +222,16 @@ class DynamicDeepHitModel:
         """
         if split_time is None:
             _, split_time = np.histogram(t, split - 1)  # type: ignore
-        t_discretized = np.array(
-            [np.digitize(t_, split_time, right=True) - 1 for t_ in t], dtype=object  # type: ignore
-        )
+        if isinstance(t, np.ndarray) and t.dtype != object:
+            t_discretized = np.digitize(t, split_time, right=True) - 1  # type: ignore
+        else:
+            t_discretized = np.array(
+                [np.digitize(t_, split_time, right=True) - 1 for t_ in t], dtype=object  # type: ignore
+            )
         return t_discretized, split_time
 
     def _preprocess_test_data(self, x: Union[np.ndarray, List[np.ndarray]]) -> torch.Tensor:
-        data = torch.from_numpy(get_padded_features(x, pad_size=self.pad_size)).float().to(self.device)
+        data = batching.as_float32_tensor(get_padded_features(x, pad_size=self.pad_size, dtype=np.float32), self.device)
         return data
 
     def _preprocess_training_data(
@@ -237,13 +246,13 @@ class DynamicDeepHitModel:
         np.random.seed(self.random_state)
         np.random.shuffle(idx)
 
-        x = get_padded_features(x)
+        x = get_padded_features(x, dtype=np.float32)
         self.pad_size = x.shape[1]
         x_train_np, t_train_np, e_train_np = x[idx], t[idx], e[idx]
 
-        x_train = torch.from_numpy(x_train_np.astype(float)).float().to(self.device)
-        t_train = torch.from_numpy(t_train_np.astype(float)).float().to(self.device)
-        e_train = torch.from_numpy(e_train_np.astype(int)).float().to(self.device)
+        x_train = batching.as_float32_tensor(x_train_np, self.device)
+        t_train = batching.as_float32_tensor(t_train_np.astype(float), self.device)
+        e_train = batching.as_float32_tensor(e_train_np.astype(int), self.device)
 
         val_size = int(self.val_size * x_train.shape[0])
         if val_size == 0:
@@ -297,37 +306,36 @@ class DynamicDeepHitModel:
                 + "model using the `fit` method on some training data "
                 + "before calling `predict_survival`."
             )
-        lens = [len(x_) for x_ in x]
-
-        x_in: Any = x
-        if all_step:
-            new_x = []
-            for x_, l_ in zip(x, lens):
-                new_x += [x_[: li + 1] for li in range(l_)]
-            x_in = new_x
-
         # TODO: The below [t] is messy, need to investigate...
         t = self.discretize([t], self.split, self.split_time)[0][0]  # type: ignore
+        horizons = torch.as_tensor(np.asarray(t, dtype=np.int64), device=self.device)
 
-        x_in_tensor: torch.Tensor = self._preprocess_test_data(x_in)
-        batches = int(len(x) / batch_size) + 1
-        scores: dict = {t_: [] for t_ in t}
-        for j in range(batches):
-            xb = x_in_tensor[j * batch_size : (j + 1) * batch_size]
-            _, f = self.model(xb)  # pylint: disable=not-callable
-            for t_ in t:
-                pred = torch.cumsum(f[int(risk) - 1], dim=1)[:, t_].squeeze().detach().cpu().numpy().tolist()
-
-                if isinstance(pred, list):
-                    scores[t_].extend(pred)
-                else:  # pragma: no cover
-                    scores[t_].append(pred)
-
-        output = []
-        for t_ in t:
-            output.append(scores[t_])
-
-        return 1 - np.asarray(output).T
+        x_in_tensor: torch.Tensor = self._preprocess_test_data(x)
+        if all_step:
+            x_in_tensor = self._all_step_prefixes(x_in_tensor, sequence_lengths(x))
+
+        # The CIF is computed once per batch, and all the horizons are gathered from it with one indexing operation.
+        output = np.empty((len(x_in_tensor), len(horizons)))
+        with torch.no_grad():
+            for start in range(0, len(x_in_tensor), batch_size):
+                _, f = self.model(x_in_tensor[start : start + batch_size])  # pylint: disable=not-callable
+                cif = torch.cumsum(f[int(risk) - 1], dim=1)
+                output[start : start + batch_size] = cif[:, horizons].cpu().numpy()
+
+        return 1 - output
+
+    def _all_step_prefixes(self, x_in_tensor: torch.Tensor, lens: np.ndarray) -> torch.Tensor:
+        # Expand each (NaN-padded) sequence into all of its prefixes, ``x[:1], x[:2], ..., x[:len]``, in order: the
+        # prefixes of a sample are copies of the sample, with the steps past the end of the prefix set to the padding.
+        offsets = np.zeros(len(lens) + 1, dtype=np.int64)
+        np.cumsum(lens, out=offsets[1:])
+        sample_pos = np.repeat(np.arange(len(lens), dtype=np.int64), lens)
+        prefix_lens = np.arange(offsets[-1], dtype=np.int64) - np.repeat(offsets[:-1], lens) + 1
+
+        prefixes = x_in_tensor[torch.as_tensor(sample_pos, device=x_in_tensor.device)]
+        steps = torch.arange(prefixes.shape[1], device=prefixes.device)
+        padding = steps[None, :] >= torch.as_tensor(prefix_lens, device=prefixes.device)[:, None]
+        return prefixes.masked_fill(padding[:, :, None], torch.nan)
 
     def predict_risk(self, x: np.ndarray, t: List, **kwargs: Any) -> np.ndarray:
         return 1 - self.predict_survival(x, t, **kwargs)
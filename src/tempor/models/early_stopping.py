@@ -0,0 +1,166 @@
+"""Early stopping of model training on the validation loss, keeping a checkpoint of the best weights seen so far."""
+
+import dataclasses
+import os
+import tempfile
+import time
+import weakref
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import torch
+from torch import nn
+
+from tempor.log import logger as log
+
+DEFAULT_CHECKPOINT_MAX_MEMORY = 2**30
+"""Models with weights larger than this, in bytes, are checkpointed on disk rather than in memory."""
+
+
+@dataclasses.dataclass(frozen=True)
+class BestEpoch:
+    """The epoch with the best validation loss of a training run."""
+
+    epoch: int
+    """The (0-based) epoch number."""
+    loss: float
+    """The validation loss."""
+    time: float
+    """The time, in seconds since the start of training, at which the epoch was evaluated."""
+    total_time: float
+    """The total training time, in seconds."""
+
+
+def _state_tensors(module: nn.Module) -> List[torch.Tensor]:
+    # The parameters and buffers of the module, i.e. the tensors of its state dict, each only once.
+    tensors: List[torch.Tensor] = []
+    seen = set()
+    for tensor in [*module.parameters(), *module.buffers()]:
+        if id(tensor) not in seen:
+            seen.add(id(tensor))
+            tensors.append(tensor)
+    return tensors
+
+
+def _remove_file(path: str) -> None:
+    if os.path.exists(path):
+        os.remove(path)
+
+
+class EarlyStopping:
+    def __init__(
+        self,
+        module: nn.Module,
+        patience: int,
+        min_epochs: int = 0,
+        max_memory: int = DEFAULT_CHECKPOINT_MAX_MEMORY,
+    ) -> None:
+        """Early stopping on the validation loss of ``module``. The weights of the best epoch are checkpointed in a
+        flat buffer (one per device and dtype) allocated once, up front, and overwritten in place at each improvement,
+        rather than in a copy of the state dict made at each improvement. If the weights are larger than
+        ``max_memory``, they are checkpointed in a temporary file instead, which is removed once restored.
+
+        Args:
+            module (nn.Module):
+                The module being trained.
+            patience (int):
+                Training is stopped once the validation loss has not improved for more than ``patience`` evaluations
+                in a row.
+            min_epochs (int, optional):
+                Training is not stopped at or before this epoch. Defaults to 0.
+            max_memory (int, optional):
+                The maximum size, in bytes, of an in-memory checkpoint. Defaults to
+                :obj:`DEFAULT_CHECKPOINT_MAX_MEMORY`.
+        """
+        self.module = module
+        self.patience = patience
+        self.min_epochs = min_epochs
+
+        self.best_loss = np.inf
+        self.best_epoch: Optional[int] = None
+        self.best_time: Optional[float] = None
+        self.bad_evaluations = 0
+        self.start_time = time.perf_counter()
+
+        self._tensors = _state_tensors(module)
+        nbytes = sum(t.numel() * t.element_size() for t in self._tensors)
+        self.on_disk = nbytes > max_memory
+        self._views: List[torch.Tensor] = []
+        self._path: Optional[str] = None
+        if self.on_disk:
+            fd, self._path = tempfile.mkstemp(suffix=".pt", prefix="tempor_checkpoint_")
+            os.close(fd)
+            weakref.finalize(self, _remove_file, self._path)
+        else:
+            self._allocate_buffers()
+
+    def _allocate_buffers(self) -> None:
+        sizes: Dict[Tuple[torch.device, torch.dtype], int] = {}
+        for tensor in self._tensors:
+            key = (tensor.device, tensor.dtype)
+            sizes[key] = sizes.get(key, 0) + tensor.numel()
+        buffers = {key: torch.empty(size, device=key[0], dtype=key[1]) for key, size in sizes.items()}
+        offsets = dict.fromkeys(sizes, 0)
+        for tensor in self._tensors:
+            key = (tensor.device, tensor.dtype)
+            self._views.append(buffers[key][offsets[key] : offsets[key] + tensor.numel()].view(tensor.shape))
+            offsets[key] += tensor.numel()
+
+    @torch.no_grad()
+    def _save(self) -> None:
+        if self._path is not None:
+            torch.save([tensor.detach() for tensor in self._tensors], self._path)
+        else:
+            for view, tensor in zip(self._views, self._tensors):
+                view.copy_(tensor)
+
+    @torch.no_grad()
+    def _load(self) -> None:
+        if self._path is not None:
+            saved = torch.load(self._path, map_location="cpu")
+            _remove_file(self._path)
+        else:
+            saved = self._views
+        for tensor, value in zip(self._tensors, saved):
+            tensor.copy_(value)
+
+    def step(self, epoch: int, val_loss: float) -> bool:
+        """Record the validation loss of an epoch, checkpointing the weights if it is the best so far.
+
+        Args:
+            epoch (int): The epoch number.
+            val_loss (float): The validation loss.
+
+        Returns:
+            bool: Whether to stop training.
+        """
+        if val_loss < self.best_loss:
+            self.best_loss = float(val_loss)
+            self.best_epoch = epoch
+            self.best_time = time.perf_counter() - self.start_time
+            self.bad_evaluations = 0
+            self._save()
+        else:
+            self.bad_evaluations += 1
+        return self.bad_evaluations > self.patience and epoch > self.min_epochs
+
+    def restore(self) -> Optional[BestEpoch]:
+        """Load the checkpointed weights of the best epoch into the module, if any epoch was evaluated.
+
+        Returns:
+            Optional[BestEpoch]: The best epoch, or `None` if no epoch was evaluated.
+        """
+        if self.best_epoch is None or self.best_time is None:
+            return None
+        self._load()
+        best = BestEpoch(
+            epoch=self.best_epoch,
+            loss=self.best_loss,
+            time=self.best_time,
+            total_time=time.perf_counter() - self.start_time,
+        )
+        log.info(
+            f"Best validation loss {best.loss} at epoch {best.epoch}, reached in {best.time:.2f}s "
+            f"of {best.total_time:.2f}s training"
+        )
+        return best
@@ -8,9 +8,10 @@ from torch import nn
 
 from tempor.core import pydantic_utils
 from tempor.log import logger
-from tempor.models import constants, utils
+from tempor.models import batching, constants, utils
 
 from .constants import Nonlin
+from .early_stopping import BestEpoch, EarlyStopping
 from .utils import GumbelSoftmax, get_nonlin
 
 
@@ -283,6 +284,7 @@ class MLP(nn.Module):
         self.n_iter_min = n_iter_min
         self.batch_size = batch_size
         self.patience = patience
+        self.best_epoch: Optional[BestEpoch] = None
         self.clipping_value = clipping_value
         self.early_stopping = early_stopping
         if loss is not None:
@@ -294,7 +296,7 @@ class MLP(nn.Module):
                 self.loss = nn.MSELoss()
 
     def fit(self, X: np.ndarray, y: np.ndarray) -> "MLP":
-        Xt = self._check_tensor(X)
+        Xt = batching.as_float32_tensor(X, self.device)
         yt = self._check_tensor(y)
 
         self._train(Xt, yt)
@@ -307,7 +309,7 @@ class MLP(nn.Module):
             raise ValueError(f"Invalid task type for predict_proba {self.task_type}")
 
         with torch.no_grad():
-            Xt = self._check_tensor(X)
+            Xt = batching.as_float32_tensor(X, self.device)
 
             yt = self.forward(Xt)
 
@@ -316,7 +318,7 @@ class MLP(nn.Module):
     @pydantic_utils.validate_arguments(config=pydantic.ConfigDict(arbitrary_types_allowed=True))
     def predict(self, X: np.ndarray) -> np.ndarray:
         with torch.no_grad():
-            Xt = self._check_tensor(X)
+            Xt = batching.as_float32_tensor(X, self.device)
 
             yt = self.forward(Xt)
 
@@ -380,8 +382,10 @@ class MLP(nn.Module):
 
         # Setup the network and optimizer
 
-        val_loss_best = np.inf
-        patience = 0
+        # Only keep a checkpoint of the best weights if early stopping is enabled.
+        early_stopping = (
+            EarlyStopping(self, patience=self.patience, min_epochs=self.n_iter_min) if self.early_stopping else None
+        )
 
         # do training
         for i in range(self.n_iter):
@@ -392,21 +396,16 @@ class MLP(nn.Module):
                     X_val, y_val = test_dataset.dataset.tensors  # type: ignore
 
                     preds = self.forward(X_val).squeeze()
-                    val_loss = self.loss(preds.squeeze(), y_val.squeeze())
-
-                    if self.early_stopping:
-                        if val_loss_best > val_loss:
-                            val_loss_best = val_loss
-                            patience = 0
-                        else:
-                            patience += 1
+                    val_loss = self.loss(preds.squeeze(), y_val.squeeze()).item()
 
-                        if patience > self.patience and i > self.n_iter_min:
-                            break
+                if i % self.n_iter_print == 0:
+                    logger.debug(f"Epoch: {i}, loss: {val_loss}, train_loss: {train_loss}")
 
-                    if i % self.n_iter_print == 0:
-                        logger.debug(f"Epoch: {i}, loss: {val_loss}, train_loss: {train_loss}")
+                if early_stopping is not None and early_stopping.step(i, val_loss):
+                    break
 
+        if early_stopping is not None:
+            self.best_epoch = early_stopping.restore()
         return self
 
     def _check_tensor(self, X: Union[torch.Tensor, np.ndarray]) -> torch.Tensor:
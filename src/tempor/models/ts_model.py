@@ -1,4 +1,4 @@
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, ContextManager, List, Optional, Tuple, Union
 
 import numpy as np
 import pydantic
@@ -18,12 +18,14 @@ from tsai.models.XCM import XCM
 from typing_extensions import Literal
 
 from tempor.core import pydantic_utils
+from tempor.data.ragged import RaggedTimeSeries
 from tempor.log import logger as log
-from tempor.models import constants
-from tempor.models.constants import DEVICE, ModelTaskType, Nonlin
+from tempor.models import batching, constants
+from tempor.models.constants import DEVICE, Batching, ExecutionMode, ModelTaskType, NaNCheck, Nonlin
+from tempor.models.early_stopping import BestEpoch, EarlyStopping
 from tempor.models.mlp import MLP, MultiActivationHead
 from tempor.models.samplers import ImbalancedDatasetSampler
-from tempor.models.utils import enable_reproducibility, get_nonlin
+from tempor.models.utils import CompiledModule, autocast_context, check_no_nans, enable_reproducibility, get_nonlin
 
 TSModelMode = Literal[
     "LSTM",
@@ -42,6 +44,12 @@ TSModelMode = Literal[
 
 
 class TimeSeriesModel(nn.Module):
+    # Class-level defaults, for models pickled before these attributes were added.
+    execution_mode: ExecutionMode = "eager"
+    _compiled_temporal_layer: Optional[CompiledModule] = None
+    nan_check: NaNCheck = "input"
+    batching: Batching = "exact_length"
+
     @pydantic_utils.validate_arguments(config=pydantic.ConfigDict(arbitrary_types_allowed=True))
     def __init__(
         self,
@@ -72,6 +80,9 @@ class TimeSeriesModel(nn.Module):
         patience: int = 20,
         train_ratio: float = 0.8,
         use_horizon_condition: bool = True,
+        execution_mode: ExecutionMode = "eager",
+        nan_check: NaNCheck = "input",
+        batching: Batching = "exact_length",
     ) -> None:
         """Basic neural net for time series.
 
@@ -135,6 +146,18 @@ class TimeSeriesModel(nn.Module):
             use_horizon_condition (bool, optional):
                 Whether to predict using the observation times (`True`) or just the covariates (`False`).
                 Defaults to `True`.
+            execution_mode (ExecutionMode, optional):
+                How to execute the training and prediction forward passes: with the ``TimeSeriesLayer`` compiled by
+                ``torch.compile``, and/or in bfloat16 mixed precision. Available options:
+                :obj:`~tempor.models.constants.ExecutionMode`. Defaults to ``"eager"``.
+            nan_check (NaNCheck, optional):
+                When to check for NaNs: once, in the input data, or also in every forward pass (for debugging).
+                Available options: :obj:`~tempor.models.constants.NaNCheck`. Defaults to ``"input"``.
+            batching (Batching, optional):
+                How to batch samples of different sequence lengths. With ``"padded"``, the sequences are zero-padded,
+                and the padding is skipped by the ``"RNN"``, ``"LSTM"``, ``"GRU"`` (with packed sequences) and
+                ``"Transformer"`` (with an attention mask) modes; the other (convolutional) modes see the zero padding.
+                Available options: :obj:`~tempor.models.constants.Batching`. Defaults to ``"exact_length"``.
         """
         super(TimeSeriesModel, self).__init__()
 
@@ -171,8 +194,11 @@ class TimeSeriesModel(nn.Module):
         self.n_units_out = int(np.prod(self.output_shape))
         self.clipping_value = clipping_value
         self.use_horizon_condition = use_horizon_condition
+        self.nan_check = nan_check
+        self.batching = batching
 
         self.patience = patience
+        self.best_epoch: Optional[BestEpoch] = None
         self.train_ratio = train_ratio
         self.random_state = random_state
 
@@ -190,9 +216,15 @@ class TimeSeriesModel(nn.Module):
             device=device,
             dropout=dropout,
             nonlin=nonlin,
+            nan_check=nan_check,
         )
 
         self.mode = mode
+        self.execution_mode = execution_mode
+        # Not an `nn.Module`, so not part of the state dict. Only set when compiling, eager mode calls the layer.
+        self._compiled_temporal_layer = (
+            CompiledModule(self.temporal_layer) if execution_mode in ("compile", "compile_bf16") else None
+        )
 
         self.out_activation: Optional[nn.Module] = None
         self.n_act_out: Optional[int] = None
@@ -226,26 +258,25 @@ class TimeSeriesModel(nn.Module):
         static_data: torch.Tensor,
         temporal_data: torch.Tensor,
         observation_times: torch.Tensor,
+        lengths: Optional[torch.Tensor] = None,
     ) -> torch.Tensor:
         # x shape (batch, time_step, input_size)
         # r_out shape (batch, time_step, output_size)
 
-        if torch.isnan(static_data).sum() != 0:
-            raise ValueError("NaNs detected in the static data")
-        if torch.isnan(temporal_data).sum() != 0:
-            raise ValueError("NaNs detected in the temporal data")
-        if torch.isnan(observation_times).sum() != 0:
-            raise ValueError("NaNs detected in the temporal horizons")
+        # NOTE: The inputs are checked for NaNs once, in `_prepare_input`.
+        if self.nan_check == "debug":
+            self._check_input_nans(static_data, temporal_data, observation_times)
 
         if self.use_horizon_condition:
             temporal_data_merged = torch.cat([temporal_data, observation_times.unsqueeze(2)], dim=2)
         else:
             temporal_data_merged = temporal_data
 
-        if torch.isnan(temporal_data_merged).sum() != 0:  # pragma: no cover
-            raise ValueError("NaNs detected in the temporal merged data")
-
-        pred = self.temporal_layer(static_data, temporal_data_merged)
+        # The sequence lengths are only needed if the sequences are padded.
+        temporal_layer: Callable = (
+            self._compiled_temporal_layer if self._compiled_temporal_layer is not None else self.temporal_layer
+        )
+        pred = temporal_layer(static_data, temporal_data_merged, lengths if self.batching == "padded" else None)
 
         if self.out_activation is not None:
             pred = pred.reshape(-1, self.n_act_out)
@@ -259,28 +290,29 @@ class TimeSeriesModel(nn.Module):
     def predict(
         self,
         static_data: Union[List, np.ndarray],
-        temporal_data: Union[List, np.ndarray],
+        temporal_data: Union[List, np.ndarray, RaggedTimeSeries],
         observation_times: Union[List, np.ndarray],
     ) -> np.ndarray:
         self.eval()
-        with torch.no_grad():
+        with torch.no_grad(), self._autocast():
             (
                 static_data_t,
                 temporal_data_t,
                 observation_times_t,
                 _,
+                lengths_t,
                 window_batches,
             ) = self._prepare_input(static_data, temporal_data, observation_times)
 
             yt = torch.zeros(len(temporal_data), *self.output_shape).to(self.device)
-            for widx in range(len(temporal_data_t)):
-                window_size = len(observation_times_t[widx][0])
+            for widx, indices in enumerate(window_batches.values()):
                 local_yt = self(
                     static_data_t[widx],
                     temporal_data_t[widx],
                     observation_times_t[widx],
+                    lengths_t[widx],
                 )
-                yt[window_batches[window_size]] = local_yt
+                yt[indices] = local_yt.to(yt.dtype)
 
             if self.task_type == "classification":
                 return np.argmax(yt.cpu().numpy(), -1)
@@ -291,37 +323,38 @@ class TimeSeriesModel(nn.Module):
     def predict_proba(
         self,
         static_data: Union[List, np.ndarray],
-        temporal_data: Union[List, np.ndarray],
+        temporal_data: Union[List, np.ndarray, RaggedTimeSeries],
         observation_times: Union[List, np.ndarray],
     ) -> np.ndarray:
         self.eval()
         if self.task_type != "classification":
             raise RuntimeError("Task valid only for classification")
-        with torch.no_grad():
+        with torch.no_grad(), self._autocast():
             (
                 static_data_t,
                 temporal_data_t,
                 observation_times_t,
                 _,
+                lengths_t,
                 window_batches,
             ) = self._prepare_input(static_data, temporal_data, observation_times)
 
             yt = torch.zeros(len(temporal_data), *self.output_shape).to(self.device)
-            for widx in range(len(temporal_data_t)):
-                window_size = len(observation_times_t[widx][0])
+            for widx, indices in enumerate(window_batches.values()):
                 local_yt = self(
                     static_data_t[widx],
                     temporal_data_t[widx],
                     observation_times_t[widx],
+                    lengths_t[widx],
                 )
-                yt[window_batches[window_size]] = local_yt
+                yt[indices] = local_yt.to(yt.dtype)
 
             return yt.cpu().numpy()
 
     def score(
         self,
         static_data: Union[List, np.ndarray],
-        temporal_data: Union[List, np.ndarray],
+        temporal_data: Union[List, np.ndarray, RaggedTimeSeries],
         observation_times: Union[List, np.ndarray],
         outcome: np.ndarray,
     ) -> float:
@@ -335,7 +368,7 @@ class TimeSeriesModel(nn.Module):
     def fit(
         self,
         static_data: Union[List, np.ndarray],
-        temporal_data: Union[List, np.ndarray],
+        temporal_data: Union[List, np.ndarray, RaggedTimeSeries],
         observation_times: Union[List, np.ndarray],
         outcome: Union[List, np.ndarray],
     ) -> Any:
@@ -344,10 +377,11 @@ class TimeSeriesModel(nn.Module):
             temporal_data_t,
             observation_times_t,
             outcome_t,
+            lengths_t,
             _,
         ) = self._prepare_input(static_data, temporal_data, observation_times, outcome)
 
-        return self._train(static_data_t, temporal_data_t, observation_times_t, outcome_t)
+        return self._train(static_data_t, temporal_data_t, observation_times_t, outcome_t, lengths_t)
 
     @pydantic_utils.validate_arguments(config=pydantic.ConfigDict(arbitrary_types_allowed=True))
     def _train(
@@ -356,10 +390,8 @@ class TimeSeriesModel(nn.Module):
         temporal_data: List[torch.Tensor],
         observation_times: List[torch.Tensor],
         outcome: List[torch.Tensor],
+        lengths: List[torch.Tensor],
     ) -> Any:
-        patience = 0
-        prev_error = np.inf
-
         train_dataloaders = []
         test_dataloaders = []
         for widx in range(len(temporal_data)):
@@ -368,24 +400,23 @@ class TimeSeriesModel(nn.Module):
                 temporal_data[widx],
                 observation_times[widx],
                 outcome[widx],
+                lengths[widx],
             )
             train_dataloaders.append(train_dl)
             test_dataloaders.append(test_dl)
 
         # training and testing
+        early_stopping = EarlyStopping(self, patience=self.patience)
         for it in range(self.n_iter):
             train_loss = self._train_epoch(train_dataloaders)
-            if it % self.n_iter_print == 0:
+            # The last epoch is always evaluated, so that its weights are candidates for the best ones.
+            if it % self.n_iter_print == 0 or it == self.n_iter - 1:
                 val_loss = self._test_epoch(test_dataloaders)
                 log.info(f"Epoch:{it}| train loss: {train_loss}, validation loss: {val_loss}")
-                if val_loss < prev_error:
-                    patience = 0
-                    prev_error = val_loss
-                else:
-                    patience += 1
-                if patience > self.patience:
+                if early_stopping.step(it, val_loss):
                     break
 
+        self.best_epoch = early_stopping.restore()
         return self
 
     def _train_epoch(self, loaders: List[DataLoader]) -> float:
@@ -393,14 +424,12 @@ class TimeSeriesModel(nn.Module):
 
         losses = []
         for loader in loaders:
-            for step, (static_mb, temporal_mb, horizons_mb, y_mb) in enumerate(  # pylint: disable=unused-variable
-                loader
-            ):
+            for static_mb, temporal_mb, horizons_mb, y_mb, lengths_mb in loader:
                 self.optimizer.zero_grad()  # clear gradients for this training step
 
-                pred = self(static_mb, temporal_mb, horizons_mb)  # rnn output
-
-                loss = self.loss(pred.squeeze(), y_mb.squeeze())
+                with self._autocast():
+                    pred = self(static_mb, temporal_mb, horizons_mb, lengths_mb)  # rnn output
+                    loss = self.loss(pred.float().squeeze(), y_mb.squeeze())
 
                 loss.backward()  # backpropagation, compute gradients
                 if self.clipping_value > 0:
@@ -410,24 +439,29 @@ class TimeSeriesModel(nn.Module):
                     )
                 self.optimizer.step()  # apply gradients
 
-                losses.append(loss.detach().cpu())
+                losses.append(loss.detach())
 
-        return float(np.mean(losses))
+        # Only synchronize with the device once per epoch.
+        return float(torch.stack(losses).mean())
 
+    @torch.no_grad()
     def _test_epoch(self, loaders: List[DataLoader]) -> float:
         self.eval()
 
         losses = []
         for loader in loaders:
-            for step, (static_mb, temporal_mb, horizons_mb, y_mb) in enumerate(  # pylint: disable=unused-variable
-                loader
-            ):
-                pred = self(static_mb, temporal_mb, horizons_mb)  # rnn output
-                loss = self.loss(pred.squeeze(), y_mb.squeeze())
+            for static_mb, temporal_mb, horizons_mb, y_mb, lengths_mb in loader:
+                with self._autocast():
+                    pred = self(static_mb, temporal_mb, horizons_mb, lengths_mb)  # rnn output
+                    loss = self.loss(pred.float().squeeze(), y_mb.squeeze())
+
+                losses.append(loss.detach())
 
-                losses.append(loss.detach().cpu())
+        # Only synchronize with the device once per epoch.
+        return float(torch.stack(losses).mean())
 
-        return float(np.mean(losses))
+    def _autocast(self) -> ContextManager:
+        return autocast_context(self.execution_mode, self.device)
 
     def dataloader(
         self,
@@ -435,6 +469,7 @@ class TimeSeriesModel(nn.Module):
         temporal_data: torch.Tensor,
         observation_times: torch.Tensor,
         outcome: torch.Tensor,
+        lengths: torch.Tensor,
     ) -> Tuple[DataLoader, DataLoader]:
         stratify = None
         _, out_counts = torch.unique(outcome, return_counts=True)
@@ -446,6 +481,7 @@ class TimeSeriesModel(nn.Module):
             temporal_data.cpu(),
             observation_times.cpu(),
             outcome.cpu(),
+            lengths.cpu(),
             train_size=self.train_ratio,
             random_state=self.random_state,
             stratify=stratify,
@@ -459,18 +495,22 @@ class TimeSeriesModel(nn.Module):
             observation_times_test,
             outcome_train,
             outcome_test,
+            lengths_train,
+            lengths_test,
         ) = split
         train_dataset = TensorDataset(
             static_data_train.to(self.device),
             temporal_data_train.to(self.device),
             observation_times_train.to(self.device),
             outcome_train.to(self.device),
+            lengths_train.to(self.device),
         )
         test_dataset = TensorDataset(
             static_data_test.to(self.device),
             temporal_data_test.to(self.device),
             observation_times_test.to(self.device),
             outcome_test.to(self.device),
+            lengths_test.to(self.device),
         )
 
         sampler_ = self.dataloader_sampler
@@ -491,6 +531,16 @@ class TimeSeriesModel(nn.Module):
             ),
         )
 
+    def _check_input_nans(
+        self,
+        static_data: torch.Tensor,
+        temporal_data: torch.Tensor,
+        observation_times: torch.Tensor,
+    ) -> None:
+        check_no_nans(static_data, "NaNs detected in the static data")
+        check_no_nans(temporal_data, "NaNs detected in the temporal data")
+        check_no_nans(observation_times, "NaNs detected in the temporal horizons")
+
     def _check_tensor(self, X: Union[torch.Tensor, np.ndarray]) -> torch.Tensor:
         if isinstance(X, torch.Tensor):
             return X.to(self.device)
@@ -500,44 +550,42 @@ class TimeSeriesModel(nn.Module):
     def _prepare_input(
         self,
         static_data: Union[List, np.ndarray],
-        temporal_data: Union[List, np.ndarray],
+        temporal_data: Union[List, np.ndarray, RaggedTimeSeries],
         observation_times: Union[List, np.ndarray],
         outcome: Optional[Union[List, np.ndarray]] = None,
     ) -> Tuple:
         static_data = np.asarray(static_data)
-        temporal_data = np.asarray(temporal_data)
-        observation_times = np.asarray(observation_times)
         if outcome is not None:
             outcome = np.asarray(outcome)
 
-        window_batches: Dict[int, List[int]] = {}
-        for idx, item in enumerate(observation_times):
-            window_len = len(item)
-            if window_len not in window_batches:
-                window_batches[window_len] = []
-            window_batches[window_len].append(idx)
+        lengths = batching.sequence_lengths(observation_times)
+        window_batches = batching.length_buckets(lengths, self.batching)
 
         static_data_mb = []
         temporal_data_mb = []
         observation_times_mb = []
         outcome_mb = []
+        lengths_mb = []
+
+        for indices in window_batches.values():
+            # Gather each bucket straight into a preallocated float32 array, which the tensor is a view of (on CPU).
+            local_lengths = lengths[indices]
+            static_data_t = batching.as_float32_tensor(static_data[indices], self.device)
+            temporal_data_t = batching.as_float32_tensor(
+                batching.gather_padded(temporal_data, indices, local_lengths), self.device
+            )
+            observation_times_t = batching.as_float32_tensor(
+                batching.gather_padded(observation_times, indices, local_lengths), self.device
+            )
+            self._check_input_nans(static_data_t, temporal_data_t, observation_times_t)
 
-        for widx in window_batches:
-            indices = window_batches[widx]
-
-            static_data_t = self._check_tensor(static_data[indices]).float()
-
-            local_temporal_data = np.array(temporal_data[indices].tolist()).astype(float)
-            temporal_data_t = self._check_tensor(local_temporal_data).float()
-            local_observation_times = np.array(observation_times[indices].tolist()).astype(float)
-            observation_times_t = self._check_tensor(local_observation_times).float()
-
+            lengths_mb.append(self._check_tensor(local_lengths))
             static_data_mb.append(static_data_t)
             temporal_data_mb.append(temporal_data_t)
             observation_times_mb.append(observation_times_t)
 
             if outcome is not None:
-                outcome_t = self._check_tensor(outcome[indices]).float()
+                outcome_t = batching.as_float32_tensor(outcome[indices], self.device)
 
                 if self.task_type == "classification":
                     outcome_t = outcome_t.long()
@@ -548,11 +596,15 @@ class TimeSeriesModel(nn.Module):
             temporal_data_mb,
             observation_times_mb,
             outcome_mb,
+            lengths_mb,
             window_batches,
         )
 
 
 class TimeSeriesLayer(nn.Module):
+    # Class-level default, for models pickled before this attribute was added.
+    nan_check: NaNCheck = "input"
+
     def __init__(
         self,
         n_static_units_in: int,
@@ -568,6 +620,7 @@ class TimeSeriesLayer(nn.Module):
         device: Any = constants.DEVICE,
         dropout: float = 0,
         nonlin: Nonlin = "relu",
+        nan_check: NaNCheck = "input",
     ) -> None:
         super(TimeSeriesLayer, self).__init__()
         temporal_params = {
@@ -650,6 +703,7 @@ class TimeSeriesLayer(nn.Module):
 
         self.device = device
         self.mode = mode
+        self.nan_check = nan_check
 
         if mode in ["RNN", "LSTM", "GRU"]:
             self.out = WindowLinearLayer(
@@ -677,22 +731,53 @@ class TimeSeriesLayer(nn.Module):
         self.temporal_layer.to(device)
         self.out.to(device)
 
-    def forward(self, static_data: torch.Tensor, temporal_data: torch.Tensor) -> torch.Tensor:
+    def forward(
+        self,
+        static_data: torch.Tensor,
+        temporal_data: torch.Tensor,
+        lengths: Optional[torch.Tensor] = None,
+    ) -> torch.Tensor:
+        """Forward pass. If ``lengths`` are given, ``temporal_data`` holds padded sequences of these lengths: the
+        recurrent and the ``"Transformer"`` modes skip the padding, the convolutional modes see it as is.
+        """
         if self.mode in ["RNN", "LSTM", "GRU"]:
-            X_interm, _ = self.temporal_layer(temporal_data)
+            if lengths is None:
+                X_interm, _ = self.temporal_layer(temporal_data)
+            else:
+                packed = nn.utils.rnn.pack_padded_sequence(
+                    temporal_data, lengths.cpu(), batch_first=True, enforce_sorted=False
+                )
+                X_packed, _ = self.temporal_layer(packed)
+                X_interm, _ = nn.utils.rnn.pad_packed_sequence(
+                    X_packed, batch_first=True, total_length=temporal_data.shape[1]
+                )
 
-            if torch.isnan(X_interm).sum() != 0:
-                raise RuntimeError("NaNs detected in the temporal embeddings")
+            if self.nan_check == "debug":
+                check_no_nans(X_interm, "NaNs detected in the temporal embeddings", RuntimeError)
 
-            return self.out(static_data, X_interm)
+            return self.out(static_data, X_interm, lengths)
         else:
-            X_interm = self.temporal_layer(torch.swapaxes(temporal_data, 1, 2))
+            if lengths is not None and self.mode == "Transformer":
+                X_interm = self._masked_transformer_forward(temporal_data, lengths)
+            else:
+                X_interm = self.temporal_layer(torch.swapaxes(temporal_data, 1, 2))
 
-            if torch.isnan(X_interm).sum() != 0:
-                raise RuntimeError("NaNs detected in the temporal embeddings")
+            if self.nan_check == "debug":
+                check_no_nans(X_interm, "NaNs detected in the temporal embeddings", RuntimeError)
 
             return self.out(torch.cat([static_data, X_interm], dim=1))
 
+    def _masked_transformer_forward(self, temporal_data: torch.Tensor, lengths: torch.Tensor) -> torch.Tensor:
+        # Same as ``TransformerModel.forward``, but with the padding masked out of the attention and of the max pooling.
+        layer = self.temporal_layer
+        padding_mask = torch.arange(temporal_data.shape[1], device=temporal_data.device)[None, :] >= lengths[:, None]
+
+        x = layer.relu(layer.inlinear(temporal_data.transpose(0, 1)))  # seq_len x bs x d_model
+        x = layer.transformer_encoder(x, src_key_padding_mask=padding_mask)
+        x = x.transpose(0, 1).masked_fill(padding_mask[:, :, None], -torch.inf)  # bs x seq_len x d_model
+        x = x.max(dim=1).values
+        return layer.outlinear(layer.relu(x))
+
 
 class WindowLinearLayer(nn.Module):
     @pydantic_utils.validate_arguments(config=pydantic.ConfigDict(arbitrary_types_allowed=True))
@@ -725,14 +810,28 @@ class WindowLinearLayer(nn.Module):
         )
 
     @pydantic_utils.validate_arguments(config=pydantic.ConfigDict(arbitrary_types_allowed=True))
-    def forward(self, static_data: torch.Tensor, temporal_data: torch.Tensor) -> torch.Tensor:
+    def forward(
+        self,
+        static_data: torch.Tensor,
+        temporal_data: torch.Tensor,
+        lengths: Optional[torch.Tensor] = None,
+    ) -> torch.Tensor:
         if self.n_static_units_in > 0 and len(static_data) != len(temporal_data):
             raise ValueError("Length mismatch between static and temporal data")
 
         batch_size, seq_len, n_feats = temporal_data.shape
-        temporal_batch = temporal_data[:, seq_len - self.window_size :, :].reshape(
-            batch_size, n_feats * self.window_size
-        )
+        if lengths is None:
+            temporal_window = temporal_data[:, seq_len - self.window_size :, :]
+        else:
+            # Padded sequences: take the last ``window_size`` valid steps of each sequence.
+            steps = (
+                lengths.to(temporal_data.device)[:, None]
+                - self.window_size
+                + torch.arange(self.window_size, device=temporal_data.device)
+            )
+            steps = steps.clamp(min=0)[:, :, None].expand(-1, -1, n_feats)
+            temporal_window = torch.gather(temporal_data, 1, steps)
+        temporal_batch = temporal_window.reshape(batch_size, n_feats * self.window_size)
         batch = torch.cat([static_data, temporal_batch], dim=1)
 
         return self.model(batch).to(self.device)
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, List, Optional, Tuple, Union
 
 import numpy as np
 import pydantic
@@ -13,11 +13,14 @@ from torch.utils.data import DataLoader, TensorDataset, sampler
 from typing_extensions import Literal
 
 from tempor.core import pydantic_utils
+from tempor.data.ragged import RaggedTimeSeries
 from tempor.log import logger as log
-from tempor.models.constants import DEVICE, ModelTaskType, Nonlin, ODEBackend
+from tempor.models import batching
+from tempor.models.constants import DEVICE, Batching, ModelTaskType, NaNCheck, Nonlin, ODEBackend
+from tempor.models.early_stopping import BestEpoch, EarlyStopping
 from tempor.models.mlp import MLP
 from tempor.models.samplers import ImbalancedDatasetSampler
-from tempor.models.utils import enable_reproducibility
+from tempor.models.utils import check_no_nans, enable_reproducibility
 
 Interpolation = Literal["cubic", "linear"]
 ILTAlgorithm = Literal["fourier", "dehoog", "cme", "fixed_tablot", "stehfest"]
@@ -185,6 +188,10 @@ class LaplaceFunc(nn.Module):
 
 
 class NeuralODE(torch.nn.Module):
+    # Class-level defaults, for models pickled before these attributes were added.
+    nan_check: NaNCheck = "input"
+    batching: Batching = "exact_length"
+
     def __init__(
         self,
         task_type: ModelTaskType,
@@ -217,6 +224,8 @@ class NeuralODE(torch.nn.Module):
         train_ratio: float = 0.8,
         device: Any = DEVICE,
         dataloader_sampler: Optional[sampler.Sampler] = None,
+        nan_check: NaNCheck = "input",
+        batching: Batching = "exact_length",
     ):
         r"""The model that computes the integral in: :math:`z_t = z_0 + \int_0^t f_\theta(z_s) dX_s`.
 
@@ -287,6 +296,14 @@ class NeuralODE(torch.nn.Module):
                 PyTorch device to use. Defaults to `~tempor.models.constants.DEVICE`.
             dataloader_sampler (Optional[sampler.Sampler], optional):
                 Custom data sampler for training. Defaults to `None`.
+            nan_check (NaNCheck, optional):
+                When to check for NaNs: once, in the input data, or also in every forward pass and training step (for
+                debugging). Available options: :obj:`~tempor.models.constants.NaNCheck`. Defaults to ``"input"``.
+            batching (Batching, optional):
+                How to batch samples of different sequence lengths. With ``"padded"``, the sequences (and observation
+                times) are padded with their last observation, and the solution is read at the end of each sequence.
+                Not supported by the ``"laplace"`` backend, which encodes the whole (padded) input. Available options:
+                :obj:`~tempor.models.constants.Batching`. Defaults to ``"exact_length"``.
         """
         super(NeuralODE, self).__init__()
 
@@ -294,6 +311,12 @@ class NeuralODE(torch.nn.Module):
         if len(output_shape) == 0:
             raise ValueError("Invalid output shape")
 
+        if batching == "padded" and backend == "laplace":
+            raise ValueError(
+                "Padded batching is not supported by the laplace backend, as the padding would change the encoding of "
+                "the shorter sequences"
+            )
+
         self.task_type = task_type
         self.backend = backend
 
@@ -389,11 +412,14 @@ class NeuralODE(torch.nn.Module):
         self.n_iter_min = n_iter_min
         self.batch_size = batch_size
         self.patience = patience
+        self.best_epoch: Optional[BestEpoch] = None
         self.clipping_value = clipping_value
         self.device = device
         self.train_ratio = train_ratio
         self.random_state = random_state
         self.dataloader_sampler = dataloader_sampler
+        self.nan_check = nan_check
+        self.batching = batching
 
         if self.backend == "laplace":
             # Kludge to make sure `torchlaplace` uses the correct device.
@@ -419,13 +445,9 @@ class NeuralODE(torch.nn.Module):
         temporal_data: torch.Tensor,
         observation_times: torch.Tensor,
     ) -> torch.Tensor:
-        # sanity
-        if torch.isnan(static_data).sum() != 0:
-            raise ValueError("NaNs detected in the static data")
-        if torch.isnan(temporal_data).sum() != 0:
-            raise ValueError("NaNs detected in the temporal data")
-        if torch.isnan(observation_times).sum() != 0:
-            raise ValueError("NaNs detected in the temporal horizons")
+        # NOTE: The inputs are checked for NaNs once, in `_prepare_input`.
+        if self.nan_check == "debug":
+            self._check_input_nans(static_data, temporal_data, observation_times)
 
         # Include the observation times as a channel in the dataset
         temporal_data_ext = torch.cat([temporal_data, observation_times.unsqueeze(-1)], dim=-1)
@@ -441,26 +463,39 @@ class NeuralODE(torch.nn.Module):
         else:
             raise RuntimeError(f"Invalid interpolation {self.interpolation}")
 
+        padded = self.batching == "padded"
+        if padded:
+            # The padding repeats the last observation time, so each sequence ends at the first occurrence of its last
+            # time: solve at every grid point, and read the solution of each sample there.
+            t = spline.grid_points
+            last = (observation_times < observation_times[:, -1:]).sum(dim=1)
+            samples = torch.arange(len(last), device=last.device)
+        else:
+            t = spline.interval
+
         # Solve the ODE using a solver
         if self.backend == "cde":
             #  Initial hidden state should be a function of the first observation.
             X0 = spline.evaluate(spline.interval[0])
             z0 = self.initial_temporal(X0)
 
-            z_T = torchcde.cdeint(X=spline, func=self.func, z0=z0, t=spline.interval, atol=self.atol, rtol=self.rtol)
-            z_T = z_T[:, 1]  # pyright: ignore
+            z_T = torchcde.cdeint(X=spline, func=self.func, z0=z0, t=t, atol=self.atol, rtol=self.rtol)
+            z_T = z_T[samples, last] if padded else z_T[:, 1]  # pyright: ignore
         elif self.backend == "ode":
             X_emb = self.initial_temporal(temporal_data_ext)
 
             z_T = torchdiffeq.odeint_adjoint(
                 self.func,
                 X_emb,
-                spline.interval,
+                t,
                 atol=self.atol,
                 rtol=self.rtol,
             )
-            z_T = z_T[1]  # pyright: ignore
-            z_T = z_T[:, -1, :]  # pyright: ignore  # Last time point.
+            if padded:
+                z_T = z_T[last, samples, last]  # pyright: ignore  # Last time point of each sample.
+            else:
+                z_T = z_T[1]  # pyright: ignore
+                z_T = z_T[:, -1, :]  # pyright: ignore  # Last time point.
         elif self.backend == "laplace":
             X_emb = self.initial_temporal(temporal_data_ext)
             z_T = torchlaplace.laplace_reconstruct(
@@ -486,7 +521,7 @@ class NeuralODE(torch.nn.Module):
     def predict(
         self,
         static_data: Union[List, np.ndarray, torch.Tensor],
-        temporal_data: Union[List, np.ndarray, torch.Tensor],
+        temporal_data: Union[List, np.ndarray, torch.Tensor, RaggedTimeSeries],
         observation_times: Union[List, np.ndarray, torch.Tensor],
     ) -> np.ndarray:
         self.eval()
@@ -500,14 +535,13 @@ class NeuralODE(torch.nn.Module):
             ) = self._prepare_input(static_data, temporal_data, observation_times)
 
             yt = torch.zeros(len(temporal_data), *self.output_shape).to(self.device)
-            for widx in range(len(temporal_data_t)):
-                window_size = len(observation_times_t[widx][0])
+            for widx, indices in enumerate(window_batches.values()):
                 local_yt = self(
                     static_data_t[widx],
                     temporal_data_t[widx],
                     observation_times_t[widx],
                 )
-                yt[window_batches[window_size]] = local_yt
+                yt[indices] = local_yt
 
             if self.task_type == "classification":
                 return np.argmax(yt.cpu().numpy(), -1)
@@ -518,7 +552,7 @@ class NeuralODE(torch.nn.Module):
     def predict_proba(
         self,
         static_data: Union[List, np.ndarray, torch.Tensor],
-        temporal_data: Union[List, np.ndarray, torch.Tensor],
+        temporal_data: Union[List, np.ndarray, torch.Tensor, RaggedTimeSeries],
         observation_times: Union[List, np.ndarray, torch.Tensor],
     ) -> np.ndarray:
         self.eval()
@@ -534,21 +568,20 @@ class NeuralODE(torch.nn.Module):
             ) = self._prepare_input(static_data, temporal_data, observation_times)
 
             yt = torch.zeros(len(temporal_data), *self.output_shape).to(self.device)
-            for widx in range(len(temporal_data_t)):
-                window_size = len(observation_times_t[widx][0])
+            for widx, indices in enumerate(window_batches.values()):
                 local_yt = self(
                     static_data_t[widx],
                     temporal_data_t[widx],
                     observation_times_t[widx],
                 )
-                yt[window_batches[window_size]] = local_yt
+                yt[indices] = local_yt
 
             return yt.cpu().numpy()
 
     def score(
         self,
         static_data: Union[List, np.ndarray, torch.Tensor],
-        temporal_data: Union[List, np.ndarray, torch.Tensor],
+        temporal_data: Union[List, np.ndarray, torch.Tensor, RaggedTimeSeries],
         observation_times: Union[List, np.ndarray, torch.Tensor],
         outcome: Union[List, np.ndarray],
     ) -> float:
@@ -563,7 +596,7 @@ class NeuralODE(torch.nn.Module):
     def fit(
         self,
         static_data: Union[List, np.ndarray, torch.Tensor],
-        temporal_data: Union[List, np.ndarray, torch.Tensor],
+        temporal_data: Union[List, np.ndarray, torch.Tensor, RaggedTimeSeries],
         observation_times: Union[List, np.ndarray, torch.Tensor],
         outcome: Union[List, np.ndarray, torch.Tensor],
     ) -> Any:
@@ -585,9 +618,6 @@ class NeuralODE(torch.nn.Module):
         observation_times: List[torch.Tensor],
         outcome: List[torch.Tensor],
     ) -> Any:
-        patience = 0
-        prev_error = np.inf
-
         train_dataloaders = []
         test_dataloaders = []
         for widx in range(len(temporal_data)):
@@ -601,20 +631,18 @@ class NeuralODE(torch.nn.Module):
             test_dataloaders.append(test_dl)
 
         # training and testing
+        early_stopping = EarlyStopping(self, patience=self.patience, min_epochs=self.n_iter_min)
         for it in range(self.n_iter):
             train_loss = self._train_epoch(train_dataloaders)
-            if (it + 1) % self.n_iter_print == 0:
+            # The last epoch is always evaluated, so that its weights are candidates for the best ones.
+            if (it + 1) % self.n_iter_print == 0 or it == self.n_iter - 1:
                 val_loss = self._test_epoch(test_dataloaders)
                 log.info(f"Epoch:{it}| train loss: {train_loss}, validation loss: {val_loss}")
 
-                if val_loss < prev_error:
-                    patience = 0
-                    prev_error = val_loss
-                else:
-                    patience += 1
-                if patience > self.patience:
+                if early_stopping.step(it, val_loss):
                     break
 
+        self.best_epoch = early_stopping.restore()
         return self
 
     def _train_epoch(self, loaders: List[DataLoader]) -> float:
@@ -628,8 +656,8 @@ class NeuralODE(torch.nn.Module):
                 self.optimizer.zero_grad()  # clear gradients for this training step
 
                 pred = self(static_mb, temporal_mb, horizons_mb)  # rnn output
-                if torch.isnan(pred).sum() > 0:  # pragma: no cover
-                    raise RuntimeError("NaNs in the training prediction")
+                if self.nan_check == "debug":
+                    check_no_nans(pred, "NaNs in the training prediction", RuntimeError)
 
                 loss = self.loss(pred.squeeze(), y_mb.squeeze())
 
@@ -641,13 +669,18 @@ class NeuralODE(torch.nn.Module):
                     )
                 self.optimizer.step()  # apply gradients
 
-                if torch.isnan(loss):  # pragma: no cover
-                    raise RuntimeError("NaNs in the loss")
+                if self.nan_check == "debug":
+                    check_no_nans(loss, "NaNs in the loss", RuntimeError)
 
-                losses.append(loss.detach().cpu())
+                losses.append(loss.detach())
 
-        return float(np.mean(losses))
+        # Only synchronize with the device once per epoch.
+        epoch_loss = float(torch.stack(losses).mean())
+        if np.isnan(epoch_loss):  # pragma: no cover
+            raise RuntimeError("NaNs in the loss")
+        return epoch_loss
 
+    @torch.no_grad()
     def _test_epoch(self, loaders: List[DataLoader]) -> float:
         self.eval()
 
@@ -657,13 +690,13 @@ class NeuralODE(torch.nn.Module):
                 loader
             ):
                 pred = self(static_mb, temporal_mb, horizons_mb)  # ODE output
-                if torch.isnan(pred).sum() > 0:  # pragma: no cover
-                    raise RuntimeError("NaNs in the test prediction")
+                if self.nan_check == "debug":
+                    check_no_nans(pred, "NaNs in the test prediction", RuntimeError)
                 loss = self.loss(pred.squeeze(), y_mb.squeeze())
 
-                losses.append(loss.detach().cpu())
+                losses.append(loss.detach())
 
-        return float(np.mean(losses))
+        return float(torch.stack(losses).mean())
 
     def dataloader(
         self,
@@ -727,6 +760,16 @@ class NeuralODE(torch.nn.Module):
             ),
         )
 
+    def _check_input_nans(
+        self,
+        static_data: torch.Tensor,
+        temporal_data: torch.Tensor,
+        observation_times: torch.Tensor,
+    ) -> None:
+        check_no_nans(static_data, "NaNs detected in the static data")
+        check_no_nans(temporal_data, "NaNs detected in the temporal data")
+        check_no_nans(observation_times, "NaNs detected in the temporal horizons")
+
     def _check_tensor(self, X: Union[torch.Tensor, np.ndarray]) -> torch.Tensor:
         if isinstance(X, torch.Tensor):
             return X.to(self.device)
@@ -736,44 +779,40 @@ class NeuralODE(torch.nn.Module):
     def _prepare_input(
         self,
         static_data: Union[List, np.ndarray, torch.Tensor],
-        temporal_data: Union[List, np.ndarray, torch.Tensor],
+        temporal_data: Union[List, np.ndarray, torch.Tensor, RaggedTimeSeries],
         observation_times: Union[List, np.ndarray, torch.Tensor],
         outcome: Optional[Union[List, np.ndarray, torch.Tensor]] = None,
     ) -> Tuple:
         static_data = np.asarray(static_data)
-        temporal_data = np.asarray(temporal_data)
-        observation_times = np.asarray(observation_times)
         if outcome is not None:
             outcome = np.asarray(outcome)
 
-        window_batches: Dict[int, List[int]] = {}
-        for idx, item in enumerate(observation_times):
-            window_len = len(item)
-            if window_len not in window_batches:
-                window_batches[window_len] = []
-            window_batches[window_len].append(idx)
+        lengths = batching.sequence_lengths(observation_times)
+        window_batches = batching.length_buckets(lengths, self.batching)
 
         static_data_mb = []
         temporal_data_mb = []
         observation_times_mb = []
         outcome_mb = []
 
-        for widx in window_batches:
-            indices = window_batches[widx]
-
-            static_data_t = self._check_tensor(static_data[indices]).float()
-
-            local_temporal_data = np.array(temporal_data[indices].tolist()).astype(float)
-            temporal_data_t = self._check_tensor(local_temporal_data).float()
-            local_observation_times = np.array(observation_times[indices].tolist()).astype(float)
-            observation_times_t = self._check_tensor(local_observation_times).float()
+        for indices in window_batches.values():
+            # Gather each bucket straight into a preallocated float32 array, which the tensor is a view of (on CPU).
+            local_lengths = lengths[indices]
+            static_data_t = batching.as_float32_tensor(static_data[indices], self.device)
+            temporal_data_t = batching.as_float32_tensor(
+                batching.gather_padded(temporal_data, indices, local_lengths, fill="last"), self.device
+            )
+            observation_times_t = batching.as_float32_tensor(
+                batching.gather_padded(observation_times, indices, local_lengths, fill="last"), self.device
+            )
+            self._check_input_nans(static_data_t, temporal_data_t, observation_times_t)
 
             static_data_mb.append(static_data_t)
             temporal_data_mb.append(temporal_data_t)
             observation_times_mb.append(observation_times_t)
 
             if outcome is not None:
-                outcome_t = self._check_tensor(outcome[indices]).float()
+                outcome_t = batching.as_float32_tensor(outcome[indices], self.device)
 
                 if self.task_type == "classification":
                     outcome_t = outcome_t.long()
@@ -1,7 +1,8 @@
+import contextlib
 import os
 import random
 import warnings
-from typing import Any, Dict, Type, Union
+from typing import Any, Callable, ContextManager, Dict, Optional, Tuple, Type, Union
 
 import numpy as np
 import torch
@@ -12,8 +13,9 @@ from packaging.version import Version
 from torch import nn
 
 import tempor.core.utils
+from tempor.log import logger as log
 
-from .constants import DEVICE, Nonlin, Samp
+from .constants import DEVICE, ExecutionMode, Nonlin, Samp
 
 
 def enable_reproducibility(
@@ -143,3 +145,100 @@ def get_device(device: Union[None, int, str, torch.device]) -> torch.device:
         return DEVICE
     else:
         return torch.device(device)
+
+
+def check_no_nans(tensor: torch.Tensor, message: str, error: Type[Exception] = ValueError) -> None:
+    """Raise ``error`` with ``message`` if ``tensor`` contains NaNs. A single fused reduction, but it synchronizes with
+    the device, so should not be called on every step of a training or inference loop other than for debugging (see
+    :obj:`~tempor.models.constants.NaNCheck`).
+
+    Args:
+        tensor (torch.Tensor): The tensor to check.
+        message (str): The error message.
+        error (Type[Exception], optional): The exception type to raise. Defaults to `ValueError`.
+    """
+    if torch.isnan(tensor).any():
+        raise error(message)
+
+
+def bf16_autocast_supported(device: Union[str, torch.device]) -> bool:
+    """Whether bfloat16 ``torch.autocast`` is supported on ``device``.
+
+    Args:
+        device (Union[str, torch.device]): The device.
+
+    Returns:
+        bool: Whether bfloat16 autocast is supported.
+    """
+    device_type = torch.device(device).type
+    if device_type == "cuda":
+        return torch.cuda.is_available() and torch.cuda.is_bf16_supported()
+    if device_type == "cpu":
+        is_autocast_available: Optional[Callable] = getattr(torch.amp.autocast_mode, "is_autocast_available", None)
+        return is_autocast_available is None or is_autocast_available("cpu")
+    return False
+
+
+def autocast_context(execution_mode: ExecutionMode, device: Union[str, torch.device]) -> ContextManager:
+    """The ``torch.autocast`` context for ``execution_mode``: bfloat16 autocast for the ``"bf16"`` modes (where
+    supported on ``device``, see `bf16_autocast_supported`), otherwise a no-op context.
+
+    Args:
+        execution_mode (ExecutionMode): The execution mode.
+        device (Union[str, torch.device]): The device the model runs on.
+
+    Returns:
+        ContextManager: The context to run the forward passes (and the loss) in.
+    """
+    if execution_mode in ("bf16", "compile_bf16") and bf16_autocast_supported(device):
+        return torch.autocast(device_type=torch.device(device).type, dtype=torch.bfloat16)
+    return contextlib.nullcontext()
+
+
+def _compilation_errors() -> Tuple[Type[BaseException], ...]:
+    # The dynamo exceptions (these include ``BackendCompilerFailed``, which wraps the inductor errors), if available.
+    try:
+        from torch._dynamo.exc import BackendCompilerFailed, TorchDynamoException
+    except ImportError:  # pragma: no cover
+        return tuple()
+    return (BackendCompilerFailed, TorchDynamoException)
+
+
+class CompiledModule:
+    def __init__(self, module: nn.Module) -> None:
+        """Call ``module`` compiled with ``torch.compile``, falling back to the (eager) ``module`` if compilation is
+        unavailable or fails (errors raised by ``module`` itself are not caught). Compilation is lazy, on the first
+        call. This is not an `nn.Module` itself, so does not change the parameters or the state dict of the model it
+        is an attribute of; the compiled module is also not pickled (it is recompiled after unpickling).
+
+        Args:
+            module (nn.Module): The module to compile.
+        """
+        self.module = module
+        self.failed = not hasattr(torch, "compile")
+        self._compiled: Optional[Callable] = None
+
+    def _fall_back(self, e: BaseException) -> None:
+        log.warning(f"torch.compile failed, falling back to eager execution: {e}")
+        self.failed = True
+        self._compiled = None
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        if not self.failed and self._compiled is None:
+            try:
+                self._compiled = torch.compile(self.module)  # type: ignore [attr-defined]
+            except Exception as e:  # pylint: disable=broad-except
+                # Only wraps the module, so any error here means compilation is unavailable (e.g. unsupported Python).
+                self._fall_back(e)
+        if not self.failed and self._compiled is not None:
+            try:
+                return self._compiled(*args, **kwargs)
+            except _compilation_errors() as e:
+                # Only compiler failures fall back, errors raised by the module itself propagate.
+                self._fall_back(e)
+        return self.module(*args, **kwargs)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_compiled"] = None
+        return state
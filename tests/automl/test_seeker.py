@@ -44,6 +44,86 @@ def test_init_fails_estimator_name_def_length_mismatch():
         MySeeker()
 
 
+@pytest.mark.parametrize("prune", [False, True])
+def test_evaluation_callback_dispatch_reports_folds(prune: bool, get_dataset: Callable):
+    import optuna
+
+    from tempor import plugin_loader
+    from tempor.automl.seeker import evaluation_callback_dispatch
+    from tempor.automl.tuner import _active_trial_scope
+
+    # Prune any trial with an MSE above 0, or none.
+    pruner = optuna.pruners.ThresholdPruner(upper=0.0 if prune else float("inf"))
+    study = optuna.create_study(direction="minimize", pruner=pruner)
+    trial = study.ask()
+
+    def dispatch():
+        return evaluation_callback_dispatch(
+            plugin_loader.get_class("prediction.one_off.regression.nn_regressor"),
+            get_dataset("sine_data_full"),
+            task_type="prediction.one_off.regression",
+            metric="mse",
+            n_cv_folds=3,
+            random_state=0,
+            horizon=None,
+            raise_exceptions=True,
+            silence_warnings=False,
+            n_iter=2,
+        )
+
+    with _active_trial_scope(trial):
+        if prune:
+            with pytest.raises(optuna.TrialPruned):
+                dispatch()
+        else:
+            score = dispatch()
+
+    intermediate_values = study.trials[0].intermediate_values
+    if prune:
+        assert list(intermediate_values.keys()) == [0]
+    else:
+        assert list(intermediate_values.keys()) == [0, 1, 2]
+        assert intermediate_values[2] == pytest.approx(score)
+
+
+def test_trial_fold_callback_skips_failed_folds():
+    import optuna
+
+    from tempor.automl.seeker import _trial_fold_callback
+    from tempor.automl.tuner import _active_trial_scope
+
+    study = optuna.create_study(direction="minimize", pruner=optuna.pruners.ThresholdPruner(upper=1.0))
+    trial = study.ask()
+
+    with _active_trial_scope(trial):
+        report_fold = _trial_fold_callback("mse")
+        assert report_fold is not None
+        report_fold(0, {})  # Failed fold.
+        with pytest.raises(optuna.TrialPruned):
+            report_fold(1, {"mse": 2.0})
+
+    assert study.trials[0].intermediate_values == {1: 2.0}
+
+
+def test_fidelity_estimator_kwargs():
+    from tempor import plugin_loader
+    from tempor.automl.seeker import _fidelity_estimator_kwargs
+    from tempor.methods.pipeline import pipeline
+
+    estimator = plugin_loader.get_class("prediction.one_off.regression.nn_regressor")
+    assert _fidelity_estimator_kwargs(estimator, {"n_iter": 90, "lr": 0.1}, 1 / 9) == {"n_iter": 10, "lr": 0.1}
+    assert _fidelity_estimator_kwargs(estimator, {}, 0.1) == {"n_iter": 50}  # From the default `n_iter` of 500.
+
+    pipe = pipeline(
+        ["preprocessing.scaling.temporal.ts_minmax_scaler", "prediction.one_off.regression.nn_regressor"],
+    )
+    kwargs = {"plugin_params": {"ts_minmax_scaler": {}, "nn_regressor": {"n_iter": 30}}}
+    assert _fidelity_estimator_kwargs(pipe, kwargs, 1 / 3) == {
+        "plugin_params": {"ts_minmax_scaler": {}, "nn_regressor": {"n_iter": 10}}
+    }
+    assert kwargs["plugin_params"]["nn_regressor"]["n_iter"] == 30  # Not mutated.
+
+
 @pytest.fixture
 def patch_slow(monkeypatch, request):
     # Monkeypatch all the slow things for ease of unit testing, specifically:
@@ -492,6 +572,168 @@ class TestMethodSeeker:
         for est in estimators:
             assert est.name in estimator_names
 
+    def test_init_fails_n_jobs_custom_tuner_unsupported(self, get_dataset: Callable):
+        from tempor.automl.tuner import BaseTuner
+
+        class MyTuner(BaseTuner):
+            def tune(self, *args, **kwargs):
+                return [], []
+
+        with pytest.raises(ValueError, match=".*n_jobs.*only supported.*"):
+            MethodSeeker(
+                study_name="test_study",
+                task_type="prediction.one_off.regression",
+                estimator_names=["nn_regressor"],
+                metric="mse",
+                dataset=get_dataset("sine_data_full"),
+                custom_tuner=MyTuner(study_name="test_study", direction="minimize"),
+                n_jobs=2,
+            )
+
+    @pytest.mark.parametrize("warm_start_study_name", ["previous_study", "missing_study"])
+    def test_init_warm_start(self, warm_start_study_name: str, tmp_path, get_dataset: Callable):
+        import optuna
+
+        storage = f"sqlite:///{tmp_path / 'studies.db'}"
+        previous = optuna.create_study(study_name="previous_study_nn_regressor", storage=storage)
+        previous.enqueue_trial({"n_iter": 10})
+        previous.optimize(lambda trial: trial.suggest_categorical("n_iter", [10, 20]), n_trials=2)
+
+        seeker = MethodSeeker(
+            study_name="test_study",
+            task_type="prediction.one_off.regression",
+            estimator_names=["nn_regressor"],
+            metric="mse",
+            dataset=get_dataset("sine_data_full"),
+            warm_start_storage=storage,
+            warm_start_study_name=warm_start_study_name,
+            warm_start_n_trials=1,
+        )
+
+        warm_start_trials = seeker.tuners[0]._warm_start_trials  # pyright: ignore # pylint: disable=protected-access
+        if warm_start_study_name == "previous_study":
+            assert [t.params for t in warm_start_trials] == [{"n_iter": 10}]  # The lower MSE.
+        else:
+            assert warm_start_trials == []
+
+    @pytest.mark.parametrize(
+        "multi_fidelity,pruner_name",
+        [
+            (None, "PatientPruner"),
+            ("successive_halving", "SuccessiveHalvingPruner"),
+            ("hyperband", "HyperbandPruner"),
+        ],
+    )
+    def test_init_multi_fidelity(self, multi_fidelity, pruner_name: str, get_dataset: Callable):
+        seeker = MethodSeeker(
+            study_name="test_study",
+            task_type="prediction.one_off.regression",
+            estimator_names=["nn_regressor"],
+            metric="mse",
+            dataset=get_dataset("sine_data_full"),
+            multi_fidelity=multi_fidelity,
+        )
+        assert seeker.tuners[0].study_pruner.__class__.__name__ == pruner_name  # pyright: ignore
+        if multi_fidelity is None:
+            assert seeker._fidelity_fractions() is None  # pylint: disable=protected-access
+        else:
+            assert seeker._fidelity_fractions() == pytest.approx(
+                [1 / 9, 1 / 3, 1.0]
+            )  # pylint: disable=protected-access
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            dict(fidelity_levels=1),
+            dict(fidelity_reduction_factor=1),
+        ],
+    )
+    def test_init_fails_multi_fidelity(self, kwargs, get_dataset: Callable):
+        with pytest.raises(ValueError, match=".*must be at least 2.*"):
+            MethodSeeker(
+                study_name="test_study",
+                task_type="prediction.one_off.regression",
+                estimator_names=["nn_regressor"],
+                metric="mse",
+                dataset=get_dataset("sine_data_full"),
+                multi_fidelity="successive_halving",
+                **kwargs,
+            )
+
+    @pytest.mark.slow
+    def test_search_end2end_multi_fidelity(self, get_dataset: Callable):
+        import optuna
+
+        override_hp_space = {
+            "nn_regressor": [
+                CategoricalParams(name="n_iter", choices=[9, 18]),
+                CategoricalParams(name="lr", choices=[1e-2, 1e-3, 1e-4]),
+            ],
+        }
+        seeker = MethodSeeker(
+            study_name="test_study",
+            task_type="prediction.one_off.regression",
+            estimator_names=["nn_regressor"],
+            metric="mse",
+            dataset=get_dataset("sine_data_full"),
+            return_top_k=1,
+            num_iter=6,
+            num_cv_folds=2,
+            override_hp_space=override_hp_space,  # type: ignore
+            multi_fidelity="successive_halving",
+        )
+
+        estimators, scores = seeker.search()
+
+        assert len(estimators) == len(scores) == 1
+        trials = seeker.tuners[0].study.trials  # pyright: ignore
+        complete = [t for t in trials if t.state == optuna.trial.TrialState.COMPLETE]
+        for trial in trials:
+            assert min(trial.intermediate_values.keys()) == 1  # Lowest fidelity.
+        for trial in complete:
+            assert list(trial.intermediate_values.keys()) == [1, 3, 9]
+            assert trial.intermediate_values[9] == trial.value  # Full fidelity.
+        # Selection uses the full fidelity scores only.
+        assert scores[0] == min(t.value for t in complete)
+
+    @pytest.mark.slow
+    def test_search_end2end_n_jobs(self, get_dataset: Callable):
+        estimator_names = [
+            "nn_regressor",
+            "ode_regressor",
+        ]
+        override_hp_space = {
+            name: [
+                CategoricalParams(name="n_iter", choices=[2]),
+                CategoricalParams(name="lr", choices=[1e-2, 1e-3, 1e-4]),
+            ]
+            for name in estimator_names
+        }
+        dataset = get_dataset("sine_data_full")
+
+        seeker = MethodSeeker(
+            study_name="test_study",
+            task_type="prediction.one_off.regression",
+            estimator_names=estimator_names,
+            metric="mse",
+            dataset=dataset,
+            return_top_k=2,
+            num_iter=3,
+            num_cv_folds=2,
+            override_hp_space=override_hp_space,  # type: ignore
+            n_jobs=2,
+        )
+
+        estimators, scores = seeker.search()
+
+        assert len(estimators) == len(scores) == 2
+        for est in estimators:
+            assert est.name in estimator_names
+        assert sorted(scores, reverse=False) == scores
+        # The trial budget is shared by the workers of each study.
+        for tuner in seeker.tuners:
+            assert len(tuner.study.trials) == 3  # pyright: ignore
+
 
 class TestPipelineSeeker:
     @pytest.mark.parametrize("tuner_type", ["bayesian", "random", "cmaes", "qmc"])
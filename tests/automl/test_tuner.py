@@ -14,7 +14,7 @@ from tempor.automl import OptimDirection, tuner
 from tempor.benchmarks import evaluation
 from tempor.data.dataset import PredictiveDataset, TimeToEventAnalysisDataset
 from tempor.methods.core._base_predictor import BasePredictor
-from tempor.methods.core._params import IntegerParams
+from tempor.methods.core._params import CategoricalParams, IntegerParams
 
 # To ignore warnings in parametrization:
 warnings.filterwarnings("ignore", category=optuna.exceptions.ExperimentalWarning)
@@ -678,3 +678,59 @@ class TestOptunaTuner:
             metric="aucroc",
             direction="maximize",
         )
+
+
+def _warm_start_source_study() -> optuna.Study:
+    source = optuna.create_study(study_name="source", direction="maximize")
+    distributions = {
+        "n_iter": optuna.distributions.CategoricalDistribution([1, 2, 3, 7]),
+        "lr": optuna.distributions.CategoricalDistribution([0.1, 0.01]),
+        "old_param": optuna.distributions.IntDistribution(1, 10),
+    }
+    for params, value in [
+        (dict(n_iter=3, lr=0.1, old_param=5), 0.9),
+        (dict(n_iter=7, lr=0.01, old_param=5), 0.8),  # `n_iter` outside of the current space.
+        (dict(n_iter=1, lr=0.1, old_param=1), 0.1),
+    ]:
+        source.add_trial(optuna.trial.create_trial(params=params, distributions=distributions, value=value))
+    return source
+
+
+@pytest.mark.parametrize("transfer_sampler_state", [False, True])
+def test_tune_warm_start(transfer_sampler_state: bool):
+    estimator = plugin_loader.get_class("prediction.one_off.classification.nn_classifier")
+    hp_space = [CategoricalParams("n_iter", [1, 2, 3]), CategoricalParams("lr", [0.1, 0.01])]
+    evaluation_callback = Mock(side_effect=lambda estimator, dataset, n_iter, lr: n_iter * lr)
+
+    tuner_ = tuner.OptunaTuner(
+        study_name="test_study",
+        direction="maximize",
+        study_sampler=optuna.samplers.TPESampler(seed=SEED),
+    )
+    tuner_.warm_start(_warm_start_source_study(), n_trials=2, transfer_sampler_state=transfer_sampler_state)
+    scores, params = tuner_.tune(
+        estimator=estimator,
+        dataset=Mock(),
+        evaluation_callback=evaluation_callback,
+        override_hp_space=hp_space,
+        compute_baseline_score=False,
+        optimize_kwargs={"n_trials": 3},
+    )
+
+    # The best two source trials, filtered to the current hyperparameter space, run first.
+    assert params[0] == dict(n_iter=3, lr=0.1)
+    assert params[1]["lr"] == 0.01 and params[1]["n_iter"] in [1, 2, 3]
+    assert len(scores) == len(params) == evaluation_callback.call_count == 3
+
+    history = [t for t in tuner_.study.get_trials() if tuner.is_warm_start_history(t)]
+    assert len(history) == (3 if transfer_sampler_state else 0)
+
+
+def test_warm_start_fails_direction_mismatch():
+    tuner_ = tuner.OptunaTuner(
+        study_name="test_study",
+        direction="minimize",
+        study_sampler=optuna.samplers.TPESampler(seed=SEED),
+    )
+    with pytest.raises(ValueError, match=".*different direction.*"):
+        tuner_.warm_start(_warm_start_source_study())
@@ -1,16 +1,21 @@
+import os
 import sys
+import time
 from typing import Callable
 
+import numpy as np
 import pytest
 
 from tempor import plugin_loader
 from tempor.benchmarks import (
     benchmark_models,
     classifier_supported_metrics,
+    evaluate_prediction_oneoff_regressor,
     regression_supported_metrics,
     time_to_event_supported_metrics,
     visualize_benchmark,
 )
+from tempor.benchmarks.benchmark import _work_unit_limits, print_score
 from tempor.methods.pipeline import pipeline
 
 N_ITER = 5
@@ -154,3 +159,97 @@ def test_time_to_event_benchmark(
 
         for testcase, _ in testcases:
             assert metric in per_test_score[testcase].index
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_benchmark_work_units(n_jobs: int, sine_data_full) -> None:
+    # NOTE: `sine_data_full` as the regression datasets used above need to be downloaded.
+    testcases = [
+        (
+            "pipeline1",
+            pipeline(
+                [
+                    "preprocessing.imputation.static.static_tabular_imputer",
+                    PREDICTOR_REGRESSION,
+                ]
+            )({"nn_regressor": {"n_iter": N_ITER}}),
+        ),
+        (
+            "plugin1",
+            plugin_loader.get(PREDICTOR_REGRESSION, n_iter=N_ITER),
+        ),
+    ]
+
+    aggr_score, per_test_score = benchmark_models(
+        task_type="prediction.one_off.regression",
+        tests=testcases,
+        data=sine_data_full,
+        n_splits=2,
+        random_state=0,
+        n_jobs=n_jobs,
+    )
+
+    assert aggr_score.columns.tolist() == ["pipeline1", "plugin1"]
+    for testcase, model in testcases:
+        assert per_test_score[testcase].index.tolist() == list(regression_supported_metrics)
+        # Same seeding per fold as the evaluation helper with `n_jobs` set.
+        scores = evaluate_prediction_oneoff_regressor(model, sine_data_full, n_splits=2, random_state=0, n_jobs=1)
+        expected = print_score(scores["mean"].astype(float), scores["stddev"].astype(float))
+        assert aggr_score[testcase].tolist() == expected.tolist()
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="Work unit limits are only supported on POSIX systems.")
+def test_benchmark_work_units_timeout(sine_data_full) -> None:
+    testcases = [("plugin1", plugin_loader.get(PREDICTOR_REGRESSION, n_iter=1000))]
+
+    _, per_test_score = benchmark_models(
+        task_type="prediction.one_off.regression",
+        tests=testcases,
+        data=sine_data_full,
+        n_splits=2,
+        timeout=0.01,
+    )
+
+    assert per_test_score["plugin1"]["mean"].to_numpy(dtype=float) == pytest.approx(0.0)  # All units timed out.
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="Work unit limits are only supported on POSIX systems.")
+def test_benchmark_work_units_worker_dies(sine_data_full) -> None:
+    crashing = plugin_loader.get(PREDICTOR_REGRESSION, n_iter=N_ITER)
+    crashing.fit = lambda *args, **kwargs: os._exit(1)  # Kill the worker process, as e.g. the OOM killer would.
+    testcases = [("crashing", crashing), ("plugin1", plugin_loader.get(PREDICTOR_REGRESSION, n_iter=N_ITER))]
+
+    _, per_test_score = benchmark_models(
+        task_type="prediction.one_off.regression",
+        tests=testcases,
+        data=sine_data_full,
+        n_splits=2,
+        n_jobs=2,
+    )
+
+    assert per_test_score["crashing"]["mean"].to_numpy(dtype=float) == pytest.approx(0.0)  # Counted as errors.
+    scores = evaluate_prediction_oneoff_regressor(testcases[1][1], sine_data_full, n_splits=2, random_state=0, n_jobs=1)
+    assert per_test_score["plugin1"]["mean"].to_numpy(dtype=float) == pytest.approx(
+        scores["mean"].to_numpy(dtype=float)
+    )
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Relies on /proc to get the process memory use.")
+def test_work_unit_limits_memory() -> None:
+    with open("/proc/self/status", encoding="utf-8") as f:
+        vm_size_kb = next(int(line.split()[1]) for line in f if line.startswith("VmSize:"))
+    memory_limit = (vm_size_kb + 100_000) * 1024
+
+    with pytest.raises(MemoryError):
+        with _work_unit_limits(timeout=None, memory_limit=memory_limit):
+            np.ones(500_000_000)
+
+    # The limit is lifted after the work unit.
+    assert np.ones(50_000_000).sum() == 50_000_000
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="Work unit limits are only supported on POSIX systems.")
+def test_work_unit_limits_timeout() -> None:
+    with pytest.raises(TimeoutError):
+        with _work_unit_limits(timeout=0.05, memory_limit=None):
+            time.sleep(1.0)
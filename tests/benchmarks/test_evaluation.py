@@ -1,6 +1,7 @@
-from typing import Any, Callable
+from typing import Any, Callable, Dict, Optional
 from unittest.mock import Mock
 
+import numpy as np
 import pytest
 
 from tempor import plugin_loader
@@ -9,6 +10,7 @@ from tempor.benchmarks import (
     evaluate_prediction_oneoff_classifier,
     evaluate_prediction_oneoff_regressor,
     evaluate_time_to_event,
+    evaluation,
     output_metrics,
     regression_supported_metrics,
     time_to_event_supported_metrics,
@@ -209,6 +211,87 @@ def test_evaluate_prediction_oneoff_regressor_error(
         assert (scores["errors"] > 0).all()
 
 
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_evaluate_prediction_oneoff_regressor_n_jobs(n_jobs: int, sine_data_full) -> None:
+    # NOTE: `sine_data_full` as the regression datasets used above need to be downloaded.
+    model = plugin_loader.get(PREDICTOR_REGRESSION, n_iter=N_ITER)
+
+    scores_reference = evaluate_prediction_oneoff_regressor(model, sine_data_full, n_splits=3, n_jobs=1)
+    scores = evaluate_prediction_oneoff_regressor(model, sine_data_full, n_splits=3, n_jobs=n_jobs)
+
+    for out_metric in output_metrics:
+        assert out_metric in scores
+    assert (scores["rounds"] == 3).all()
+    assert (scores["errors"] == 0).all()
+    compare = ["min", "max", "mean", "stddev", "median", "iqr"]
+    assert scores[compare].to_numpy(dtype=float) == pytest.approx(scores_reference[compare].to_numpy(dtype=float))
+
+
+def test_evaluate_prediction_oneoff_regressor_n_jobs_error(sine_data_small) -> None:
+    p = plugin_loader.get(PREDICTOR_REGRESSION, n_iter=N_ITER)
+
+    def raise_(*args, **kwargs):
+        raise ValueError("test error")
+
+    p.fit = raise_  # type: ignore
+
+    scores = evaluate_prediction_oneoff_regressor(p, sine_data_small, n_splits=3, n_jobs=2)
+    assert (scores["errors"] == 3).all()
+
+    with pytest.raises(ValueError, match=".*test error.*"):
+        evaluate_prediction_oneoff_regressor(p, sine_data_small, n_splits=3, n_jobs=2, raise_exceptions=True)
+
+
+@pytest.mark.parametrize("n_jobs", [None, 1, 2])
+def test_evaluate_prediction_oneoff_regressor_fold_callback(n_jobs: Optional[int], sine_data_full) -> None:
+    model = plugin_loader.get(PREDICTOR_REGRESSION, n_iter=N_ITER)
+    calls = []
+
+    def fold_callback(fold_idx: int, scores: Dict[str, float]) -> None:
+        calls.append((fold_idx, scores))
+
+    scores = evaluate_prediction_oneoff_regressor(
+        model, sine_data_full, n_splits=3, n_jobs=n_jobs, fold_callback=fold_callback
+    )
+
+    assert [fold_idx for fold_idx, _ in calls] == [0, 1, 2]
+    for _, fold_scores in calls:
+        assert sorted(fold_scores.keys()) == sorted(regression_supported_metrics)
+    assert scores.loc["mse", "mean"] == pytest.approx(np.mean([fold_scores["mse"] for _, fold_scores in calls]))
+
+
+@pytest.mark.parametrize("n_jobs", [None, 2])
+def test_evaluate_prediction_oneoff_regressor_fold_callback_stops_early(n_jobs: Optional[int], sine_data_full) -> None:
+    model = plugin_loader.get(PREDICTOR_REGRESSION, n_iter=N_ITER)
+    calls = []
+
+    def fold_callback(fold_idx: int, scores: Dict[str, float]) -> None:
+        calls.append(fold_idx)
+        raise RuntimeError("stop")
+
+    with pytest.raises(RuntimeError, match="stop"):
+        evaluate_prediction_oneoff_regressor(
+            model, sine_data_full, n_splits=3, n_jobs=n_jobs, fold_callback=fold_callback
+        )
+    assert calls == [0]
+
+
+def test_data_snapshot_cache_bounded(tmp_path, sine_data_small) -> None:
+    # pylint: disable=protected-access
+    evaluation._snapshot_cache.clear()
+    snapshots = []
+    for idx in range(evaluation._SNAPSHOT_CACHE_MAXSIZE + 1):
+        directory = tmp_path / str(idx)
+        directory.mkdir()
+        snapshots.append(evaluation._save_data_snapshot(sine_data_small[: idx + 1], str(directory)))
+
+    for idx, snapshot in enumerate(snapshots):
+        assert len(evaluation._load_data_snapshot(snapshot)) == idx + 1
+    assert len(evaluation._snapshot_cache) == evaluation._SNAPSHOT_CACHE_MAXSIZE
+    assert snapshots[0].digest not in evaluation._snapshot_cache
+    assert evaluation._load_data_snapshot(snapshots[-1]) is evaluation._load_data_snapshot(snapshots[-1])
+
+
 @pytest.mark.filterwarnings("ignore:.*Validation.*small.*:RuntimeWarning")  # Expected for small test datasets with DDH.
 @pytest.mark.parametrize("data", TEST_ON_DATASETS_TIME_TO_EVENT)
 @pytest.mark.parametrize(
@@ -1,11 +1,47 @@
 # pylint: disable=protected-access
 
+import time
 from unittest.mock import Mock
 
 import numpy as np
 import pytest
 
 from tempor.benchmarks import metrics
+from tempor.log import logger as log
+
+
+def _reference_concordance_index(
+    event_indicator: np.ndarray,
+    event_time: np.ndarray,
+    estimate: np.ndarray,
+    weights: np.ndarray,
+    tied_tol: float = 1e-8,
+):
+    # The O(n^2) pairwise definition: each event is compared to the samples with a later time, and to the censored
+    # samples at the same time.
+    concordant = discordant = tied_risk = tied_time = 0
+    numerator = denominator = 0.0
+    for i in np.flatnonzero(event_indicator):
+        comparable = (event_time > event_time[i]) | ((event_time == event_time[i]) & ~event_indicator)
+        est = estimate[comparable]
+        ties = np.absolute(est - estimate[i]) <= tied_tol
+        n_con = (est < estimate[i])[~ties].sum()
+        numerator += weights[i] * n_con + 0.5 * weights[i] * ties.sum()
+        denominator += weights[i] * comparable.sum()
+        concordant += n_con
+        tied_risk += ties.sum()
+        discordant += est.size - n_con - ties.sum()
+        tied_time += ((event_time == event_time[i]) & ~event_indicator).sum()
+    return numerator / denominator, concordant, discordant, tied_risk, tied_time
+
+
+def _random_survival_data(rng: np.random.Generator, n_samples: int, n_times: int, decimals: int):
+    event = rng.random(n_samples) < 0.6
+    event_time = rng.integers(0, n_times, n_samples).astype(float)
+    # At least one comparable pair: an event before all the other times.
+    event[0], event_time[0] = True, -1.0
+    estimate = np.round(rng.random(n_samples), decimals)
+    return event, event_time, estimate
 
 
 def test_validation_check_y_survival():
@@ -144,11 +180,13 @@ def test_censoring_distribution_estimator_predict_ipcw_ghat_0(monkeypatch):
         )
 
 
-def test_estimate_concordance_index_invalid_comparable(monkeypatch):
-    monkeypatch.setattr(metrics, "_get_comparable", Mock(return_value=([], [])))
-
-    with pytest.raises(ValueError, match=".*pairs.*"):
-        metrics._estimate_concordance_index(Mock(), Mock(), Mock(), Mock())
+def test_estimate_concordance_index_invalid_comparable():
+    # All censored, or only an event at the latest time.
+    for event in ([False, False, False], [False, False, True]):
+        with pytest.raises(ValueError, match=".*pairs.*"):
+            metrics._estimate_concordance_index(
+                np.asarray(event), np.asarray([1.0, 2.0, 3.0]), np.asarray([0.1, 0.2, 0.3]), np.ones(3)
+            )
 
 
 def test_create_structured_array_validation():
@@ -198,3 +236,52 @@ def test_concordance_index_ipcw_tau_none():
         tau=None,
     )
     assert len(out) == 5
+
+
+@pytest.mark.parametrize("n_samples, n_times, decimals", [(2, 2, 1), (50, 5, 1), (200, 20, 2), (500, 1000, 8)])
+def test_estimate_concordance_index_matches_pairwise(n_samples, n_times, decimals):
+    rng = np.random.default_rng(n_samples)
+    for _ in range(10):
+        # Tied times and tied (and almost tied) estimates.
+        event, event_time, estimate = _random_survival_data(rng, n_samples, n_times, decimals)
+        estimate = estimate + rng.choice([0.0, 1e-9], n_samples)
+        weights = rng.random(n_samples)
+
+        cindex, *counts = metrics._estimate_concordance_index(event, event_time, estimate, weights)
+        expected_cindex, *expected_counts = _reference_concordance_index(event, event_time, estimate, weights)
+        assert cindex == pytest.approx(expected_cindex)
+        assert counts == expected_counts
+
+
+def test_concordance_index_censored():
+    event = np.asarray([True, False, True, True, False])
+    event_time = np.asarray([1.0, 1.0, 3.0, 5.0, 6.0])
+    estimate = np.asarray([0.9, 0.5, 0.6, 0.6, 0.1])
+
+    cindex, concordant, discordant, tied_risk, tied_time = metrics.concordance_index_censored(
+        event, event_time, estimate
+    )
+    # Pairs of (event, comparable): (0, 1-4), (2, 3-4), (3, 4).
+    assert (concordant, discordant, tied_risk, tied_time) == (6, 0, 1, 1)
+    assert cindex == pytest.approx(6.5 / 7)
+
+
+@pytest.mark.slow
+def test_concordance_index_benchmark():
+    # Compare the run time with the O(n^2) pairwise definition (see the log output). Not an assertion on speed, as
+    # this depends on the hardware.
+    rng = np.random.default_rng(0)
+    for n_samples in (1_000, 10_000):
+        event, event_time, estimate = _random_survival_data(rng, n_samples, n_samples // 10, 3)
+        weights = rng.random(n_samples)
+
+        start = time.perf_counter()
+        result = metrics._estimate_concordance_index(event, event_time, estimate, weights)
+        duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        expected = _reference_concordance_index(event, event_time, estimate, weights)
+        reference_duration = time.perf_counter() - start
+
+        assert result[0] == pytest.approx(expected[0])
+        log.info(f"C-index of {n_samples} samples: {duration:.4f}s, pairwise: {reference_duration:.4f}s")
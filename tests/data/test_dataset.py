@@ -1478,6 +1478,25 @@ class TestWithConcreteData:
         assert len(data_train) + len(data_test) == 100
         assert len(data_test) / 100 == pytest.approx(0.4)
 
+    def test_getitem_lazy_views(self, monkeypatch, dummy_dfs_for_split_tests):
+        df_t, df_s, df_s_target = dummy_dfs_for_split_tests
+        data = dataset.OneOffPredictionDataset(time_series=df_t, static=df_s, targets=df_s_target)
+        validate = Mock()
+        monkeypatch.setattr(dataset.OneOffPredictionDataset, "validate", validate)
+
+        data_sub = data[[3, 1]]
+
+        validate.assert_not_called()
+        assert isinstance(data_sub, dataset.OneOffPredictionDataset)
+        assert data_sub.time_series.is_view
+        assert data_sub.static.is_view  # type: ignore [union-attr]
+        assert data_sub.predictive.targets.is_view  # type: ignore [union-attr]
+        assert data_sub.predictive.parent_dataset is data_sub
+        assert data.predictive.parent_dataset is data
+        assert data_sub.time_series.sample_index() == data.time_series.sample_index()[3:0:-2]
+        assert data_sub.static.dataframe().equals(df_s.iloc[[3, 1]])  # type: ignore [union-attr]
+        assert data_sub.predictive.targets.dataframe().equals(df_s_target.iloc[[3, 1]])  # type: ignore [union-attr]
+
     def test_stratified_kfold_split(self, dummy_dfs_for_split_tests):
         df_t, df_s, df_s_target = dummy_dfs_for_split_tests
         data = dataset.OneOffPredictionDataset(time_series=df_t, static=df_s, targets=df_s_target)
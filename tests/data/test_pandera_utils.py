@@ -4,7 +4,14 @@ import pandas as pd
 import pandera as pa
 import pytest
 
-from tempor.data.pandera_utils import UnionDtype, set_up_2level_multiindex, set_up_index
+from tempor.data.pandera_utils import (
+    SchemaCache,
+    UnionDtype,
+    compile_schema,
+    schema_cache_key,
+    set_up_2level_multiindex,
+    set_up_index,
+)
 
 
 class TestUnionDtype:
@@ -226,3 +233,40 @@ class TestHelpers:
                 coerce=Mock(),
                 unique=Mock(),
             )
+
+
+class TestSchemaCache:
+    def test_lru(self):
+        cache = SchemaCache(maxsize=2)
+        schemas = [pa.DataFrameSchema() for _ in range(3)]
+        cache.put(("a",), schemas[0])
+        cache.put(("b",), schemas[1])
+        assert cache.get(("a",)) is schemas[0]  # "a" now most recently used.
+        cache.put(("c",), schemas[2])
+        assert len(cache) == 2
+        assert cache.get(("b",)) is None
+        assert cache.get(("a",)) is schemas[0]
+        assert cache.get(("c",)) is schemas[2]
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_schema_cache_key(self):
+        df = pd.DataFrame({"a": [1, 2], "b": [1.0, 2.0]})
+        assert schema_cache_key(df, "x") == schema_cache_key(df.copy() * 2, "x")
+        assert schema_cache_key(df, "x") != schema_cache_key(df, "y")
+        assert schema_cache_key(df) != schema_cache_key(df.astype(float))
+        assert schema_cache_key(df) != schema_cache_key(df.rename(columns={"a": "c"}))
+        assert schema_cache_key(df) != schema_cache_key(df.set_index("a"))
+
+    def test_compile_schema(self):
+        schema = pa.DataFrameSchema(
+            columns={
+                "a": pa.Column(float, nullable=False),
+                ".*": pa.Column(regex=True, nullable=True, checks=[pa.Check.greater_than(0)]),
+            }
+        )
+        compiled = compile_schema(schema)
+        assert list(compiled.columns.keys()) == [".*"]
+        compiled.validate(pd.DataFrame({"a": [1.0, None], "b": [1.0, 2.0]}))
+        with pytest.raises(pa.errors.SchemaError):
+            compiled.validate(pd.DataFrame({"b": [-1.0]}))
@@ -0,0 +1,127 @@
+# pylint: disable=redefined-outer-name
+
+import numpy as np
+import pandas as pd
+import pandera as pa
+import pytest
+
+from tempor.data import ragged
+
+PAD = 999.0
+
+
+@pytest.fixture
+def ragged_ts() -> ragged.RaggedTimeSeries:
+    return ragged.RaggedTimeSeries(
+        np.asarray([[11, 1.1], [12, 1.2], [13, 1.3], [21, 2.1], [22, 2.2], [31, 3.1]]),
+        offsets=np.asarray([0, 3, 5, 6]),
+        time_index=[1, 2, 3, 2, 4, 9],
+        sample_index=["a", "b", "c"],
+        feature_index=["f1", "f2"],
+    )
+
+
+def test_lengths(ragged_ts: ragged.RaggedTimeSeries):
+    ragged_ts.validate()
+    assert ragged_ts.num_samples == 3
+    assert ragged_ts.num_features == 2
+    assert ragged_ts.lengths.tolist() == [3, 2, 1]
+
+
+def test_from_to_dataframe_roundtrip(ragged_ts: ragged.RaggedTimeSeries):
+    df = ragged_ts.to_dataframe()
+    assert isinstance(df.index, pd.MultiIndex)
+    assert df.shape == (6, 2)
+    roundtrip = ragged.RaggedTimeSeries.from_dataframe(df)
+    assert (roundtrip.values == ragged_ts.values).all()
+    assert roundtrip.offsets.tolist() == ragged_ts.offsets.tolist()
+    assert list(roundtrip.time_index) == list(ragged_ts.time_index)
+
+
+def test_from_dataframe_non_contiguous():
+    df = pd.DataFrame(
+        {"f": [1.0, 2.0, 3.0]},
+        index=pd.MultiIndex.from_tuples([("b", 1), ("a", 1), ("b", 2)]),
+    )
+    r = ragged.RaggedTimeSeries.from_dataframe(df)
+    assert list(r.sample_index) == ["b", "a"]
+    assert r.values[:, 0].tolist() == [1.0, 3.0, 2.0]
+    assert list(r.time_index) == [1, 2, 1]
+
+
+def test_to_array3d(ragged_ts: ragged.RaggedTimeSeries):
+    array = ragged_ts.to_array3d(padding_indicator=PAD)
+    assert array.shape == (3, 3, 2)
+    assert array[:, :, 0].tolist() == [[11, 12, 13], [21, 22, PAD], [31, PAD, PAD]]
+    with pytest.raises(ValueError, match=".*padding.*"):
+        ragged_ts.to_array3d(padding_indicator=11)
+
+
+def test_getitem_slice_is_view(ragged_ts: ragged.RaggedTimeSeries):
+    sliced = ragged_ts[1:]
+    assert np.shares_memory(sliced.values, ragged_ts.values)
+    assert sliced.offsets.tolist() == [0, 2, 3]
+    assert list(sliced.sample_index) == ["b", "c"]
+    sliced.validate()
+
+
+def test_getitem_consecutive_positions_is_view(ragged_ts: ragged.RaggedTimeSeries):
+    selected = ragged_ts[[1, 2]]
+    assert np.shares_memory(selected.values, ragged_ts.values)
+    assert list(selected.sample_index) == ["b", "c"]
+
+
+def test_getitem_gather(ragged_ts: ragged.RaggedTimeSeries):
+    gathered = ragged_ts[[2, 0]]
+    assert gathered.offsets.tolist() == [0, 1, 4]
+    assert gathered.values[:, 0].tolist() == [31, 11, 12, 13]
+    assert list(gathered.time_index) == [9, 1, 2, 3]
+    gathered.validate()
+
+
+def test_iter_samples(ragged_ts: ragged.RaggedTimeSeries):
+    items = list(ragged_ts.iter_samples())
+    assert [x[0] for x in items] == ["a", "b", "c"]
+    assert list(items[1][1]) == [2, 4]
+    assert items[1][2][:, 0].tolist() == [21, 22]
+
+
+@pytest.mark.parametrize(
+    "offsets, time_index, match",
+    [
+        ([0, 3, 5], [1, 2, 3, 2, 4, 9], ".*offsets.*"),
+        ([0, 3, 5, 6], [1, 1, 3, 2, 4, 9], ".*not unique.*"),
+        ([0, 3, 5, 6], [1, 2, 3], ".*time_index.*"),
+    ],
+)
+def test_validate_fails(ragged_ts: ragged.RaggedTimeSeries, offsets, time_index, match):
+    r = ragged.RaggedTimeSeries(
+        ragged_ts.values,
+        offsets=np.asarray(offsets),
+        time_index=time_index,
+        sample_index=ragged_ts.sample_index,
+        feature_index=ragged_ts.feature_index,
+    )
+    with pytest.raises(ValueError, match=match):
+        r.validate()
+
+
+@pytest.mark.parametrize(
+    "values, sample_index, time_index, exc",
+    [
+        (np.ones(shape=(2, 1)), [0.5, 1.5], [1, 1], pa.errors.SchemaError),  # pyright: ignore
+        (np.ones(shape=(2, 1)), ["a", "b"], ["t1", "t1"], pa.errors.SchemaError),  # pyright: ignore
+        (np.asarray([["x"], ["y"]], dtype=object), ["a", "b"], [1, 1], TypeError),
+        (np.ones(shape=(2, 1), dtype=complex), ["a", "b"], [1, 1], TypeError),
+    ],
+)
+def test_validate_fails_dtypes(values, sample_index, time_index, exc):
+    r = ragged.RaggedTimeSeries(
+        values,
+        offsets=np.asarray([0, 1, 2]),
+        time_index=time_index,
+        sample_index=sample_index,
+        feature_index=["f"],
+    )
+    with pytest.raises(exc):
+        r.validate()
@@ -1,6 +1,7 @@
 # pylint: disable=redefined-outer-name
 
 import dataclasses
+import pickle
 import re
 from typing import List, Tuple
 from unittest.mock import Mock
@@ -10,7 +11,7 @@ import pandas as pd
 import pytest
 
 import tempor.exc
-from tempor.data import data_typing, samples
+from tempor.data import data_typing, ragged, samples
 
 PAD = 999.0
 
@@ -667,6 +668,117 @@ class TestTimeSeriesSamples:
         assert s.sample_index() == expected_sample_index
 
 
+class TestTimeSeriesSamplesSampleOffsetsCache:
+    def test_list_of_dataframes(self, df_time_series: pd.DataFrame):
+        s = samples.TimeSeriesSamples(data=df_time_series)
+        dfs = s.list_of_dataframes()
+        assert [len(df) for df in dfs] == [4, 2, 1]
+        assert all(df.equals(df_time_series.loc[(si, slice(None)), :]) for si, df in zip(["a", "b", "c"], dfs))
+
+    def test_cache_invalidated_on_reassign(self, df_time_series: pd.DataFrame):
+        s = samples.TimeSeriesSamples(data=df_time_series)
+        assert s.num_timesteps() == [4, 2, 1]
+        s._data = df_time_series.iloc[:5]  # pylint: disable=protected-access
+        assert s.num_timesteps() == [4, 1]
+        assert s.sample_index() == ["a", "b"]
+
+    def test_non_contiguous_samples(self):
+        df = pd.DataFrame(
+            {"f": [1.0, 2.0, 3.0, 4.0]},
+            index=pd.MultiIndex.from_tuples([("b", 1), ("a", 1), ("b", 2), ("a", 3)], names=["sample_idx", "time_idx"]),
+        )
+        s = samples.TimeSeriesSamples(data=df)
+        assert s.sample_index() == ["b", "a"]
+        assert s.time_indexes() == [[1, 2], [1, 3]]
+        assert [d["f"].tolist() for d in s.list_of_dataframes()] == [[1.0, 3.0], [2.0, 4.0]]
+        assert [x.tolist() for x in s.time_indexes_float()] == [[1.0, 2.0], [1.0, 3.0]]
+
+
+class TestTimeSeriesSamplesArrayStorage:
+    def test_storage(self, df_time_series: pd.DataFrame):
+        assert samples.TimeSeriesSamples(data=df_time_series).storage == "dataframe"
+        s = samples.TimeSeriesSamples(data=df_time_series, storage="array")
+        assert s.storage == "array"
+        assert isinstance(s.as_ragged(), ragged.RaggedTimeSeries)
+
+    def test_accessors_match_dataframe_storage(self, df_time_series: pd.DataFrame):
+        s_df = samples.TimeSeriesSamples(data=df_time_series)
+        s_arr = samples.TimeSeriesSamples(data=df_time_series, storage="array")
+        assert s_arr.num_samples == s_df.num_samples
+        assert s_arr.num_features == s_df.num_features
+        assert s_arr.sample_index() == s_df.sample_index()
+        assert s_arr.time_indexes() == s_df.time_indexes()
+        assert s_arr.time_indexes_as_dict() == s_df.time_indexes_as_dict()
+        assert s_arr.num_timesteps() == s_df.num_timesteps()
+        assert (s_arr.numpy(padding_indicator=PAD) == s_df.numpy(padding_indicator=PAD)).all()
+        assert s_arr.storage == "array"  # None of the above should have materialized the dataframe.
+
+    def test_dataframe_materialized(self, df_time_series: pd.DataFrame):
+        s = samples.TimeSeriesSamples(data=df_time_series, storage="array")
+        df = s.dataframe()
+        assert s.storage == "dataframe"
+        assert (df.to_numpy() == df_time_series.to_numpy()).all()
+        assert list(df.dtypes) == list(df_time_series.dtypes)
+        assert list(df.index) == list(df_time_series.index)
+
+    @pytest.mark.parametrize(
+        "key, expected_sample_index",
+        [
+            (0, ["a"]),
+            ([2, 0], ["c", "a"]),
+            (slice(1, None), ["b", "c"]),
+        ],
+    )
+    def test_getitem(self, df_time_series: pd.DataFrame, key, expected_sample_index):
+        s = samples.TimeSeriesSamples(data=df_time_series, storage="array")[key]
+        assert s.storage == "array"
+        assert s.sample_index() == expected_sample_index
+        expected = samples.TimeSeriesSamples(data=df_time_series)[key]
+        assert s.time_indexes() == expected.time_indexes()
+
+    def test_from_numpy(self):
+        array = np.ones(shape=(3, 5, 2))
+        array[1, 3:, :] = PAD
+        s = samples.TimeSeriesSamples.from_numpy(array, padding_indicator=PAD, storage="array")
+        assert s.storage == "array"
+        assert s.num_timesteps() == [5, 3, 5]
+        assert (s.numpy(padding_indicator=PAD) == array).all()
+
+    def test_init_fail(self):
+        r = ragged.RaggedTimeSeries(
+            np.ones(shape=(3, 1)),
+            offsets=np.asarray([0, 3]),
+            time_index=[1, 1, 2],
+            sample_index=["a"],
+            feature_index=["f"],
+        )
+        with pytest.raises(tempor.exc.DataValidationException) as excinfo:
+            samples.TimeSeriesSamples(data=r)
+        assert re.search(".*not unique.*", str(excinfo.getrepr()), re.S | re.IGNORECASE)
+
+    @pytest.mark.parametrize(
+        "values, sample_index, time_index",
+        [
+            (np.ones(shape=(2, 1)), [0.5, 1.5], [1, 1]),
+            (np.ones(shape=(2, 1)), ["a", "b"], ["t1", "t1"]),
+            (np.asarray([["x"], ["y"]], dtype=object), ["a", "b"], [1, 1]),
+        ],
+    )
+    def test_init_fail_dtypes_as_dataframe_storage(self, values, sample_index, time_index):
+        df = pd.DataFrame(values, index=pd.MultiIndex.from_arrays([sample_index, time_index]), columns=["f"])
+        with pytest.raises(tempor.exc.DataValidationException):
+            samples.TimeSeriesSamples(data=df)
+        r = ragged.RaggedTimeSeries(
+            values,
+            offsets=np.asarray([0, 1, 2]),
+            time_index=time_index,
+            sample_index=sample_index,
+            feature_index=["f"],
+        )
+        with pytest.raises(tempor.exc.DataValidationException):
+            samples.TimeSeriesSamples(data=r)
+
+
 class TestEventSamples:
     def test_modality(self, df_event: pd.DataFrame):
         s = samples.EventSamples(data=df_event)
@@ -792,10 +904,10 @@ class TestEventSamples:
         assert s_split_df_event_time.equals(expected_df_event_time)
         assert s_split_df_event_value.equals(expected_df_event_value)
 
-    def test_split_fails_column_naming_conflict(self):
+    def test_split_fails_column_naming_conflict(self, monkeypatch):
         df = pd.DataFrame({"feat_1_time": [(5, True), (6, False), (3, True)]})
 
-        samples.EventSamples.validate = Mock()  # Skip validation.
+        monkeypatch.setattr(samples.EventSamples, "validate", Mock())  # Skip validation.
 
         s = samples.EventSamples(data=df)
 
@@ -829,3 +941,126 @@ class TestEventSamples:
         s = s[key]
         assert isinstance(s, samples.EventSamples)
         assert s.sample_index() == expected_sample_index
+
+
+class TestDataSamplesView:
+    @pytest.mark.parametrize(
+        "cls, df",
+        [
+            (samples.StaticSamples, dfs_test.df_static_success[0]),
+            (samples.TimeSeriesSamples, dfs_test.df_time_series_success[0]),
+            (samples.EventSamples, dfs_test.df_event_success[0]),
+        ],
+    )
+    @pytest.mark.parametrize("key", [0, [2, 0], slice(1, None)])
+    def test_matches_getitem(self, cls, df, key):
+        s = cls(data=df)
+        v = s.view(key)
+        assert isinstance(v, cls)
+        assert v.is_view
+        assert v.dataframe().equals(s[key].dataframe())
+        assert not v.is_view
+
+    @pytest.mark.parametrize(
+        "cls, df",
+        [
+            (samples.StaticSamples, dfs_test.df_static_success[0]),
+            (samples.TimeSeriesSamples, dfs_test.df_time_series_success[0]),
+            (samples.EventSamples, dfs_test.df_event_success[0]),
+        ],
+    )
+    def test_metadata_does_not_materialize(self, cls, df):
+        s = cls(data=df)
+        v = s.view([2, 0])
+        assert len(v) == v.num_samples == 2
+        assert v.sample_index() == s[[2, 0]].sample_index()
+        assert v.num_features == s.num_features
+        assert v.short_repr() == s[[2, 0]].short_repr()
+        assert v.is_view
+
+    @pytest.mark.parametrize("storage", ["dataframe", "array"])
+    def test_num_timesteps_does_not_materialize(self, df_time_series: pd.DataFrame, storage):
+        s = samples.TimeSeriesSamples(data=df_time_series, storage=storage)
+        v = s.view([2, 0])
+        assert v.num_timesteps() == [1, 4]
+        assert not v.num_timesteps_equal()
+        assert v.is_view
+
+    def test_array_storage_numpy_does_not_materialize(self, df_time_series: pd.DataFrame):
+        s = samples.TimeSeriesSamples(data=df_time_series, storage="array")
+        v = s.view([2, 0])
+        assert (v.numpy(padding_indicator=PAD) == s[[2, 0]].numpy(padding_indicator=PAD)).all()
+        assert v.is_view
+
+    def test_view_of_view(self, df_time_series: pd.DataFrame):
+        s = samples.TimeSeriesSamples(data=df_time_series)
+        v = s.view([2, 1, 0]).view([0, 2])
+        assert v.__dict__["_view"][0] is s
+        assert v.sample_index() == ["c", "a"]
+
+    def test_array_storage_shares_memory(self, df_time_series: pd.DataFrame):
+        s = samples.TimeSeriesSamples(data=df_time_series, storage="array")
+        v = s.view([1, 2])
+        assert v.storage == "array"
+        assert np.shares_memory(v.as_ragged().values, s.as_ragged().values)
+        v.dataframe().iloc[:, :] = 0.0  # Materialized dataframe does not write through to the parent.
+        assert (s.dataframe().to_numpy() == df_time_series.to_numpy()).all()
+
+    def test_pickle(self, df_static: pd.DataFrame):
+        s = samples.StaticSamples(data=df_static)
+        v = pickle.loads(pickle.dumps(s[:].view([1, 3])))
+        assert not v.is_view
+        assert v.sample_index() == s.sample_index()[1:4:2]
+
+
+class TestValidationMode:
+    @pytest.mark.parametrize(
+        "cls, df_success, df_fail",
+        [(samples.StaticSamples, dfs_test.df_static_success[0], df) for df, _ in dfs_test.df_static_fail]
+        + [
+            (samples.TimeSeriesSamples, dfs_test.df_time_series_success[0], df)
+            for df, _ in dfs_test.df_time_series_fail
+        ]
+        + [(samples.EventSamples, dfs_test.df_event_success[0], df) for df, _ in dfs_test.df_event_fail],
+    )
+    def test_cached_fails_as_full(self, cls, df_success, df_fail):
+        with samples.validation_mode(samples.ValidationMode.CACHED):
+            cls(data=df_success)  # Populate the schema cache.
+            cls(data=df_success)  # Validate with the cached schema.
+            with pytest.raises(tempor.exc.DataValidationException):
+                cls(data=df_fail)
+
+    def test_cache_populated(self, df_time_series: pd.DataFrame):
+        samples._SCHEMA_CACHE.clear()  # pylint: disable=protected-access
+        with samples.validation_mode(samples.ValidationMode.FULL):
+            samples.TimeSeriesSamples(data=df_time_series)
+        assert len(samples._SCHEMA_CACHE) == 0  # pylint: disable=protected-access
+        with samples.validation_mode(samples.ValidationMode.CACHED):
+            samples.TimeSeriesSamples(data=df_time_series)
+            samples.TimeSeriesSamples(data=df_time_series)
+        assert len(samples._SCHEMA_CACHE) == 1  # pylint: disable=protected-access
+
+    def test_validation_mode_context_manager(self):
+        assert samples.get_validation_mode() == samples.ValidationMode.CACHED
+        with samples.validation_mode(samples.ValidationMode.FULL):
+            assert samples.get_validation_mode() == samples.ValidationMode.FULL
+        assert samples.get_validation_mode() == samples.ValidationMode.CACHED
+
+    @pytest.mark.parametrize(
+        "mode, in_scope, validated",
+        [
+            (samples.ValidationMode.TRUST_INTERNAL, True, False),
+            (samples.ValidationMode.TRUST_INTERNAL, False, True),
+            (samples.ValidationMode.CACHED, True, True),
+        ],
+    )
+    def test_trust_internal(self, monkeypatch, df_time_series: pd.DataFrame, mode, in_scope, validated):
+        validate = Mock()
+        monkeypatch.setattr(samples.TimeSeriesSamples, "validate", validate)
+        with samples.validation_mode(mode):
+            if in_scope:
+                with samples.internal_transform_scope():
+                    samples.TimeSeriesSamples(data=df_time_series)
+            else:
+                samples.TimeSeriesSamples(data=df_time_series)
+        assert validate.called is validated
@@ -143,6 +143,72 @@ class TestMultiindexTimeseriesDataframeToArray3d:
             )
 
 
+class TestGetMultiindexSampleOffsets:
+    def test_contiguous(self, multiindex_timeseries_df):
+        offsets = utils.get_multiindex_sample_offsets(multiindex_timeseries_df.index)
+        assert offsets.num_samples == 3
+        assert offsets.order is None
+        assert offsets.sample_pos.tolist() == [0, 0, 0, 0, 1, 1, 2]
+        assert offsets.time_pos.tolist() == [0, 1, 2, 3, 0, 1, 0]
+        assert offsets.starts.tolist() == [0, 4, 6]
+        assert offsets.stops.tolist() == [4, 6, 7]
+        assert offsets.lengths.tolist() == [4, 2, 1]
+
+    def test_first_appearance_order(self):
+        index = pd.MultiIndex.from_tuples([("b", 1), ("a", 1), ("b", 2), ("a", 5), ("a", 6)])
+        offsets = utils.get_multiindex_sample_offsets(index)
+        # "b" appears first, so is sample 0, even though "a" sorts first.
+        assert offsets.sample_pos.tolist() == [0, 1, 0, 1, 1]
+        assert offsets.time_pos.tolist() == [0, 0, 1, 1, 2]
+        assert offsets.order is not None
+        assert offsets.order.tolist() == [0, 2, 1, 3, 4]
+        assert offsets.lengths.tolist() == [2, 3]
+
+    def test_take_rows(self):
+        index = pd.MultiIndex.from_tuples([("b", 1), ("a", 1), ("b", 2), ("a", 5), ("a", 6)])
+        offsets = utils.get_multiindex_sample_offsets(index)
+        assert offsets.take_rows(np.asarray([1])).tolist() == [1, 3, 4]
+        assert offsets.take_rows(np.asarray([1, 0])).tolist() == [1, 3, 4, 0, 2]
+        assert offsets.take_rows(np.asarray([], dtype=np.int64)).tolist() == []
+
+
+class TestMultiindexTimeseriesDataframeToArray3dExt:
+    def test_lengths_and_time_array(self, multiindex_timeseries_df):
+        out = utils.multiindex_timeseries_dataframe_to_array3d_ext(
+            multiindex_timeseries_df, padding_indicator=PAD, return_lengths=True, return_time_array=True
+        )
+        expected = utils.multiindex_timeseries_dataframe_to_array3d(multiindex_timeseries_df, padding_indicator=PAD)
+        assert (out.array == expected).all()
+        assert out.lengths is not None and out.lengths.tolist() == [4, 2, 1]
+        assert out.time_array is not None
+        assert out.time_array.tolist() == [[1, 2, 3, 4], [2, 4, PAD, PAD], [9, PAD, PAD, PAD]]
+
+    def test_shrink(self, multiindex_timeseries_df):
+        out = utils.multiindex_timeseries_dataframe_to_array3d_ext(
+            multiindex_timeseries_df,
+            padding_indicator=PAD,
+            max_timesteps=1,
+            return_lengths=True,
+            return_time_array=True,
+        )
+        assert out.array.shape == (3, 1, 2)
+        assert out.lengths is not None and out.lengths.tolist() == [1, 1, 1]
+        assert out.time_array is not None and out.time_array.tolist() == [[1], [2], [9]]
+
+    def test_not_requested(self, multiindex_timeseries_df):
+        out = utils.multiindex_timeseries_dataframe_to_array3d_ext(multiindex_timeseries_df, padding_indicator=PAD)
+        assert out.lengths is None
+        assert out.time_array is None
+
+    def test_non_contiguous_samples(self):
+        df = pd.DataFrame(
+            {"f": [1.0, 2.0, 3.0, 4.0]},
+            index=pd.MultiIndex.from_tuples([("b", 1), ("a", 1), ("b", 2), ("a", 3)]),
+        )
+        array = utils.multiindex_timeseries_dataframe_to_array3d(df, padding_indicator=PAD)
+        assert array[:, :, 0].tolist() == [[1.0, 3.0], [2.0, 4.0]]
+
+
 class TestCheckBoolArray1dTruesConsecutive:
     @pytest.mark.parametrize(
         "array,match_exc",
@@ -1056,6 +1122,78 @@ class TestListOfDataframesToMultiindexTimeseriesDataframe:
             )
 
 
+def _fill_per_sample_reference(df: pd.DataFrame, methods, fill_value) -> pd.DataFrame:
+    df = df.copy()
+    for idx in df.index.get_level_values(0).unique():
+        for method in methods:
+            df.loc[(idx, slice(None)), :] = getattr(df.loc[(idx, slice(None)), :], method)()
+        df.loc[(idx, slice(None)), :] = df.loc[(idx, slice(None)), :].fillna(fill_value)
+    return df
+
+
+def _make_df_with_missing(num_samples: int, num_timesteps: int, shuffle: bool) -> pd.DataFrame:
+    rng = np.random.default_rng(12345)
+    index = pd.MultiIndex.from_product(
+        [[f"s{i}" for i in range(num_samples)], range(num_timesteps)], names=["sample_idx", "time_idx"]
+    )
+    df = pd.DataFrame(rng.normal(size=(len(index), 3)), index=index, columns=["a", "b", "c"])
+    df = df.mask(rng.random(df.shape) < 0.4)
+    df.loc["s1", "a"] = np.nan  # All missing in a sample.
+    df["d"] = rng.integers(0, 5, size=len(df))  # No missing values.
+    if shuffle:
+        df = df.sample(frac=1.0, random_state=12345)
+    return df
+
+
+class TestFillArray2dWithinSegments:
+    @pytest.mark.parametrize(
+        "method, expected",
+        [
+            ("ffill", [np.nan, 1.0, 1.0, np.nan, 4.0, 4.0]),
+            ("bfill", [1.0, 1.0, np.nan, 4.0, 4.0, np.nan]),
+        ],
+    )
+    def test_no_propagation_across_segments(self, method, expected):
+        values = np.asarray([[np.nan], [1.0], [np.nan], [np.nan], [4.0], [np.nan]])
+        filled = utils.fill_array2d_within_segments(
+            values, starts=np.asarray([0, 3]), lengths=np.asarray([3, 3]), method=method
+        )
+        np.testing.assert_array_equal(filled[:, 0], expected)
+
+    def test_unknown_method(self):
+        with pytest.raises(ValueError, match=".*method.*"):
+            utils.fill_array2d_within_segments(
+                np.ones((2, 1)), starts=np.asarray([0]), lengths=np.asarray([2]), method="other"  # type: ignore
+            )
+
+
+class TestMultiindexTimeseriesDataframeFillPerSample:
+    @pytest.mark.parametrize("methods", [("ffill", "bfill"), ("bfill", "ffill"), ("ffill",)])
+    @pytest.mark.parametrize("shuffle", [False, True])
+    def test_matches_per_sample_fill(self, methods, shuffle):
+        df = _make_df_with_missing(num_samples=20, num_timesteps=10, shuffle=shuffle)
+        expected = _fill_per_sample_reference(df, methods, fill_value=0.0)
+        filled = utils.multiindex_timeseries_dataframe_fill_per_sample(df, methods=methods, fill_value=0.0)
+        assert filled.equals(expected)
+        assert df.isna().any().any()  # Input not modified.
+
+    def test_non_float_column(self):
+        df = pd.DataFrame(
+            {"cat": pd.Categorical(["x", None, None, "y"], categories=["x", "y"])},
+            index=pd.MultiIndex.from_tuples([("a", 1), ("a", 2), ("b", 1), ("b", 2)]),
+        )
+        filled = utils.multiindex_timeseries_dataframe_fill_per_sample(df, methods=("ffill",))
+        assert filled["cat"].tolist()[:2] == ["x", "x"]
+        assert pd.isna(filled["cat"].iloc[2])
+
+    @pytest.mark.slow
+    def test_scales_to_1m_rows(self):
+        df = _make_df_with_missing(num_samples=20_000, num_timesteps=50, shuffle=False)
+        filled = utils.multiindex_timeseries_dataframe_fill_per_sample(df, methods=("ffill", "bfill"), fill_value=0.0)
+        assert len(filled) == 1_000_000
+        assert not filled.isna().any().any()
+
+
 class TestEventTimeValuePairsToEventDataframe:
     @pytest.mark.parametrize(
         "sample_index",
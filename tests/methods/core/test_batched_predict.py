@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from tempor.data import samples
+from tempor.methods.core import _batched_predict
+
+
+def test_input_bytes_per_sample(sine_data_small):
+    n_timesteps = max(sine_data_small.time_series.num_timesteps())
+    n_features = sine_data_small.time_series.num_features
+    n_static = sine_data_small.static.num_features
+    expected = 4 * (n_timesteps * (n_features + 1) + n_static)
+    assert _batched_predict.input_bytes_per_sample(sine_data_small) == expected
+
+
+def test_resolve_batch_size(sine_data_small):
+    per_sample = _batched_predict.input_bytes_per_sample(sine_data_small)
+
+    assert _batched_predict.resolve_batch_size(sine_data_small) is None
+    assert _batched_predict.resolve_batch_size(sine_data_small, batch_size=3) == 3
+    assert _batched_predict.resolve_batch_size(sine_data_small, max_memory=2 * per_sample + 1) == 2
+    assert _batched_predict.resolve_batch_size(sine_data_small, batch_size=1, max_memory=2 * per_sample) == 1
+    assert _batched_predict.resolve_batch_size(sine_data_small, max_memory=1) == 1  # At least one sample.
+
+    with pytest.raises(ValueError, match=".*batch_size.*"):
+        _batched_predict.resolve_batch_size(sine_data_small, batch_size=0)
+    with pytest.raises(ValueError, match=".*max_memory.*"):
+        _batched_predict.resolve_batch_size(sine_data_small, max_memory=0)
+
+
+@pytest.mark.parametrize("batch_size", [None, 1, 4, 100])
+def test_predict_in_batches(batch_size, sine_data_small):
+    batch_lengths = []
+
+    def predict_batch(batch):
+        batch_lengths.append(len(batch))
+        # The first static feature of each sample, as a positionally indexed prediction.
+        return samples.StaticSamples.from_numpy(batch.static.numpy()[:, :1], feature_index=["pred"])
+
+    output = _batched_predict.predict_in_batches(predict_batch, sine_data_small, batch_size)
+
+    assert np.array_equal(output.numpy(), sine_data_small.static.numpy()[:, :1])
+    assert list(output.dataframe().columns) == ["pred"]
+    assert output.sample_index() == list(range(len(sine_data_small)))
+    assert sum(batch_lengths) == len(sine_data_small)
+    if batch_size is not None:
+        assert max(batch_lengths) <= batch_size
@@ -1,6 +1,7 @@
 """Test pipeline end-t-end for different predictive categories"""
 
 from typing import Callable, Dict, List
+from unittest.mock import Mock
 
 import pytest
 
@@ -635,3 +636,79 @@ def test_end2end_treatments_temporal_regression(
     assert isinstance(pipe, BaseTemporalTreatmentEffects)
     assert len(output) == len(dataset)
     assert len(output[0]) == n_counterfactuals_per_sample
+
+
+# Chunked (streaming) prediction:
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+def test_end2end_predict_chunked(chunk_size: int, sine_data_small, sine_data_missing_small) -> None:
+    dataset, pipe = init_pipeline_and_fit(
+        plugins_str=[*TEST_TRANSFORM_STEPS["CASE_A"], "prediction.one_off.regression.nn_regressor"],
+        data_missing=sine_data_missing_small,
+        data_not_missing=sine_data_small,
+        serialize=False,
+    )
+
+    # NOTE: Chunked prediction first, as the transformer steps of a non-chunked prediction modify `dataset` in place.
+    y_pred_chunked = pipe.predict(dataset, chunk_size=chunk_size)
+    y_pred = pipe.predict(dataset)
+
+    assert y_pred_chunked.dataframe().index.tolist() == y_pred.dataframe().index.tolist()
+    assert y_pred_chunked.numpy() == pytest.approx(y_pred.numpy(), abs=1e-5)
+
+
+def test_end2end_predict_chunked_empty(monkeypatch, sine_data_small, sine_data_missing_small) -> None:
+    dataset, pipe = init_pipeline_and_fit(
+        plugins_str=["prediction.one_off.regression.nn_regressor"],
+        data_missing=sine_data_missing_small,
+        data_not_missing=sine_data_small,
+        serialize=False,
+    )
+    predict = Mock(return_value="output")
+    monkeypatch.setattr(pipe.stages[-1], "predict", predict)
+
+    empty_dataset = dataset[[]]
+    assert len(empty_dataset) == 0
+    # The empty dataset goes to the predictor as in the non-chunked case, so the output type is the same.
+    assert pipe.predict(empty_dataset, chunk_size=7) == pipe.predict(empty_dataset) == "output"
+    assert all(len(call.args[0]) == 0 for call in predict.call_args_list)
+
+
+@pytest.mark.parametrize("method", ["predict", "predict_proba"])
+def test_end2end_predict_batched(monkeypatch, method: str, sine_data_small, sine_data_missing_small) -> None:
+    dataset, pipe = init_pipeline_and_fit(
+        plugins_str=[*TEST_TRANSFORM_STEPS["CASE_A"], "prediction.one_off.classification.nn_classifier"],
+        data_missing=sine_data_missing_small,
+        data_not_missing=sine_data_small,
+        serialize=False,
+    )
+    predictor = pipe.stages[-1]
+    batch_lengths: List[int] = []
+    predict_impl = getattr(predictor, f"_{method}")
+
+    def spy(data, *args, **kwargs):
+        batch_lengths.append(len(data))
+        return predict_impl(data, *args, **kwargs)
+
+    monkeypatch.setattr(predictor, f"_{method}", spy)
+
+    # NOTE: Batched prediction first, as the transformer steps of a non-batched prediction modify `dataset` in place.
+    y_pred_batched = getattr(pipe, method)(dataset, batch_size=2)
+    assert max(batch_lengths) <= 2
+    assert sum(batch_lengths) == len(dataset)
+
+    y_pred = getattr(pipe, method)(dataset)
+    assert y_pred_batched.numpy() == pytest.approx(y_pred.numpy(), abs=1e-5)
+
+
+def test_end2end_predict_chunked_fails(sine_data_small, sine_data_missing_small) -> None:
+    dataset, pipe = init_pipeline_and_fit(
+        plugins_str=["prediction.one_off.regression.nn_regressor"],
+        data_missing=sine_data_missing_small,
+        data_not_missing=sine_data_small,
+        serialize=False,
+    )
+
+    with pytest.raises(ValueError, match=".*chunk_size.*"):
+        pipe.predict(dataset, chunk_size=0)
@@ -0,0 +1,96 @@
+import copy
+
+import numpy as np
+import pytest
+
+from tempor.methods.pipeline import pipeline
+from tempor.methods.pipeline.prefix_cache import (
+    PrefixCache,
+    data_fingerprint,
+    get_active_prefix_cache,
+    prefix_cache_scope,
+)
+
+PLUGINS = [
+    "preprocessing.imputation.temporal.ffill",
+    "preprocessing.scaling.temporal.ts_minmax_scaler",
+    "prediction.one_off.regression.nn_regressor",
+]
+
+
+def test_data_fingerprint(sine_data_full):
+    assert data_fingerprint(sine_data_full) == data_fingerprint(copy.deepcopy(sine_data_full))
+    assert data_fingerprint(sine_data_full[:10]) == data_fingerprint(copy.deepcopy(sine_data_full)[:10])
+    assert data_fingerprint(sine_data_full[:10]) != data_fingerprint(sine_data_full[10:20])
+
+
+def test_prefix_cache_scope():
+    assert get_active_prefix_cache() is None
+    with prefix_cache_scope(1000) as cache:
+        assert get_active_prefix_cache() is cache
+        with prefix_cache_scope(1000) as inner_cache:
+            assert get_active_prefix_cache() is inner_cache
+        assert get_active_prefix_cache() is cache
+    assert get_active_prefix_cache() is None
+
+
+def test_prefix_cache_lru():
+    cache = PrefixCache(max_bytes=100)
+    cache.put("a", [1], 40)
+    cache.put("b", [2], 40)
+    assert cache.get("a") == [1]  # "a" is now the most recently used.
+    cache.put("c", [3], 40)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == [1]
+    assert cache.get("c") == [3]
+    assert cache.nbytes == 80
+    assert (cache.hits, cache.misses) == (3, 1)
+
+    cache.put("d", [4], 1000)  # Over the budget, not cached.
+    assert cache.get("d") is None
+    assert len(cache) == 2
+
+
+def test_prefix_cache_returns_copies():
+    cache = PrefixCache(max_bytes=100)
+    value = [1]
+    cache.put("a", value, 10)
+    value.append(2)
+    cached = cache.get("a")
+    assert cached == [1]
+    cached.append(3)
+    assert cache.get("a") == [1]
+
+
+@pytest.mark.parametrize("chunk_size", [None, 7])
+def test_pipeline_fit_predict_cached(chunk_size, sine_data_full):
+    data = sine_data_full
+    PipelineCls = pipeline(PLUGINS)
+
+    reference = PipelineCls({"nn_regressor": {"n_iter": 2, "random_state": 0}})
+    reference.fit(copy.deepcopy(data))
+    expected = reference.predict(copy.deepcopy(data)).numpy()
+
+    with prefix_cache_scope(2**30) as cache:
+        misses = []
+        for _ in range(2):
+            # A different predictor each time, but the same preprocessing steps, fitted on the same data.
+            pipe = PipelineCls({"nn_regressor": {"n_iter": 2, "random_state": 0}})
+            pipe.fit(copy.deepcopy(data))
+            preds = pipe.predict(copy.deepcopy(data), chunk_size=chunk_size).numpy()
+            assert np.allclose(preds, expected)
+            misses.append(cache.misses)
+        assert misses[1] == misses[0]  # All the steps reused the second time.
+        assert all(stage.is_fitted for stage in pipe.stages)
+
+
+def test_pipeline_fit_cached_different_params(sine_data_full):
+    with prefix_cache_scope(2**30) as cache:
+        pipeline(PLUGINS)({"nn_regressor": {"n_iter": 2}}).fit(copy.deepcopy(sine_data_full))
+        misses = cache.misses
+        pipeline(PLUGINS)({"nn_regressor": {"n_iter": 2}, "ts_minmax_scaler": {"clip": True}}).fit(
+            copy.deepcopy(sine_data_full)
+        )
+        # The first step is reused, the second has different parameters.
+        assert (cache.hits, cache.misses) == (1, misses + 1)
@@ -3,6 +3,7 @@
 from typing import Callable, Dict
 from unittest.mock import Mock
 
+import numpy as np
 import pytest
 
 from tempor.methods.prediction.one_off.classification import BaseOneOffClassifier
@@ -118,3 +119,16 @@ def test_serde(data: str, device: str, get_test_plugin: Callable, get_dataset: C
     reloaded2 = load(dump)
 
     reloaded2.predict(dataset)
+
+
+def test_predict_batched(get_test_plugin: Callable, sine_data_small) -> None:
+    test_plugin: BaseOneOffClassifier = get_test_plugin("from_api", INIT_KWARGS, device="cpu")
+    dataset = sine_data_small
+    test_plugin.fit(dataset)
+
+    expected = test_plugin.predict(dataset).numpy()
+    assert np.allclose(test_plugin.predict(dataset, batch_size=2).numpy(), expected)
+    assert np.allclose(test_plugin.predict(dataset, max_memory=1).numpy(), expected)
+    expected = test_plugin.predict_proba(dataset).numpy()
+    assert np.allclose(test_plugin.predict_proba(dataset, batch_size=2).numpy(), expected)
+    assert np.allclose(test_plugin.predict_proba(dataset, max_memory=1).numpy(), expected)
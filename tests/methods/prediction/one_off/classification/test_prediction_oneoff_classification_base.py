@@ -4,6 +4,7 @@ import numpy as np
 import pytest
 
 from tempor.data.dataset import PredictiveDataset
+from tempor.data.ragged import RaggedTimeSeries
 from tempor.methods.prediction.one_off.classification import BaseOneOffClassifier
 
 if TYPE_CHECKING:
@@ -42,14 +43,14 @@ def test_wrong_dataset():
 
 
 def test_unpack_dataset_empty():
+    mock_ragged = RaggedTimeSeries(
+        np.zeros((3, 1)), offsets=[0, 1, 2, 3], time_index=[0, 0, 0], sample_index=[0, 1, 2], feature_index=["f"]
+    )
     plugin = DummyOneOffClassifier()
 
     mock_data = Mock(
         PredictiveDataset,
-        time_series=Mock(
-            numpy=Mock(return_value=[1, 2, 3]),
-            time_indexes=Mock(return_value="mock_time_indexes"),
-        ),
+        time_series=Mock(as_ragged=Mock(return_value=mock_ragged)),
         static=None,
         predictive=Mock(
             targets=None,
@@ -62,10 +63,7 @@ def test_unpack_dataset_empty():
 
     mock_data = Mock(
         PredictiveDataset,
-        time_series=Mock(
-            numpy=Mock(return_value=[1, 2, 3]),
-            time_indexes=Mock(return_value="mock_time_indexes"),
-        ),
+        time_series=Mock(as_ragged=Mock(return_value=mock_ragged)),
         static=None,
         predictive=Mock(
             targets=Mock(numpy=Mock(return_value=np.asarray([1, 1, 1, 1]))),
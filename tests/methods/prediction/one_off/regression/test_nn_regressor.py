@@ -3,6 +3,7 @@
 from typing import Callable, Dict
 from unittest.mock import Mock
 
+import numpy as np
 import pytest
 
 from tempor.methods.prediction.one_off.regression import BaseOneOffRegressor
@@ -93,3 +94,13 @@ def test_predict(
     output = reloaded.predict(dataset)
 
     assert output.numpy().shape == (len(dataset.time_series), 1)
+
+
+def test_predict_batched(get_test_plugin: Callable, sine_data_small) -> None:
+    test_plugin: BaseOneOffRegressor = get_test_plugin("from_api", INIT_KWARGS, device="cpu")
+    dataset = sine_data_small
+    test_plugin.fit(dataset)
+
+    expected = test_plugin.predict(dataset).numpy()
+    assert np.allclose(test_plugin.predict(dataset, batch_size=2).numpy(), expected)
+    assert np.allclose(test_plugin.predict(dataset, max_memory=1).numpy(), expected)
@@ -1,5 +1,6 @@
 # pylint: disable=redefined-outer-name
 
+import copy
 from typing import Callable, Dict
 
 import pytest
@@ -128,3 +129,30 @@ def test_transform_all_features(get_test_plugin: Callable, get_dataset: Callable
 
     for new_col in new_cols:
         assert sorted(output.time_series.dataframe()[new_col].unique().tolist()) == [0.0, 1.0]
+
+
+@pytest.mark.parametrize("data", TEST_ON_DATASETS)
+def test_partial_fit(data: str, get_test_plugin: Callable, get_dataset: Callable) -> None:
+    dataset = get_dataset(data)
+    fitted: BaseEncoder = get_test_plugin("from_api", INIT_KWARGS).fit(dataset)
+
+    partially_fitted: BaseEncoder = get_test_plugin("from_api", INIT_KWARGS)
+    n = len(dataset)
+    for chunk in (slice(0, n // 2), slice(n // 2, n)):
+        partially_fitted.partial_fit(dataset[chunk])
+
+    assert partially_fitted.is_fitted
+    for partial_categories, full_categories in zip(partially_fitted.model.categories_, fitted.model.categories_):
+        assert sorted(partial_categories.tolist()) == sorted(full_categories.tolist())
+
+    output_partial = partially_fitted.transform(copy.deepcopy(dataset)).time_series.dataframe()
+    output_full = fitted.transform(copy.deepcopy(dataset)).time_series.dataframe()
+    assert sorted(output_partial.columns.tolist()) == sorted(output_full.columns.tolist())
+
+
+def test_partial_fit_fails_min_frequency(get_test_plugin: Callable, get_dataset: Callable) -> None:
+    dataset = get_dataset(TEST_ON_DATASETS[0])
+    test_plugin: BaseEncoder = get_test_plugin("from_api", {**INIT_KWARGS, "min_frequency": 2})
+
+    with pytest.raises(ValueError, match=".*min_frequency.*"):
+        test_plugin.partial_fit(dataset)
@@ -80,3 +80,11 @@ def test_transform(
     output = reloaded.transform(dataset)
 
     assert output.time_series.dataframe().isna().sum().sum() == 0
+
+
+def test_partial_fit_not_supported(get_test_plugin: Callable, get_dataset: Callable) -> None:
+    test_plugin: BaseImputer = get_test_plugin("from_api", INIT_KWARGS)
+    dataset = get_dataset(TEST_ON_DATASETS[0])
+
+    with pytest.raises(NotImplementedError, match=".*partial_fit.*"):
+        test_plugin.partial_fit(dataset)
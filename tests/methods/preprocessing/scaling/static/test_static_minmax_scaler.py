@@ -2,6 +2,7 @@
 
 from typing import Callable, Dict
 
+import numpy as np
 import pytest
 
 from tempor.methods.preprocessing.scaling import BaseScaler
@@ -84,3 +85,18 @@ def test_transform(
 
     assert (output.static.numpy() < 1 + 1e-1).all()
     assert (output.static.numpy() >= 0).all()
+
+
+@pytest.mark.parametrize("data", TEST_ON_DATASETS)
+def test_partial_fit(data: str, get_test_plugin: Callable, get_dataset: Callable) -> None:
+    dataset = get_dataset(data)
+    fitted: BaseScaler = get_test_plugin("from_api", INIT_KWARGS).fit(dataset)
+
+    partially_fitted: BaseScaler = get_test_plugin("from_api", INIT_KWARGS)
+    n = len(dataset)
+    for chunk in (slice(0, n // 3), slice(n // 3, n)):
+        partially_fitted.partial_fit(dataset[chunk])
+
+    assert partially_fitted.is_fitted
+    np.testing.assert_allclose(partially_fitted.model.data_min_, fitted.model.data_min_)
+    np.testing.assert_allclose(partially_fitted.model.data_max_, fitted.model.data_max_)
@@ -1,9 +1,24 @@
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
+import numpy as np
+import pandas as pd
 import pytest
 
+from tempor import plugin_loader
+from tempor.data import dataset
 from tempor.exc import UnsupportedSetupException
-from tempor.methods.time_to_event.helper_embedding import DDHEmbedding, DynamicDeepHitModel
+from tempor.methods.time_to_event.helper_embedding import DDHEmbedding, DDHEmbeddingCache, DynamicDeepHitModel
+
+
+def _synthetic_data(n_samples: int = 60, seed: int = 0) -> dataset.TimeToEventAnalysisDataset:
+    rng = np.random.default_rng(seed)
+    rows = [(idx, float(step), *rng.random(2)) for idx in range(n_samples) for step in range(rng.integers(2, 5))]
+    time_series = pd.DataFrame(rows, columns=["sample_idx", "time_idx", "a", "b"]).set_index(["sample_idx", "time_idx"])
+    static = pd.DataFrame(rng.random((n_samples, 2)), columns=["s1", "s2"])
+    targets = pd.DataFrame(
+        {"event": [(float(rng.integers(1, 10)), bool(rng.integers(0, 2))) for _ in range(n_samples)]}
+    )
+    return dataset.TimeToEventAnalysisDataset(time_series=time_series, static=static, targets=targets)
 
 
 def test_merge_data_no_static(pbc_data_full):
@@ -34,3 +49,54 @@ def test_validate_data(pbc_data_full):
 
     with pytest.raises(UnsupportedSetupException):
         emb._validate_data(data)  # pylint: disable=protected-access
+
+
+def test_emb_cache_key():
+    data = _synthetic_data()
+    key = DDHEmbeddingCache.key(data, DynamicDeepHitModel())
+    assert key == DDHEmbeddingCache.key(_synthetic_data(), DynamicDeepHitModel())
+    assert key != DDHEmbeddingCache.key(_synthetic_data(seed=1), DynamicDeepHitModel())
+    assert key != DDHEmbeddingCache.key(data, DynamicDeepHitModel(random_state=1))
+    assert key != DDHEmbeddingCache.key(data, DynamicDeepHitModel(n_units_hidden=10))
+
+
+def test_emb_cache_reused_across_output_models(tmp_path):
+    data = _synthetic_data()
+    horizons = [2.0, 5.0]
+
+    preds = []
+    with patch.object(DynamicDeepHitModel, "fit", autospec=True, side_effect=DynamicDeepHitModel.fit) as fit:
+        for penalizer in [0.5, 0.1, 0.1]:
+            plugin = plugin_loader.get(
+                "time_to_event.ts_coxph", n_iter=3, coxph_penalizer=penalizer, emb_cache_dir=str(tmp_path)
+            )
+            plugin.fit(data)
+            preds.append(plugin.predict(data, horizons=horizons).numpy())
+        # The embedding model is only trained for the first output model.
+        assert fit.call_count == 1
+
+    assert len(list(tmp_path.iterdir())) == 1
+    assert np.allclose(preds[1], preds[2])
+    assert not np.allclose(preds[0], preds[1])
+
+
+def test_merge_data():
+    emb = DDHEmbedding(emb_model=DynamicDeepHitModel())
+    data = _synthetic_data()
+    (static, temporal, observation_times, *_) = emb._convert_data(data)  # pylint: disable=protected-access
+    merged = emb._merge_data(static, temporal, observation_times)  # pylint: disable=protected-access
+
+    lengths = data.time_series.num_timesteps()
+    assert merged.shape == (len(data), max(lengths), 2 + 2 + 1)
+    assert merged.dtype == np.float32
+    for idx, (df, length) in enumerate(zip(data.time_series.list_of_dataframes(), lengths)):
+        expected = np.concatenate(
+            [
+                df.to_numpy(),
+                np.repeat(static[idx][None, :], length, axis=0),
+                df.index.get_level_values(-1).to_numpy()[:, None],
+            ],
+            axis=1,
+        )
+        assert np.allclose(merged[idx, :length], expected.astype(float))
+        assert np.isnan(merged[idx, length:]).all()
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+import torch
+
+from tempor.data.ragged import RaggedTimeSeries
+from tempor.models import batching
+
+
+def test_sequence_lengths():
+    lengths = batching.sequence_lengths([[0, 1, 2], [0], np.arange(5)])
+    assert lengths.tolist() == [3, 1, 5]
+    assert lengths.dtype == np.int64
+
+
+def test_length_buckets():
+    lengths = np.asarray([3, 1, 5, 3, 8, 2, 9])
+
+    assert batching.length_buckets(lengths, "exact_length") == {3: [0, 3], 1: [1], 5: [2], 8: [4], 2: [5], 9: [6]}
+    assert batching.length_buckets(lengths, "padded") == {4: [0, 3], 1: [1], 8: [2, 4], 2: [5], 16: [6]}
+
+
+def test_pad_sequences():
+    sequences = [np.ones((2, 3)), 2 * np.ones((4, 3)), 3 * np.ones((5, 3))]
+    lengths = np.asarray([2, 4, 3])  # The third sequence is cut to its length.
+
+    out = batching.pad_sequences(sequences, lengths)
+    assert out.shape == (3, 4, 3)
+    assert (out[0, :2] == 1).all() and (out[0, 2:] == 0).all()
+    assert (out[1] == 2).all()
+    assert (out[2, :3] == 3).all() and (out[2, 3:] == 0).all()
+
+    out = batching.pad_sequences(sequences, lengths, fill="last")
+    assert (out[0] == 1).all()
+    assert (out[2] == 3).all()
+
+
+def test_pad_sequences_1d():
+    out = batching.pad_sequences([[0.0, 1.0], [0.0, 1.0, 2.0]], np.asarray([2, 3]), fill="last")
+    assert out.tolist() == [[0.0, 1.0, 1.0], [0.0, 1.0, 2.0]]
+
+
+@pytest.fixture
+def ragged_sequences():
+    lengths = [2, 4, 3]
+    sequences = [np.arange(length * 2, dtype=float).reshape(length, 2) + 10 * idx for idx, length in enumerate(lengths)]
+    ragged = RaggedTimeSeries(
+        np.concatenate(sequences),
+        offsets=[0, 2, 6, 9],
+        time_index=[t for length in lengths for t in range(length)],
+        sample_index=[0, 1, 2],
+        feature_index=["a", "b"],
+    )
+    padded = np.full((3, 4, 2), 999.0)
+    for idx, sequence in enumerate(sequences):
+        padded[idx, : len(sequence)] = sequence
+    return sequences, ragged, padded
+
+
+@pytest.mark.parametrize("fill", ["zero", "last"])
+def test_gather_padded(fill, ragged_sequences):
+    sequences, ragged, padded = ragged_sequences
+    indices = [2, 0]
+    lengths = np.asarray([3, 2])
+
+    expected = batching.pad_sequences([sequences[idx] for idx in indices], lengths, fill=fill)
+    for data in (sequences, ragged, padded, torch.from_numpy(padded)):
+        out = batching.gather_padded(data, indices, lengths, fill=fill)
+        assert out.dtype == np.float32
+        assert np.array_equal(out, expected)
+
+
+def test_as_float32_tensor():
+    array = np.ones((3, 2), dtype=np.float32)
+    tensor = batching.as_float32_tensor(array, torch.device("cpu"))
+    assert tensor.dtype == torch.float32
+    assert np.shares_memory(tensor.numpy(), array)
+
+    tensor = batching.as_float32_tensor(np.ones((3, 2)), torch.device("cpu"))
+    assert tensor.dtype == torch.float32
+    assert batching.as_float32_tensor(tensor, torch.device("cpu")) is tensor
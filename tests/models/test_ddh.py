@@ -7,7 +7,7 @@ import numpy as np
 import pytest
 
 from tempor.datasources.time_to_event.plugin_pbc import PBCDataSource
-from tempor.models.ddh import DynamicDeepHitLayers, DynamicDeepHitModel
+from tempor.models.ddh import DynamicDeepHitLayers, DynamicDeepHitModel, get_padded_features, sequence_lengths
 
 
 @pytest.fixture(scope="module")
@@ -173,9 +173,64 @@ def test_ddh_predict_survival_all_step(get_test_data):
     assert output.shape[0] >= len(x)
 
 
+@pytest.fixture(scope="module")
+def synthetic_test_data():
+    rng = np.random.default_rng(0)
+    x = np.array([rng.random((rng.integers(2, 6), 3)) for _ in range(40)], dtype=object)
+    t = rng.random(40) * 10 + 1
+    e = rng.integers(0, 2, 40)
+    e[0] = 1
+    return x, t, e
+
+
+def test_ddh_predict_survival_batched(synthetic_test_data):
+    x, t, e = synthetic_test_data
+    model = DynamicDeepHitModel(n_iter=3, clipping_value=0).fit(x=x, t=t, e=e)
+    horizons = [2.0, 2.0, 5.0, 8.0]  # Including a repeated horizon.
+
+    output = model.predict_survival(x=x, t=horizons)
+    assert output.shape == (len(x), len(horizons))
+    assert np.array_equal(output[:, 0], output[:, 1])
+    assert np.allclose(model.predict_survival(x=x, t=horizons, batch_size=7), output)
+
+    # One row per prefix of each sample, the last prefix of a sample being the whole sample.
+    output_all_step = model.predict_survival(x=x, t=horizons, all_step=True, batch_size=7)
+    lens = [len(x_) for x_ in x]
+    assert output_all_step.shape == (sum(lens), len(horizons))
+    assert np.allclose(output_all_step[np.cumsum(lens) - 1], output, atol=1e-6)
+    assert np.allclose(output_all_step[0], model.predict_survival(x=[x[0][:1]], t=horizons)[0], atol=1e-6)
+
+
 # Test DynamicDeepHitLayers:
 
 
 def test_ddh_layers_rnn_type():
     with pytest.raises(RuntimeError, match=".*rnn.*type.*"):
         DynamicDeepHitLayers(input_dim=10, seq_len=10, output_dim=10, layers_rnn=1, hidden_rnn=2, rnn_type="unknown")
+
+
+def test_ddh_fit_best_epoch(synthetic_test_data):
+    x, t, e = synthetic_test_data
+    model = DynamicDeepHitModel(n_iter=4, clipping_value=0)
+    assert model.best_epoch is None
+    model.fit(x=x, t=t, e=e)
+    assert model.best_epoch is not None
+    assert 0 <= model.best_epoch.epoch < 4
+    assert model.best_epoch.time <= model.best_epoch.total_time
+
+
+def test_padded_input(synthetic_test_data):
+    x, t, e = synthetic_test_data
+    x_padded = get_padded_features(x, dtype=np.float32)
+    assert np.shares_memory(get_padded_features(x_padded, dtype=np.float32), x_padded)
+    assert get_padded_features(x_padded, pad_size=3).shape == (len(x), 3, 3)
+    assert np.isnan(get_padded_features(x_padded, pad_size=8)[:, 5:]).all()
+    assert sequence_lengths(x_padded).tolist() == sequence_lengths(x).tolist() == [len(x_) for x_ in x]
+
+    # Padded numeric input gives the same predictions as the ragged sequences.
+    horizons = [2.0, 5.0]
+    model = DynamicDeepHitModel(n_iter=3, clipping_value=0).fit(x=x, t=t, e=e)
+    assert np.allclose(model.predict_survival(x_padded, horizons), model.predict_survival(x, horizons))
+    assert np.allclose(
+        model.predict_survival(x_padded, horizons, all_step=True), model.predict_survival(x, horizons, all_step=True)
+    )
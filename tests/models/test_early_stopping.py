@@ -0,0 +1,54 @@
+import os
+
+import pytest
+import torch
+from torch import nn
+
+from tempor.models.early_stopping import EarlyStopping
+
+
+def _module() -> nn.Module:
+    return nn.Sequential(nn.Linear(3, 4), nn.BatchNorm1d(4), nn.Linear(4, 1))
+
+
+def _perturb(module: nn.Module) -> None:
+    with torch.no_grad():
+        for tensor in [*module.parameters(), *module.buffers()]:
+            tensor.add_(1)
+
+
+@pytest.mark.parametrize("max_memory", [2**30, 0])
+def test_restore_best(max_memory):
+    module = _module()
+    early_stopping = EarlyStopping(module, patience=5, max_memory=max_memory)
+    assert early_stopping.on_disk == (max_memory == 0)
+
+    _perturb(module)
+    early_stopping.step(0, 2.0)
+    _perturb(module)
+    early_stopping.step(1, 1.0)
+    expected = {k: v.clone() for k, v in module.state_dict().items()}
+    _perturb(module)
+    early_stopping.step(2, 1.5)
+
+    best = early_stopping.restore()
+    assert best is not None
+    assert (best.epoch, best.loss) == (1, 1.0)
+    assert 0 <= best.time <= best.total_time
+    for key, value in module.state_dict().items():
+        assert torch.equal(value, expected[key])
+    if early_stopping.on_disk:
+        assert not os.path.exists(early_stopping._path)  # type: ignore  # pylint: disable=protected-access
+
+
+def test_stop():
+    early_stopping = EarlyStopping(_module(), patience=1, min_epochs=3)
+    assert [early_stopping.step(epoch, 1.0) for epoch in range(5)] == [False, False, False, False, True]
+
+
+def test_restore_not_evaluated():
+    module = _module()
+    expected = {k: v.clone() for k, v in module.state_dict().items()}
+    _perturb(module)
+    assert EarlyStopping(module, patience=1).restore() is None
+    assert not torch.equal(module.state_dict()["0.weight"], expected["0.weight"])
@@ -6,6 +6,7 @@ import pytest
 import torch
 from sklearn.datasets import load_diabetes, load_digits
 
+from tempor.models import mlp
 from tempor.models.constants import ModelTaskType, Nonlin
 from tempor.models.mlp import MLP, LinearLayer, MultiActivationHead, ResidualLayer
 
@@ -207,7 +208,9 @@ def test_mlp_clipping_0_case():
     model.fit(X, y)  # type: ignore
 
 
-def test_mlp_print_iter_no_early_stopping_case():
+def test_mlp_print_iter_no_early_stopping_case(monkeypatch):
+    early_stopping_cls = Mock()
+    monkeypatch.setattr(mlp, "EarlyStopping", early_stopping_cls)
     X, y = load_digits(return_X_y=True)
 
     model = MLP(
@@ -220,6 +223,7 @@ def test_mlp_print_iter_no_early_stopping_case():
     )
 
     model.fit(X, y)  # type: ignore
+    early_stopping_cls.assert_not_called()  # No best-weights checkpoint is kept.
 
 
 def test_mlp_early_stop():
@@ -95,3 +95,19 @@ def test_get_nonlin_unknown():
 def test_get_sampler_unknown():
     with pytest.raises(ValueError):
         utils.get_sampler("unknown")  # type: ignore
+
+
+def test_autocast_context():
+    with utils.autocast_context("eager", "cpu"):
+        assert not torch.is_autocast_enabled("cpu")
+    if utils.bf16_autocast_supported("cpu"):
+        with utils.autocast_context("bf16", "cpu"):
+            assert torch.is_autocast_enabled("cpu")
+            assert torch.nn.Linear(2, 2)(torch.ones(1, 2)).dtype == torch.bfloat16
+
+
+def test_compiled_module():
+    module = torch.nn.Linear(2, 2)
+    compiled = utils.CompiledModule(module)
+    x = torch.ones(3, 2)
+    assert torch.allclose(compiled(x), module(x))
@@ -1,3 +1,4 @@
+import time
 from typing import Any
 from unittest.mock import Mock
 
@@ -8,7 +9,11 @@ from typing_extensions import get_args
 
 from tempor.datasources.prediction.one_off.plugin_google_stocks import GoogleStocksDataSource
 from tempor.datasources.prediction.one_off.plugin_sine import SineDataSource
+from tempor.log import logger as log
+from tempor.models.constants import Batching, ExecutionMode
 from tempor.models.ts_model import ModelTaskType, TimeSeriesLayer, TimeSeriesModel, TSModelMode, WindowLinearLayer
+from tempor.models.utils import CompiledModule
+from tempor.utils import serialization
 
 
 def unpack_dataset(source):
@@ -156,13 +161,14 @@ def test_init_inputs():
         )
 
 
-def test_forward_nans_found():
+def test_forward_nans_found_debug():
     model = TimeSeriesModel(
         task_type="regression",
         n_static_units_in=3,
         n_temporal_units_in=3,
         n_temporal_window=2,
         output_shape=[2],
+        nan_check="debug",
     )
 
     with pytest.raises(ValueError, match=".*NaNs.*static.*"):
@@ -191,6 +197,32 @@ def test_forward_nans_found():
         )
 
 
+def test_prepare_input_nans_found():
+    model = TimeSeriesModel(
+        task_type="regression",
+        n_static_units_in=3,
+        n_temporal_units_in=2,
+        n_temporal_window=2,
+        output_shape=[2],
+    )
+    static, temporal, observation_times = np.ones((10, 3)), np.ones((10, 3, 2)), np.ones((10, 3))
+
+    # The inputs are checked once, when converted to tensors, rather than in every forward pass.
+    model.forward(
+        static_data=torch.ones(10, 3),
+        temporal_data=torch.full((10, 3, 2), torch.nan),
+        observation_times=torch.ones(10, 3),
+    )
+
+    static[0, 2] = np.nan
+    with pytest.raises(ValueError, match=".*NaNs.*static.*"):
+        model.predict(static, temporal, observation_times)
+
+    temporal[0, 2, 1] = np.nan
+    with pytest.raises(ValueError, match=".*NaNs.*temporal.*"):
+        model.fit(np.ones((10, 3)), temporal, observation_times, np.ones((10, 2)))
+
+
 def test_predict_proba_validation_fail():
     model = TimeSeriesModel(
         task_type="regression",
@@ -237,6 +269,7 @@ def test_time_series_layer_forward_nans(mode):
         n_units_out=2,
         mode=mode,
         device=torch.device("cpu"),
+        nan_check="debug",
     )
     s = torch.ones(size=(0,))
     t = torch.ones(size=(10, 2, 3))
@@ -258,3 +291,226 @@ def test_windowed_layer_forward_nans():
     t[0, 0, 0] = torch.nan
     with pytest.raises(ValueError, match=".*mismatch.*"):
         tsl.forward(s, t)
+
+
+@pytest.mark.parametrize("execution_mode", get_args(ExecutionMode))
+def test_execution_mode_fit_predict(execution_mode: ExecutionMode) -> None:
+    static, temporal, observation_times, outcome = unpack_dataset(SineDataSource)
+
+    model = TimeSeriesModel(
+        task_type="regression",
+        n_static_units_in=static.shape[-1],
+        n_temporal_units_in=temporal.shape[-1],
+        n_temporal_window=temporal.shape[1],
+        output_shape=outcome.shape[1:],
+        n_iter=3,
+        execution_mode=execution_mode,
+    )
+    model.fit(static, temporal, observation_times, outcome)
+
+    y_pred = model.predict(static, temporal, observation_times)
+    assert y_pred.shape == outcome.shape
+    assert y_pred.dtype == np.float32
+
+    # The compiled module is not serialized.
+    loaded = serialization.load(serialization.save(model))
+    assert np.allclose(loaded.predict(static, temporal, observation_times), y_pred)
+
+
+@pytest.mark.parametrize("fail_on", ["compile", "call"])
+def test_execution_mode_compile_fallback(monkeypatch, fail_on: str) -> None:
+    def failing_compiled(*args, **kwargs):
+        from torch._dynamo.exc import TorchDynamoException  # pylint: disable=import-outside-toplevel
+
+        raise TorchDynamoException("Compilation failed")
+
+    def failing_compile(*args, **kwargs):
+        if fail_on == "compile":
+            raise RuntimeError("Compilation is unavailable")
+        return failing_compiled
+
+    monkeypatch.setattr(torch, "compile", failing_compile)
+    static, temporal, observation_times, outcome = unpack_dataset(SineDataSource)
+
+    model = TimeSeriesModel(
+        task_type="regression",
+        n_static_units_in=static.shape[-1],
+        n_temporal_units_in=temporal.shape[-1],
+        n_temporal_window=temporal.shape[1],
+        output_shape=outcome.shape[1:],
+        n_iter=2,
+        execution_mode="compile",
+    )
+    model.fit(static, temporal, observation_times, outcome)
+
+    assert model.predict(static, temporal, observation_times).shape == outcome.shape
+    assert model._compiled_temporal_layer.failed  # pyright: ignore # pylint: disable=protected-access
+
+
+def test_execution_mode_compile_module_error_propagates(monkeypatch) -> None:
+    def compiled(*args, **kwargs):
+        raise ValueError("Error in the module")
+
+    monkeypatch.setattr(torch, "compile", lambda *args, **kwargs: compiled)
+    layer = CompiledModule(torch.nn.Linear(2, 1))
+
+    with pytest.raises(ValueError, match=".*module.*"):
+        layer(torch.ones(1, 2))
+    assert not layer.failed
+
+
+def test_execution_mode_state_dict_unchanged() -> None:
+    kwargs: Any = dict(
+        task_type="regression", n_static_units_in=2, n_temporal_units_in=3, n_temporal_window=4, output_shape=[1]
+    )
+    eager = TimeSeriesModel(**kwargs)
+    compiled = TimeSeriesModel(**kwargs, execution_mode="compile")
+
+    expected_keys = [f"temporal_layer.{k}" for k in eager.temporal_layer.state_dict().keys()]
+    assert list(eager.state_dict().keys()) == expected_keys
+    assert list(compiled.state_dict().keys()) == expected_keys
+    compiled.load_state_dict(eager.state_dict(), strict=True)
+
+
+def test_missing_attributes_pickled_model() -> None:
+    static, temporal, observation_times, outcome = unpack_dataset(SineDataSource)
+
+    model = TimeSeriesModel(
+        task_type="regression",
+        n_static_units_in=static.shape[-1],
+        n_temporal_units_in=temporal.shape[-1],
+        n_temporal_window=temporal.shape[1],
+        output_shape=outcome.shape[1:],
+        n_iter=2,
+    )
+    model.fit(static, temporal, observation_times, outcome)
+    y_pred = model.predict(static, temporal, observation_times)
+
+    # As for a model pickled before the execution, NaN check and batching modes were added:
+    del model.__dict__["execution_mode"]
+    del model.__dict__["batching"]
+    del model.__dict__["_compiled_temporal_layer"]
+    del model.__dict__["nan_check"]
+    del model.temporal_layer.__dict__["nan_check"]
+    loaded = serialization.load(serialization.save(model))
+    assert np.allclose(loaded.predict(static, temporal, observation_times), y_pred)
+
+
+def variable_length_data(n_samples: int = 30, n_static: int = 2, n_temporal: int = 3):
+    rng = np.random.default_rng(0)
+    lengths = rng.choice([3, 5, 8, 11], size=n_samples)
+    static = rng.random((n_samples, n_static))
+    temporal = [rng.random((length, n_temporal)) for length in lengths]
+    observation_times = [np.arange(length, dtype=float) for length in lengths]
+    outcome = rng.random((n_samples, 2))
+    return static, temporal, observation_times, outcome
+
+
+@pytest.mark.parametrize("mode", ["LSTM", "Transformer", "TCN"])
+@pytest.mark.parametrize("batching", get_args(Batching))
+def test_variable_length_fit_predict(mode: TSModelMode, batching: Batching) -> None:
+    static, temporal, observation_times, outcome = variable_length_data()
+
+    model = TimeSeriesModel(
+        task_type="regression",
+        n_static_units_in=static.shape[-1],
+        n_temporal_units_in=3,
+        n_temporal_window=11,
+        output_shape=outcome.shape[1:],
+        n_iter=3,
+        mode=mode,
+        batching=batching,
+    )
+    model.fit(static, temporal, observation_times, outcome)
+
+    assert model.predict(static, temporal, observation_times).shape == outcome.shape
+
+
+def test_ragged_input() -> None:
+    dataset = SineDataSource().load()
+    static = dataset.static.numpy()
+    outcome = dataset.predictive.targets.numpy()
+    ragged = dataset.time_series.as_ragged()
+    padded = dataset.time_series.numpy()
+    observation_times = dataset.time_series.time_indexes()
+
+    model = TimeSeriesModel(
+        task_type="regression",
+        n_static_units_in=static.shape[-1],
+        n_temporal_units_in=ragged.num_features,
+        n_temporal_window=padded.shape[1],
+        output_shape=outcome.shape[1:],
+        n_iter=2,
+    )
+    model.fit(static, ragged, observation_times, outcome)
+
+    assert np.allclose(
+        model.predict(static, ragged, observation_times), model.predict(static, padded, observation_times)
+    )
+
+
+@pytest.mark.parametrize("mode", ["LSTM", "Transformer"])
+def test_padded_forward_ignores_padding(mode: TSModelMode) -> None:
+    model = TimeSeriesModel(
+        task_type="regression",
+        n_static_units_in=2,
+        n_temporal_units_in=3,
+        n_temporal_window=8,
+        output_shape=[2],
+        mode=mode,
+        window_size=2,
+        batching="padded",
+    )
+    model.eval()
+
+    static = torch.rand(1, 2)
+    temporal = torch.rand(1, 5, 3)
+    observation_times = torch.arange(5.0)[None]
+    lengths = torch.tensor([5])
+    with torch.no_grad():
+        expected = model(static, temporal, observation_times, lengths)
+        padded = model(
+            static,
+            torch.cat([temporal, torch.zeros(1, 3, 3)], dim=1),
+            torch.cat([observation_times, torch.zeros(1, 3)], dim=1),
+            lengths,
+        )
+    assert torch.allclose(padded, expected, atol=1e-5)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("mode", ["LSTM", "InceptionTime"])
+def test_execution_mode_benchmark(mode: TSModelMode) -> None:
+    # Compare the epoch time and the inference latency of the execution modes (see the log output). Not an assertion
+    # on speed, as this depends on the hardware.
+    static, temporal, observation_times, outcome = unpack_dataset(SineDataSource)
+    n_iter = 5
+
+    timings = dict()
+    for execution_mode in get_args(ExecutionMode):
+        model = TimeSeriesModel(
+            task_type="regression",
+            n_static_units_in=static.shape[-1],
+            n_temporal_units_in=temporal.shape[-1],
+            n_temporal_window=temporal.shape[1],
+            output_shape=outcome.shape[1:],
+            n_iter=n_iter,
+            mode=mode,
+            patience=n_iter,
+            execution_mode=execution_mode,
+        )
+        model.predict(static, temporal, observation_times)  # Warm up (compilation).
+
+        start = time.perf_counter()
+        model.fit(static, temporal, observation_times, outcome)
+        epoch_time = (time.perf_counter() - start) / n_iter
+
+        start = time.perf_counter()
+        y_pred = model.predict(static, temporal, observation_times)
+        latency = time.perf_counter() - start
+
+        assert y_pred.shape == outcome.shape
+        timings[execution_mode] = (epoch_time, latency)
+
+    for execution_mode, (epoch_time, latency) in timings.items():
+        log.info(f"{mode} {execution_mode}: epoch time {epoch_time:.4f}s, inference latency {latency:.4f}s")
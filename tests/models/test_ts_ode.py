@@ -6,8 +6,8 @@ import torch
 
 from tempor.datasources.prediction.one_off.plugin_google_stocks import GoogleStocksDataSource
 from tempor.datasources.prediction.one_off.plugin_sine import SineDataSource
-from tempor.models.constants import ODEBackend
-from tempor.models.ts_ode import NeuralODE
+from tempor.models.constants import Batching, ODEBackend
+from tempor.models.ts_ode import Interpolation, NeuralODE
 
 
 def unpack_dataset(source):
@@ -130,12 +130,13 @@ def test_init_inputs():
         )
 
 
-def test_forward_nans_found():
+def test_forward_nans_found_debug():
     model = NeuralODE(
         task_type="regression",
         n_static_units_in=3,
         n_temporal_units_in=3,
         output_shape=[2],
+        nan_check="debug",
     )
 
     with pytest.raises(ValueError, match=".*NaNs.*static.*"):
@@ -164,6 +165,31 @@ def test_forward_nans_found():
         )
 
 
+def test_prepare_input_nans_found():
+    model = NeuralODE(
+        task_type="regression",
+        n_static_units_in=3,
+        n_temporal_units_in=2,
+        output_shape=[2],
+    )
+    static, temporal, observation_times = np.ones((10, 3)), np.ones((10, 3, 2)), np.ones((10, 3))
+
+    # The inputs are checked once, when converted to tensors, rather than in every forward pass.
+    model.forward(
+        static_data=torch.ones(10, 3),
+        temporal_data=torch.full((10, 3, 2), torch.nan),
+        observation_times=torch.ones(10, 3),
+    )
+
+    static[0, 2] = np.nan
+    with pytest.raises(ValueError, match=".*NaNs.*static.*"):
+        model.predict(static, temporal, observation_times)
+
+    temporal[0, 2, 1] = np.nan
+    with pytest.raises(ValueError, match=".*NaNs.*temporal.*"):
+        model.fit(np.ones((10, 3)), temporal, observation_times, np.ones((10, 2)))
+
+
 def test_forward_interpolation():
     model = NeuralODE(
         task_type="regression",
@@ -246,6 +272,82 @@ def test_ode_early_stop() -> None:
     model.fit(static, temporal, observation_times, outcome)
 
 
+def variable_length_data():
+    rng = np.random.default_rng(0)
+    lengths = rng.choice([3, 4, 7], size=20)
+    static = rng.random((20, 2))
+    temporal = [rng.random((length, 3)) for length in lengths]
+    # Positive times, as the inverse Laplace transform is undefined at 0.
+    observation_times = [np.arange(1, length + 1, dtype=float) for length in lengths]
+    outcome = rng.random((20, 1))
+    return static, temporal, observation_times, outcome
+
+
+@pytest.mark.parametrize(
+    "backend, batching",
+    [
+        ("laplace", "exact_length"),
+        ("ode", "exact_length"),
+        ("ode", "padded"),
+        ("cde", "exact_length"),
+        ("cde", "padded"),
+    ],
+)
+def test_variable_length_fit_predict(backend: ODEBackend, batching: Batching) -> None:
+    static, temporal, observation_times, outcome = variable_length_data()
+
+    model = NeuralODE(
+        task_type="regression",
+        n_static_units_in=2,
+        n_temporal_units_in=3,
+        output_shape=[1],
+        n_iter=2,
+        backend=backend,
+        batching=batching,
+    )
+    model.fit(static, temporal, observation_times, outcome)
+
+    assert model.predict(static, temporal, observation_times).shape == outcome.shape
+
+
+@pytest.mark.parametrize("backend", ["ode", "cde"])
+@pytest.mark.parametrize("interpolation", ["cubic", "linear"])
+def test_padded_batching_same_predictions(backend: ODEBackend, interpolation: Interpolation) -> None:
+    static, temporal, observation_times, outcome = variable_length_data()
+
+    model = NeuralODE(
+        task_type="regression",
+        n_static_units_in=2,
+        n_temporal_units_in=3,
+        output_shape=[1],
+        n_iter=2,
+        backend=backend,
+        interpolation=interpolation,
+        atol=1e-6,
+        rtol=1e-6,
+    )
+    model.fit(static, temporal, observation_times, outcome)
+    y_pred = model.predict(static, temporal, observation_times)
+
+    # The same model, reading the solution at the end of each (padded) sequence.
+    model.batching = "padded"
+    y_pred_padded = model.predict(static, temporal, observation_times)
+
+    assert np.allclose(y_pred_padded, y_pred, atol=1e-4)
+
+
+def test_padded_batching_laplace_fail() -> None:
+    with pytest.raises(ValueError, match=".*[Pp]added.*laplace.*"):
+        NeuralODE(
+            task_type="regression",
+            n_static_units_in=2,
+            n_temporal_units_in=3,
+            output_shape=[1],
+            backend="laplace",
+            batching="padded",
+        )
+
+
 def test_check_tensor():
     t = torch.ones(size=(3, 2))
     model = NeuralODE(